@@ -327,75 +327,88 @@ def fetch_anders_brief(case_number: str, court: str) -> tuple[str | None, Path |
             'Gecko/20100101 Firefox/115.0'
         )
     }
-    try:
-        r = requests.get(case_url, headers=headers, timeout=30)
-        if r.status_code != 200:
+    # The case page and its brief PDFs are on the same host; share one
+    # keep-alive connection across them.
+    with requests.Session() as session:
+        session.headers.update(headers)
+        try:
+            r = session.get(case_url, timeout=30)
+            if r.status_code != 200:
+                return None, None
+        except Exception as e:
+            LOG.warning('fetch_anders_brief: %s', e)
             return None, None
-    except Exception as e:
-        LOG.warning('fetch_anders_brief: %s', e)
-        return None, None
 
-    soup = BeautifulSoup(r.text, 'lxml')
-    brief_grid = soup.find('div', {'id': 'ctl00_ContentPlaceHolder1_grdBriefs'})
-    if not brief_grid:
-        return None, None
-
-    for row in brief_grid.find_all('tr', class_=lambda c: c and ('rgRow' in c or 'rgAltRow' in c)):
-        # Match the Event Type column exactly. Substring matching on the whole
-        # row picks up the State's "Brief Waiver-Anders Response" rows, which
-        # share the word "Anders" but link to a different PDF.
-        tds = row.find_all('td', recursive=False)
-        if len(tds) < 2:
-            continue
-        if tds[1].get_text(strip=True).lower() != 'anders brief filed':
-            continue
+        soup = BeautifulSoup(r.text, 'lxml')
+        brief_grid = soup.find('div', {'id': 'ctl00_ContentPlaceHolder1_grdBriefs'})
+        if not brief_grid:
+            return None, None
 
-        candidates = _anders_brief_media_urls(row, base)
-        if not candidates:
+        for row in brief_grid.find_all('tr', class_=lambda c: c and ('rgRow' in c or 'rgAltRow' in c)):
+            # Match the Event Type column exactly. Substring matching on the whole
+            # row picks up the State's "Brief Waiver-Anders Response" rows, which
+            # share the word "Anders" but link to a different PDF.
+            tds = row.find_all('td', recursive=False)
+            if len(tds) < 2:
+                continue
+            if tds[1].get_text(strip=True).lower() != 'anders brief filed':
+                continue
+
+            candidates = _anders_brief_media_urls(row, base)
+            if not candidates:
+                LOG.info(
+                    '  Anders brief row for %s has no DT=Brief media '
+                    '(notice only or sealed) — treating brief as unavailable',
+                    case_number,
+                )
+                return None, None
+
+            out_dir = ROOT / 'data' / 'anders_briefs'
+            out_dir.mkdir(parents=True, exist_ok=True)
+            safe = re.sub(r'[^A-Za-z0-9._-]', '_', case_number)
+            pdf_path = out_dir / f'{safe}_anders_brief.pdf'
+            # Stage under a .part name so a rejected notice never lands at the
+            # final brief path and we never need to delete a written file.
+            part_path = out_dir / f'{safe}_anders_brief.pdf.part'
+
+            for brief_url in candidates:
+                try:
+                    # Stream straight into the .part file rather than holding
+                    # the whole brief in memory first.
+                    with session.get(brief_url, timeout=60, stream=True) as pr:
+                        if pr.status_code != 200:
+                            continue
+                        chunks = pr.iter_content(chunk_size=65536)
+                        first = next(chunks, b'')
+                        if first[:5] != b'%PDF-':
+                            continue
+                        with open(part_path, 'wb') as f:
+                            f.write(first)
+                            for chunk in chunks:
+                                f.write(chunk)
+                    if _looks_like_clerk_notice(part_path):
+                        LOG.warning(
+                            '  Downloaded PDF for %s is a clerk notice-of-filing '
+                            'letter, not an Anders brief — skipping',
+                            case_number,
+                        )
+                        # Leave .part in place for inspection; overwrite on next try.
+                        continue
+                    part_path.replace(pdf_path)
+                    LOG.info('  Downloaded Anders brief: %s', pdf_path.name)
+                    return brief_url, pdf_path
+                except Exception as e:
+                    LOG.warning('  Brief download failed: %s', e)
+
+            # Candidates existed but every download failed or was a notice.
             LOG.info(
-                '  Anders brief row for %s has no DT=Brief media '
-                '(notice only or sealed) — treating brief as unavailable',
+                '  No usable Anders brief PDF for %s after filtering notices',
                 case_number,
             )
             return None, None
 
-        out_dir = ROOT / 'data' / 'anders_briefs'
-        out_dir.mkdir(parents=True, exist_ok=True)
-        safe = re.sub(r'[^A-Za-z0-9._-]', '_', case_number)
-        pdf_path = out_dir / f'{safe}_anders_brief.pdf'
-        # Stage under a .part name so a rejected notice never lands at the
-        # final brief path and we never need to delete a written file.
-        part_path = out_dir / f'{safe}_anders_brief.pdf.part'
-
-        for brief_url in candidates:
-            try:
-                pr = requests.get(brief_url, headers=headers, timeout=60)
-                if pr.status_code != 200 or pr.content[:5] != b'%PDF-':
-                    continue
-                part_path.write_bytes(pr.content)
-                if _looks_like_clerk_notice(part_path):
-                    LOG.warning(
-                        '  Downloaded PDF for %s is a clerk notice-of-filing '
-                        'letter, not an Anders brief — skipping',
-                        case_number,
-                    )
-                    # Leave .part in place for inspection; overwrite on next try.
-                    continue
-                part_path.replace(pdf_path)
-                LOG.info('  Downloaded Anders brief: %s', pdf_path.name)
-                return brief_url, pdf_path
-            except Exception as e:
-                LOG.warning('  Brief download failed: %s', e)
-
-        # Candidates existed but every download failed or was a notice.
-        LOG.info(
-            '  No usable Anders brief PDF for %s after filtering notices',
-            case_number,
-        )
         return None, None
 
-    return None, None
-
 
 # ── Claude calls ──────────────────────────────────────────────────────────────
 
@@ -194,17 +194,31 @@ def download_brief(url: str, case_number: str, date: str,
         return path
     if safe_tag == "defense" and legacy.exists() and legacy.stat().st_size > 0:
         return legacy
+    # Stream to a .part file so a large brief is never held in memory whole
+    # and an interrupted download never looks like a cached PDF.
+    part = path.with_name(path.name + ".part")
     try:
-        resp = sess.get(url, headers=UA, timeout=120)
-        resp.raise_for_status()
-        if not resp.content.startswith(b"%PDF"):
-            logger.warning("Brief harvest: %s did not return a PDF", url)
-            return None
-        path.write_bytes(resp.content)
+        with sess.get(url, headers=UA, timeout=120, stream=True) as resp:
+            resp.raise_for_status()
+            chunks = resp.iter_content(chunk_size=65536)
+            first = next(chunks, b"")
+            if not first.startswith(b"%PDF"):
+                logger.warning("Brief harvest: %s did not return a PDF", url)
+                return None
+            with open(part, "wb") as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+        part.replace(path)
         return path
     except requests.RequestException as e:
+        # Includes ChunkedEncodingError raised mid-stream by iter_content
         logger.warning("Brief harvest: download failed for %s (%s)", url, e)
         return None
+    finally:
+        # Gone already once replaced; otherwise (request error, write
+        # OSError, non-PDF) never leave a stale .part behind
+        part.unlink(missing_ok=True)
 
 
 def pdf_to_text(pdf_path: Path) -> str:
@@ -313,21 +327,25 @@ def harvest_contacts(text: str, defense_reps: list[str]) -> list[dict]:
     return list(contacts.values())
 
 
+def _create_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lawyer_contacts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            bar_number TEXT,
+            email TEXT NOT NULL,
+            source TEXT,
+            first_seen TEXT DEFAULT (date('now','localtime')),
+            last_seen TEXT DEFAULT (date('now','localtime')),
+            UNIQUE(name COLLATE NOCASE, email COLLATE NOCASE)
+        )
+    """)
+
+
 def ensure_table(db_path: str) -> None:
     conn = sqlite3.connect(db_path)
     try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS lawyer_contacts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                bar_number TEXT,
-                email TEXT NOT NULL,
-                source TEXT,
-                first_seen TEXT DEFAULT (date('now','localtime')),
-                last_seen TEXT DEFAULT (date('now','localtime')),
-                UNIQUE(name COLLATE NOCASE, email COLLATE NOCASE)
-            )
-        """)
+        _create_table(conn)
         conn.commit()
     finally:
         conn.close()
@@ -337,10 +355,12 @@ def upsert_contacts(db_path: str, contacts: list[dict], source: str) -> int:
     """Insert or refresh contacts; returns how many were new."""
     if not contacts:
         return 0
-    ensure_table(db_path)
+    # Create the table on the same connection as the upsert instead of
+    # opening a second one just for the DDL.
     conn = sqlite3.connect(db_path)
     new = 0
     try:
+        _create_table(conn)
         cur = conn.cursor()
         for c in contacts:
             cur.execute(
@@ -5,71 +5,252 @@ Check scraper status and progress
 
 import json
 import os
+import sys
 import csv
+import heapq
+import hashlib
 from datetime import datetime
 from collections import defaultdict
 
+try:
+    # orjson parses the status file several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+LOG_COLUMNS = ('court', 'date', 'criminal_cases_found', 'files_downloaded')
+# Per-row counts are almost always small; look them up instead of calling int()
+SMALL_INTS = {str(i): i for i in range(1024)}
+COUNTER_NAMES = ('court_total', 'court_with_cases', 'court_files', 'date_total', 'date_with_cases', 'date_files')
+# Leading bytes hashed to recognise the same log on the next run
+FINGERPRINT_BYTES = 4096
+
+CACHE_INT_KEYS = ('mtime_ns', 'size', 'offset', 'fingerprint_len')
+
+def load_log_cache(cache_path):
+    """Load the aggregation cache written by a previous run, if any.
+    
+    Anything that isn't a complete cache in the current layout (written by
+    an older version, hand-edited, truncated) is ignored, which only costs
+    a full re-parse.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict):
+        return None
+    if not all(isinstance(cache.get(key), int) for key in CACHE_INT_KEYS):
+        return None
+    if not isinstance(cache.get('path'), str) or not isinstance(cache.get('fingerprint'), str):
+        return None
+    columns = cache.get('columns')
+    if not (isinstance(columns, list) and len(columns) == len(LOG_COLUMNS)
+            and all(isinstance(i, int) for i in columns)):
+        return None
+    counters = cache.get('counters')
+    if not (isinstance(counters, dict) and all(isinstance(counters.get(name), dict) for name in COUNTER_NAMES)):
+        return None
+    return cache
+
+def save_log_cache(cache_path, cache):
+    """Persist the aggregation cache; failures only cost a re-parse next run"""
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: could not write log cache {cache_path}: {e}", file=sys.stderr)
+
+def log_fingerprint(raw, length):
+    """Hash the first length bytes of an open log"""
+    raw.seek(0)
+    return hashlib.sha1(raw.read(length)).hexdigest()
+
+def aggregate_log(path, cache_path=None):
+    """Aggregate scrape log rows by court and by date in a single pass.
+    
+    Rows are streamed from the file one at a time, so memory stays bounded
+    by the number of distinct courts and dates rather than the log length.
+    
+    Totals are cached next to the log keyed on its mtime and size. The
+    scraper only ever appends to the log, so when it has grown since the
+    last run only the rows past the cached byte offset are parsed. A
+    partially written final row is left for the next run. The cache also
+    holds a hash of the log's leading bytes, so a log that was truncated
+    or rotated and has since grown past the old offset is re-read from
+    the start instead of being replayed from mid-file.
+    """
+    if cache_path is None:
+        cache_path = os.path.splitext(path)[0] + '.agg.cache'
+    
+    st = os.stat(path)
+    cache = load_log_cache(cache_path)
+    if cache and cache.get('path') != os.path.abspath(path):
+        cache = None
+    
+    if cache and cache['mtime_ns'] == st.st_mtime_ns and cache['size'] == st.st_size:
+        counters = cache['counters']
+    else:
+        with open(path, 'rb', buffering=1 << 20) as raw:
+            if (cache and st.st_size >= cache['offset']
+                    and cache['fingerprint'] == log_fingerprint(raw, cache['fingerprint_len'])):
+                # Log was appended to - replay only the new rows
+                counters = {name: defaultdict(int, cache['counters'][name]) for name in COUNTER_NAMES}
+                offset = cache['offset']
+                columns = cache['columns']
+            else:
+                counters = {name: defaultdict(int) for name in COUNTER_NAMES}
+                offset = 0
+                columns = None
+            
+            court_total, court_with_cases, court_files = (
+                counters['court_total'], counters['court_with_cases'], counters['court_files'])
+            date_total, date_with_cases, date_files = (
+                counters['date_total'], counters['date_with_cases'], counters['date_files'])
+            
+            raw.seek(offset)
+            consumed = [offset]
+            exhausted = [False]
+            
+            def complete_lines():
+                # Stop at a trailing line the scraper is still writing
+                for line in raw:
+                    if not line.endswith(b'\n'):
+                        break
+                    consumed[0] += len(line)
+                    yield line.decode('utf-8')
+                exhausted[0] = True
+            
+            # strict makes the reader raise on a quoted field (one with an
+            # embedded newline) that is cut off at the end of the input,
+            # instead of handing back the partial record as a row
+            reader = csv.reader(complete_lines(), strict=True)
+            small_ints = SMALL_INTS
+            
+            try:
+                if columns is None:
+                    header = next(reader, None)
+                    if header is None:
+                        return {}, {}
+                    columns = [header.index(name) for name in LOG_COLUMNS]
+                    offset = consumed[0]
+                court_idx, date_idx, cases_idx, files_idx = columns
+                
+                for row in reader:
+                    if not row:
+                        # Blank line (DictReader skipped these); step past it
+                        offset = consumed[0]
+                        continue
+                    court = row[court_idx]
+                    date = row[date_idx]
+                    cases = small_ints.get(row[cases_idx])
+                    if cases is None:
+                        cases = int(row[cases_idx])
+                    files = small_ints.get(row[files_idx])
+                    if files is None:
+                        files = int(row[files_idx])
+                    
+                    court_total[court] += 1
+                    court_files[court] += files
+                    date_total[date] += 1
+                    date_files[date] += files
+                    if cases > 0:
+                        court_with_cases[court] += 1
+                        date_with_cases[date] += 1
+                    # Only advanced once the reader has returned a whole
+                    # record, so the saved offset lands on a record boundary
+                    offset = consumed[0]
+            except csv.Error:
+                if not exhausted[0]:
+                    raise
+                # The last record is still being written; leave it (and
+                # the offset before it) for the next run
+                if columns is None:
+                    return {}, {}
+            
+            fingerprint_len = min(FINGERPRINT_BYTES, offset)
+            fingerprint = log_fingerprint(raw, fingerprint_len)
+        
+        save_log_cache(cache_path, {
+            'path': os.path.abspath(path),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'offset': offset,
+            'columns': columns,
+            'fingerprint': fingerprint,
+            'fingerprint_len': fingerprint_len,
+            'counters': counters,
+        })
+    
+    court_with_cases, court_files = counters['court_with_cases'], counters['court_files']
+    date_with_cases, date_files = counters['date_with_cases'], counters['date_files']
+    court_stats = {court: {'total': total, 'with_cases': court_with_cases.get(court, 0), 'files': court_files.get(court, 0)}
+                   for court, total in counters['court_total'].items()}
+    date_stats = {date: {'total': total, 'with_cases': date_with_cases.get(date, 0), 'files': date_files.get(date, 0)}
+                  for date, total in counters['date_total'].items()}
+    return court_stats, date_stats
+
 def check_status():
     """Check and display scraper status"""
+    out = []
     
     # Check status file
-    if os.path.exists('scraper_status.json'):
-        with open('scraper_status.json', 'r') as f:
-            status = json.load(f)
+    try:
+        with open('scraper_status.json', 'rb') as f:
+            raw_status = f.read()
+    except FileNotFoundError:
+        raw_status = None
+    
+    if raw_status is not None:
+        status = json_loads(raw_status)
         
-        print("=== SCRAPER STATUS ===")
-        print(f"Start time: {status.get('start_time', 'Not started')}")
-        print(f"Last completed: {status.get('last_completed_date', 'None')} COA{status.get('last_completed_court', 0):02d}")
-        print(f"Total requests: {status.get('total_requests', 0)}")
-        print(f"Total files downloaded: {status.get('total_files_downloaded', 0)}")
-        print(f"Completed combinations: {len(status.get('completed_combinations', []))}")
+        out.append("=== SCRAPER STATUS ===")
+        out.append(f"Start time: {status.get('start_time', 'Not started')}")
+        out.append(f"Last completed: {status.get('last_completed_date', 'None')} COA{status.get('last_completed_court', 0):02d}")
+        out.append(f"Total requests: {status.get('total_requests', 0)}")
+        out.append(f"Total files downloaded: {status.get('total_files_downloaded', 0)}")
+        completed = status.get('completed_combinations_count')
+        if completed is None:
+            # Status files written before the counter was added
+            completed = len(status.get('completed_combinations', []))
+        out.append(f"Completed combinations: {completed}")
     else:
-        print("No status file found - scraper hasn't started yet")
+        out.append("No status file found - scraper hasn't started yet")
     
     # Check log file for patterns
-    if os.path.exists('scrape_log.csv'):
-        print("\n=== LOG ANALYSIS ===")
-        
-        court_stats = defaultdict(lambda: {'total': 0, 'with_cases': 0, 'files': 0})
-        date_stats = defaultdict(lambda: {'total': 0, 'with_cases': 0, 'files': 0})
-        
-        with open('scrape_log.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                court = row['court']
-                date = row['date']
-                cases = int(row['criminal_cases_found'])
-                files = int(row['files_downloaded'])
-                
-                court_stats[court]['total'] += 1
-                court_stats[court]['files'] += files
-                if cases > 0:
-                    court_stats[court]['with_cases'] += 1
-                
-                date_stats[date]['total'] += 1
-                date_stats[date]['files'] += files
-                if cases > 0:
-                    date_stats[date]['with_cases'] += 1
+    try:
+        court_stats, date_stats = aggregate_log('scrape_log.csv')
+    except FileNotFoundError:
+        court_stats = date_stats = None
+    
+    if court_stats is not None:
+        out.append("\n=== LOG ANALYSIS ===")
         
-        print(f"Courts processed: {len(court_stats)}")
-        print(f"Dates processed: {len(date_stats)}")
+        out.append(f"Courts processed: {len(court_stats)}")
+        out.append(f"Dates processed: {len(date_stats)}")
         
         # Show court summary
-        print("\n=== BY COURT ===")
+        out.append("\n=== BY COURT ===")
         for court in sorted(court_stats.keys()):
             stats = court_stats[court]
-            print(f"{court}: {stats['with_cases']}/{stats['total']} dates with cases, {stats['files']} files")
+            out.append(f"{court}: {stats['with_cases']}/{stats['total']} dates with cases, {stats['files']} files")
         
         # Show recent dates with opinions
-        print("\n=== RECENT DATES WITH CRIMINAL OPINIONS ===")
-        dates_with_cases = [(date, stats) for date, stats in date_stats.items() if stats['with_cases'] > 0]
-        dates_with_cases.sort(key=lambda x: x[0], reverse=True)
+        out.append("\n=== RECENT DATES WITH CRIMINAL OPINIONS ===")
+        recent_dates = heapq.nlargest(
+            10,  # Last 10 dates with cases
+            ((date, stats) for date, stats in date_stats.items() if stats['with_cases'] > 0),
+            key=lambda x: x[0]  # scraper logs ISO YYYY-MM-DD, which sorts as a string
+        )
         
-        for date, stats in dates_with_cases[:10]:  # Last 10 dates with cases
-            print(f"{date}: {stats['with_cases']}/{stats['total']} courts had cases, {stats['files']} files")
+        for date, stats in recent_dates:
+            out.append(f"{date}: {stats['with_cases']}/{stats['total']} courts had cases, {stats['files']} files")
     
     else:
-        print("No log file found")
+        out.append("No log file found")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     check_status() 
\ No newline at end of file
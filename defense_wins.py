@@ -69,10 +69,18 @@ def _is_state_style(style: str) -> bool:
     return s.startswith("state") or s.startswith("the state")
 
 
-def scrape_docket_wins(coa_num: int, date) -> list[dict]:
-    """Return defense-win rows from one COA's docket page for one date."""
+def scrape_docket_wins(coa_num: int, date,
+                       session: requests.Session | None = None) -> list[dict]:
+    """Return defense-win rows from one COA's docket page for one date.
+
+    Pass a shared `session` when fetching many dockets so the connection
+    to search.txcourts.gov is kept alive between pages.
+    """
     url = f"{BASE_URL}Docket.aspx?coa=coa{coa_num:02d}&FullDate={date.strftime('%m/%d/%Y')}"
-    resp = requests.get(url, headers=UA, timeout=60)
+    if session is None:
+        resp = requests.get(url, headers=UA, timeout=60)
+    else:
+        resp = session.get(url, timeout=60)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -136,19 +144,25 @@ def collect_defense_wins(lookback_days: int = 5,
     dates = [today - timedelta(days=i) for i in range(lookback_days + 1)]
     dates = [d for d in dates if d.weekday() != 6]  # no Sunday hand-downs
 
+    # One keep-alive session for the whole scan: every docket is on the
+    # same host, so this skips a TCP + TLS handshake per page.
+    session = requests.Session()
+    session.headers.update(UA)
+
     new_wins: list[dict] = []
-    for date in dates:
-        for coa_num in COA_NUMBERS:
-            try:
-                rows = scrape_docket_wins(coa_num, date)
-            except requests.RequestException as e:
-                logger.warning("Defense wins: COA%02d %s fetch failed (%s)", coa_num, date, e)
-                continue
-            for win in rows:
-                key = f"{win['date']}:{win['case_number']}"
-                if key not in state["reported"]:
-                    new_wins.append(win)
-            time.sleep(0.2)
+    with session:
+        for date in dates:
+            for coa_num in COA_NUMBERS:
+                try:
+                    rows = scrape_docket_wins(coa_num, date, session=session)
+                except requests.RequestException as e:
+                    logger.warning("Defense wins: COA%02d %s fetch failed (%s)", coa_num, date, e)
+                    continue
+                for win in rows:
+                    key = f"{win['date']}:{win['case_number']}"
+                    if key not in state["reported"]:
+                        new_wins.append(win)
+                time.sleep(0.2)
 
     new_wins.sort(key=lambda w: (w["date"], w["court"], w["case_number"]), reverse=True)
     logger.info("Defense wins: %d new win(s) in the last %d days", len(new_wins), lookback_days)
@@ -9,6 +9,7 @@ Runs Tuesday-Saturday at 12:01 AM to collect opinions from the previous day.
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import os
 import shutil
 import re
@@ -20,18 +21,33 @@ import sqlite3
 import smtplib
 import imaplib
 import email
+import select
+import ssl
 import hashlib
-from contextlib import contextmanager
-from datetime import datetime, timedelta
+import functools
+import io
+import atexit
+import threading
+import queue
+import multiprocessing
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin, quote
 from pathlib import Path
 from PyPDF2 import PdfReader, PdfWriter
+try:
+    import fitz  # PyMuPDF: C-backed text extraction, much faster than PyPDF2
+except ImportError:
+    fitz = None
 from dotenv import load_dotenv
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 from email.utils import parsedate_to_datetime
+from email.policy import compat32
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -50,6 +66,165 @@ import brief_harvest  # noqa: E402  -- local sibling module
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_CASE_URL_BASE = "https://search.txcourts.gov/Case.aspx"
+# Zero-padded court numbers keyed by court name, e.g. "COA01" -> "01"
+_COURT_CODES = {f"COA{n:02d}": f"{n:02d}" for n in range(1, 15)}
+
+# Patterns used while walking TAMES docket and case pages, compiled once
+_CR_CASE_NUMBER_RE = re.compile(r'\d{2}-\d{2}-\d{5}-CR')
+_CASE_NUMBER_PARTS_RE = re.compile(r'^(\d{2})-(\d{2})-\d{5}')
+_CASE_LINK_HREF_RE = re.compile(r'Case\.aspx\?cn=.*-CR')
+_SEARCH_MEDIA_HREF_RE = re.compile(r'SearchMedia\.aspx')
+_PARTIES_RE = re.compile(r'Parties')
+
+# Justice-name lookups for get_abbreviation_and_justice(), run against the
+# lower-cased opinion description. The first two back the disposition
+# override, where "concurring"/"dissenting" may be missing from the
+# description itself.
+_CONCURRING_BY_JUSTICE_RE = re.compile(r'(?:concurring )?opinion by (?:chief )?justice (\w+)')
+_DISSENTING_BY_JUSTICE_RE = re.compile(r'(?:dissenting )?opinion by (?:chief )?justice (\w+)')
+_CONCUR_OPINION_BY_JUSTICE_RE = re.compile(r'concurring opinion by (?:chief )?justice (\w+)')
+_DISSENT_OPINION_BY_JUSTICE_RE = re.compile(r'dissenting opinion by (?:chief )?justice (\w+)')
+
+def _class_test(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Docket-page lookups, evaluated directly on the lxml tree
+_CRIMINAL_CAUSES_TABLE_XPATH = etree.XPath(
+    f"(//h3[contains(., 'Criminal Causes Decided')])[1]"
+    f"/following::table[{_class_test('rgMasterTable')}][1]"
+)
+_CASE_ROWS_XPATH = etree.XPath(f".//tr[{_class_test('rgRow')} or {_class_test('rgAltRow')}]")
+_CASE_DISP_XPATH = etree.XPath(f"(.//td[{_class_test('caseDisp')}])[1]")
+_THIRD_TD_XPATH = etree.XPath("(.//td)[3]")
+_DOC_GRID_XPATH = etree.XPath(f".//table[{_class_test('docGrid')}]")
+_COURT_NUMBER_RE = re.compile(r'(\d+)')
+# Most court-days have no criminal section; finding that out from the raw
+# bytes is a single memchr-style scan instead of a full parse
+_CRIMINAL_CAUSES_HEADING = b'Criminal Causes Decided'
+# Unrendered server-side template some PDF links carry in place of the court
+_COURT_TEMPLATE_MARKER = '" + this.CurrentWebState.CurrentCourt + @"'
+
+# Markers looked for in Claude's analysis text. Case-insensitive searches
+# avoid lower-casing the whole (often multi-KB) analysis just to test it.
+_NO_INTERESTING_ISSUES_RE = re.compile(r'no interesting issues', re.I)
+_EXECUTION_ERROR_RE = re.compile(r'execution error', re.I)
+_HEADLINE_MARKER_RES = (
+    re.compile(r'▪\s*Headline:'),
+    re.compile(r'\*\*Headline:\*\*'),
+)
+_ISSUE_MARKER_RES = (
+    re.compile(r'▪\s*Issue Description:'),
+    re.compile(r'\*\*Issue Description:\*\*'),
+    re.compile(r'\*\*Issue \d+:'),
+    re.compile(r'Issue \d+:'),
+) + _HEADLINE_MARKER_RES
+
+def _extract_pdf_text(file_path, max_chars=None):
+    """Extract a PDF's text; see PDRBot.extract_text_from_pdf. Module-level
+    so it can be sent to a ProcessPoolExecutor."""
+    chunks = []
+    total_len = 0
+    if fitz is not None:
+        with fitz.open(file_path) as doc:
+            for page in doc:
+                page_text = page.get_text("text")
+                chunks.append(page_text)
+                total_len += len(page_text) + 1
+                if max_chars is not None and total_len >= max_chars:
+                    break
+    else:
+        with open(file_path, 'rb') as file:
+            pdf_reader = PdfReader(file)
+            for page in pdf_reader.pages:
+                page_text = page.extract_text()
+                chunks.append(page_text)
+                total_len += len(page_text) + 1
+                if max_chars is not None and total_len >= max_chars:
+                    break
+    text = "\n".join(chunks).strip()
+    return text[:max_chars] if max_chars is not None else text
+
+# Intro phrases and first-person commentary stripped by clean_analysis_text(),
+# applied in order. These capture various ways Claude might introduce the analysis.
+_ANALYSIS_INTRO_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in [
+    # "I'll/I will/Let me analyze..." patterns
+    r"^I'll analyze this.*?(?:\n|\.)\s*\n*",
+    r"^Let me analyze this.*?(?:\n|\.)\s*\n*",
+    r"^I will analyze this.*?(?:\n|\.)\s*\n*",
+    r"^I must analyze this.*?(?:\n|\.)\s*\n*",
+    r"^Analyzing this.*?(?:\n|\.)\s*\n*",
+
+    # "Looking at this..." patterns (single and multi-line)
+    r"^Looking at this.*?(?:\n\n|\*\*)",
+
+    # "I need to/I must examine/check..." patterns
+    r"^I need to (?:examine|check|analyze).*?(?:\n|\.)\s*\n*",
+    r"^I must (?:examine|check|analyze).*?(?:\n|\.)\s*\n*",
+
+    # "I find..." patterns at the beginning
+    r"^I find (?:no interesting issues|that this).*?(?:\n|\.)\s*\n*",
+    r"^I do not find.*?(?:\n|\.)\s*\n*",
+
+    # Meta-commentary about language requirements/compliance
+    r"^CRITICAL LANGUAGE REQUIREMENT.*?(?=TERSE REPORT|Appellant Name|\Z)",
+    r"^I have reviewed the forbidden words.*?(?:\n|\.)\s*\n*",
+    r"^.*compliance checklist.*?(?:\n\n|\Z)",
+    r"^.*COMPLIANCE CHECKLIST.*?(?:\n\n|\Z)",
+    r"^Every sentence will use only approved.*?(?:\n|\.)\s*\n*",
+])
+
+# Markdown cleanup applied to analyses before they go into ReportLab paragraphs
+_MD_HEADER_RE = re.compile(r'^#+\s*', re.MULTILINE)
+_PRIORITY_BULLET_RE = re.compile(r'\*\*▪ Priority Level:\*\*[^\n]*\n?')
+_PRIORITY_RE = re.compile(r'\*\*Priority Level:\*\*[^\n]*\n?')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MD_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_MD_ITALIC_RE = re.compile(r'(?<!\*)\*([^*]+?)\*(?!\*)')
+
+# A subscription request body starts with "subscribe" or "unsubscribe" (any
+# case, after leading whitespace); group 1 is set for unsubscribe
+_SUBSCRIPTION_KEYWORD_RE = re.compile(r'\s*(un)?subscribe', re.IGNORECASE)
+
+# Report emails are flattened to bytes once and sent as-is, so they need
+# CRLF line endings (sendmail only fixes those up for str messages). The
+# placeholder To is swapped for each recipient in the flattened bytes.
+_SMTP_WIRE_POLICY = compat32.clone(linesep='\r\n')
+_RECIPIENT_PLACEHOLDER = 'recipient@pdrbot.invalid'
+# RFC 2177 asks clients to re-issue IDLE at least every 29 minutes
+_IMAP_IDLE_TIMEOUT = 29 * 60
+_IMAP_RECONNECT_DELAY = 30
+_IMAP_EXISTS_RE = re.compile(rb'\* \d+ EXISTS\r?$', re.IGNORECASE)
+
+# Bump when PDRBot._migrate() gains a step
+SCHEMA_VERSION = 4
+
+# daily_runs statuses find_incomplete_runs() treats as resumable. Shared with
+# the partial index so the planner can match the two WHERE clauses.
+_INCOMPLETE_RUN_FILTER = "status IN ('running', 'scraping', 'analyzing', 'reporting')"
+
+# daily_runs columns update_run_state() can set, in its argument order
+_RUN_STATE_COLUMNS = ('status', 'total_courts_checked', 'total_cases_found',
+                      'total_files_downloaded', 'error_message')
+
+
+@functools.lru_cache(maxsize=None)
+def _run_state_update_sql(columns):
+    """UPDATE statement for one combination of daily_runs columns.
+
+    Only a handful of combinations are ever used, and returning the same
+    string each time keeps sqlite3's per-connection statement cache hitting
+    instead of re-preparing the UPDATE.
+    """
+    assignments = ", ".join(f"{col} = ?" for col in columns)
+    return f"UPDATE daily_runs SET {assignments} WHERE id = ?"
+
+
+# Row shape returned by get_unanalyzed_opinions(); still unpacks like the
+# plain tuples callers used before
+UnanalyzedOpinion = namedtuple('UnanalyzedOpinion', 'id case_number court opinion_date file_path')
+
 
 
 ANALYSIS_JSON_SCHEMA = {
@@ -118,6 +293,61 @@ ANALYSIS_JSON_SCHEMA = {
 }
 
 
+# Static instructions for the Haiku triage pass. Kept at module level so the
+# prompt prefix is built once and is byte-identical across opinions, which
+# lets the model's prompt cache reuse it.
+HAIKU_TRIAGE_PROMPT = (
+    "You are the first pass of a two-stage triage for a Texas "
+    "criminal-defense appellate practice. Cases you mark INTERESTING "
+    "go to a more capable model (Opus) for full analysis; cases you "
+    "mark ROUTINE are not analyzed further. Your only job is to "
+    "filter out truly cookie-cutter dispositions — the deeper model "
+    "is the authoritative judge of what is PDR-worthy.\n\n"
+    "Reply with exactly one line.\n\n"
+    "Default to INTERESTING. Mark ROUTINE only when the opinion is "
+    "truly cookie-cutter — a boilerplate disposition that could have "
+    "been written from a template, with no contested legal question, "
+    "no debatable application of law to fact, no concurrence or "
+    "dissent, and no discussion beyond reciting settled doctrine and "
+    "applying it to overwhelming or uncontested facts.\n\n"
+    "Cookie-cutter patterns (non-exhaustive):\n"
+    "- Anders affirmance with no arguable grounds and no "
+    "fine/cost/restitution issue\n"
+    "- Jurisdictional dismissal for untimely notice of appeal, no "
+    "tolling argument\n"
+    "- Habeas dismissed for failure to comply with statutory "
+    "prerequisites, no merits discussion\n"
+    "- Mandamus denied solely on want of presentment or want of "
+    "clear right, no contested record\n"
+    "- Frivolous-appeal dismissal with no preserved issues briefed\n"
+    "- Plea-bargain waiver dismissal under Rule 25.2(a)(2) with no "
+    "certification dispute\n\n"
+    "Anything else is INTERESTING — including any concurrence or "
+    "dissent, any sufficiency or burden-of-proof challenge against "
+    "non-overwhelming facts, any case where the court engages with a "
+    "doctrinal question even briefly, any case where the court "
+    "relies on cited authority to defeat a non-frivolous argument, "
+    "and any case decided on a close or contested record.\n\n"
+    "Always escalate when you see explicit textual signals like:\n"
+    "- the opinion itself flags an unresolved or unsettled question "
+    "('has not determined,' 'has not addressed,' 'we have not "
+    "found,' 'no controlling authority,' 'unsettled,' 'open "
+    "question,' or a Pattern Jury Charges committee note flagging "
+    "a gap)\n"
+    "- the court relies on pre-2000 Court of Criminal Appeals "
+    "authority for a contested point\n"
+    "- the court acknowledges or describes a split among Texas "
+    "courts of appeals (even where it picks a side)\n"
+    "- a concurrence or dissent rejects the majority's framework\n\n"
+    "A false ROUTINE loses a PDR-worthy case; a false INTERESTING "
+    "costs only one extra Opus call. When in doubt, escalate.\n\n"
+    "Your entire reply must be a single line, exactly one of:\n"
+    "- 'INTERESTING.'  (no justification — Opus will analyze)\n"
+    "- 'ROUTINE: <one-sentence reason>'"
+)
+HAIKU_TRIAGE_PREFIX = f"{HAIKU_TRIAGE_PROMPT}\n\n--- OPINION TEXT ---\n"
+
+
 def _is_defense_win(disposition, state_is_appellant):
     """Defense wins when the State appealed and lost (affirmance), or
     when the defense appealed and won (any flavor of reversal/vacatur).
@@ -220,11 +450,33 @@ class PDRBot:
         
         # Load analysis prompt
         self.analysis_prompt = self.load_analysis_prompt()
+        # Built once so every opinion's prompt shares an identical prefix
+        self.analysis_prompt_prefix = f"{self.analysis_prompt}\n\n--- OPINION TEXT ---\n"
         
         # Configuration from environment
         self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '30'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
         self.download_delay = int(os.getenv('DOWNLOAD_DELAY', '1'))
+        self.fetch_workers = int(os.getenv('FETCH_WORKERS', '4'))
+        self.court_delay = int(os.getenv('COURT_DELAY', '2'))
+        self.court_workers = int(os.getenv('COURT_WORKERS', '4'))
+        self.analysis_workers = int(os.getenv('ANALYSIS_WORKERS', '3'))
+        
+        # Size the keep-alive pool for the concurrent fetches so worker
+        # threads reuse connections instead of opening and discarding
+        # extras. Retries stay in get_with_retry/download_pdf.
+        pool_size = max(self.court_workers * self.fetch_workers, self.analysis_workers, 10)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Shared by scraping threads so docket fetches stay court_delay
+        # apart and PDF requests download_delay apart. Case-page
+        # (representatives) fetches are made one at a time by whichever
+        # thread stores analyses, and the 'case' kind keeps their starts at
+        # least a second apart
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = {'docket': 0.0, 'download': 0.0, 'case': 0.0}
         
         # Email configuration
         self.email_enabled = os.getenv('EMAIL_ENABLED', 'false').lower() == 'true'
@@ -233,6 +485,9 @@ class PDRBot:
         self.email_from = os.getenv('EMAIL_FROM')
         self.email_auth_user = os.getenv('EMAIL_AUTH_USER', self.email_from)  # Default to FROM if not specified
         self.email_password = os.getenv('EMAIL_PASSWORD')
+        # Parallel SMTP connections for the daily report; kept low because
+        # providers throttle concurrent logins per account
+        self.email_workers = max(1, int(os.getenv('EMAIL_WORKERS', '3')))
         # Support multiple email recipients (comma-separated)
         email_to_raw = os.getenv('EMAIL_TO')
         if email_to_raw:
@@ -248,125 +503,229 @@ class PDRBot:
         self.subscription_imap_host = os.getenv('SUBSCRIPTION_IMAP_HOST', 'imap.fastmail.com')
         self.subscription_imap_port = int(os.getenv('SUBSCRIPTION_IMAP_PORT', '993'))
         self.members_file = os.getenv('MEMBERS_FILE', 'data/members.json')
+        # Set by batched_member_updates() while member writes are deferred
+        self._members_batch = None
+        self._members_batch_dirty = False
+        # (mtime_ns, size, members) of the last members file read or written
+        self._members_cache = None
+        # action -> flattened confirmation email with _RECIPIENT_PLACEHOLDER in To:
+        self._confirmation_wire = {}
         self.last_check_file = os.getenv('LAST_CHECK_FILE', 'data/last_subscription_check.txt')
         
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
         
         # Initialize database
+        self._conn = None
+        self._pending_analyses = []
+        self._pdf_styles = None
         self.init_database()
+        atexit.register(self.close)
     
+    def _connect(self):
+        """Return the bot's long-lived database connection, opening it with
+        the per-connection pragmas on first use. WAL mode itself is
+        persistent and is set once in init_database().
+
+        Callers hand the connection back with _release() rather than
+        closing it, so the schema, page cache and statement cache stay warm
+        for the whole run."""
+        if self._conn is None:
+            # andersproject/brief_harvest write to the same file; wait up to
+            # 30s for their locks instead of the default 5s
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._conn = conn
+        return self._conn
+
+    def _release(self, conn):
+        """Finish with a connection from _connect(). Work the caller did not
+        commit is rolled back, exactly as closing a private connection used
+        to discard it."""
+        if conn.in_transaction:
+            conn.rollback()
+
+    def close(self):
+        """Close the shared database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def init_database(self):
         """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
+        # WAL lets the report/triage scripts read while the bot writes, and
+        # with synchronous=NORMAL a commit no longer waits on a full fsync
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            # e.g. the database lives on a filesystem without shared memory
+            logger.warning(f"SQLite refused WAL mode; journal_mode is {journal_mode}")
+        self._migrate(conn)
+        # Refresh planner statistics when they are stale so the new indexes get used
+        conn.execute("PRAGMA optimize")
+        self._release(conn)
+    
+    def _migrate(self, conn):
+        """Bring the schema up to SCHEMA_VERSION, tracked in PRAGMA user_version
+
+        An up-to-date database costs a single PRAGMA read at startup.
+        Databases created before versioning report 0 and replay every step;
+        each step is safe to run against tables that already exist.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
         cursor = conn.cursor()
         
-        # Create opinions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS opinions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                case_number TEXT NOT NULL,
-                court TEXT NOT NULL,
-                opinion_date DATE NOT NULL,
-                opinion_type TEXT NOT NULL,
-                justice_name TEXT,
-                filename TEXT NOT NULL,
-                file_path TEXT NOT NULL,
-                case_url TEXT NOT NULL,
-                pdf_url TEXT,
-                download_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                UNIQUE(case_number, opinion_type, justice_name)
-            )
-        ''')
+        if version < 1:
+            # Create opinions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS opinions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    case_number TEXT NOT NULL,
+                    court TEXT NOT NULL,
+                    opinion_date DATE NOT NULL,
+                    opinion_type TEXT NOT NULL,
+                    justice_name TEXT,
+                    filename TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    case_url TEXT NOT NULL,
+                    pdf_url TEXT,
+                    download_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                    UNIQUE(case_number, opinion_type, justice_name)
+                )
+            ''')
         
-        # Create daily_runs table to track execution
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_date DATE NOT NULL,
-                target_date DATE NOT NULL,
-                total_courts_checked INTEGER DEFAULT 0,
-                total_cases_found INTEGER DEFAULT 0,
-                total_files_downloaded INTEGER DEFAULT 0,
-                run_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                status TEXT DEFAULT 'running',
-                error_message TEXT
-            )
-        ''')
+            # Create daily_runs table to track execution
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS daily_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_date DATE NOT NULL,
+                    target_date DATE NOT NULL,
+                    total_courts_checked INTEGER DEFAULT 0,
+                    total_cases_found INTEGER DEFAULT 0,
+                    total_files_downloaded INTEGER DEFAULT 0,
+                    run_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                    status TEXT DEFAULT 'running',
+                    error_message TEXT
+                )
+            ''')
         
-        # Create court_rollover table to track courts with no opinions for next day checking
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS court_rollover (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                court_number INTEGER NOT NULL,
-                original_date DATE NOT NULL,
-                created_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                UNIQUE(court_number, original_date)
-            )
-        ''')
+            # Create court_rollover table to track courts with no opinions for next day checking
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS court_rollover (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    court_number INTEGER NOT NULL,
+                    original_date DATE NOT NULL,
+                    created_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                    UNIQUE(court_number, original_date)
+                )
+            ''')
         
-        # Create analysis table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                opinion_id INTEGER NOT NULL,
-                case_number TEXT NOT NULL,
-                court TEXT NOT NULL,
-                opinion_date DATE NOT NULL,
-                analysis_text TEXT NOT NULL,
-                has_interesting_issues BOOLEAN NOT NULL DEFAULT 0,
-                issue_count INTEGER DEFAULT 0,
-                analysis_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                claude_model TEXT NOT NULL,
-                FOREIGN KEY (opinion_id) REFERENCES opinions (id),
-                UNIQUE(opinion_id)
-            )
-        ''')
+            # Create analysis table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS analysis (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    opinion_id INTEGER NOT NULL,
+                    case_number TEXT NOT NULL,
+                    court TEXT NOT NULL,
+                    opinion_date DATE NOT NULL,
+                    analysis_text TEXT NOT NULL,
+                    has_interesting_issues BOOLEAN NOT NULL DEFAULT 0,
+                    issue_count INTEGER DEFAULT 0,
+                    analysis_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                    claude_model TEXT NOT NULL,
+                    FOREIGN KEY (opinion_id) REFERENCES opinions (id),
+                    UNIQUE(opinion_id)
+                )
+            ''')
         
-        # Create representatives table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS representatives (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                case_number TEXT NOT NULL,
-                court TEXT NOT NULL,
-                opinion_date DATE NOT NULL,
-                party_name TEXT NOT NULL,
-                party_type TEXT NOT NULL,
-                representative_names TEXT NOT NULL,
-                scrape_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                UNIQUE(case_number, court, party_name)
-            )
-        ''')
+            # Create representatives table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS representatives (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    case_number TEXT NOT NULL,
+                    court TEXT NOT NULL,
+                    opinion_date DATE NOT NULL,
+                    party_name TEXT NOT NULL,
+                    party_type TEXT NOT NULL,
+                    representative_names TEXT NOT NULL,
+                    scrape_timestamp TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                    UNIQUE(case_number, court, party_name)
+                )
+            ''')
 
-        # Add columns if they don't exist (for existing databases)
-        for col, table in [('pdf_url', 'opinions'), ('pdr_score', 'analysis')]:
-            try:
-                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {col} {"TEXT" if col == "pdf_url" else "INTEGER"}')
-                logger.info(f"Added {col} column to existing {table} table")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS imap_state (
-                mailbox TEXT PRIMARY KEY,
-                last_uid INTEGER DEFAULT 0,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS imap_state (
+                    mailbox TEXT PRIMARY KEY,
+                    last_uid INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
 
+            # Indexes for the report and analysis queries. analysis.opinion_id,
+            # opinions.case_number and representatives(case_number, court) are
+            # already covered by the UNIQUE constraints above.
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analysis_date_interesting
+                ON analysis(opinion_date, has_interesting_issues)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_opinions_file_path
+                ON opinions(file_path)
+            ''')
+        
+        if version < 2:
+            # Columns added after the tables were first created
+            for table, col, col_type in [('opinions', 'pdf_url', 'TEXT'),
+                                         ('analysis', 'pdr_score', 'INTEGER'),
+                                         ('analysis', 'disposition', 'TEXT'),
+                                         ('analysis', 'state_is_appellant', 'INTEGER')]:
+                existing = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+                if col not in existing:
+                    cursor.execute(f'ALTER TABLE {table} ADD COLUMN {col} {col_type}')
+                    logger.info(f"Added {col} column to existing {table} table")
+        
+        if version < 3:
+            # daily_runs grows by a row a day and every run starts with
+            # find_incomplete_runs(); the partial index only holds the few
+            # resumable rows. (status, target_date) serves the latest
+            # completed-run lookup without a sort.
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_daily_runs_incomplete
+                ON daily_runs(target_date, run_timestamp)
+                WHERE {_INCOMPLETE_RUN_FILTER}
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_daily_runs_status_target
+                ON daily_runs(status, target_date)
+            ''')
+        
+        if version < 4:
+            # The status command's "last 5 finished runs" walks this backwards
+            # and stops after five rows instead of sorting every finished run
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_daily_runs_timestamp
+                ON daily_runs(run_timestamp)
+            ''')
+        
+        # PRAGMA arguments cannot be bound parameters
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        conn.close()
     
     def _get_last_imap_uid(self, mailbox):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('SELECT last_uid FROM imap_state WHERE mailbox = ?', (mailbox,))
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         return row[0] if row else 0
 
     def _set_last_imap_uid(self, mailbox, uid):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO imap_state (mailbox, last_uid, updated_at)
@@ -376,7 +735,7 @@ class PDRBot:
                 updated_at = CURRENT_TIMESTAMP
         ''', (mailbox, uid))
         conn.commit()
-        conn.close()
+        self._release(conn)
 
     def get_current_business_day(self):
         """Get the current business day (skip weekends)"""
@@ -390,22 +749,26 @@ class PDRBot:
     
     def add_court_to_rollover(self, court_number, original_date):
         """Add a court to rollover list for checking tomorrow"""
-        conn = sqlite3.connect(self.db_path)
+        self.add_courts_to_rollover([court_number], original_date)
+    
+    def add_courts_to_rollover(self, court_numbers, original_date):
+        """Add several courts to the rollover list in one transaction"""
+        conn = self._connect()
         cursor = conn.cursor()
         try:
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT OR IGNORE INTO court_rollover (court_number, original_date)
                 VALUES (?, ?)
-            ''', (court_number, original_date))
+            ''', [(court_number, original_date) for court_number in court_numbers])
             conn.commit()
         except Exception as e:
-            logger.error(f"Failed to add court {court_number} to rollover: {e}")
+            logger.error(f"Failed to add courts {list(court_numbers)} to rollover: {e}")
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_rollover_courts(self, original_date):
         """Get courts that need to be checked from previous day"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT court_number FROM court_rollover 
@@ -413,18 +776,18 @@ class PDRBot:
             ORDER BY court_number
         ''', (original_date,))
         results = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        self._release(conn)
         return results
     
     def clear_rollover_courts(self, original_date):
         """Clear rollover courts for a specific date after processing"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             DELETE FROM court_rollover WHERE original_date = ?
         ''', (original_date,))
         conn.commit()
-        conn.close()
+        self._release(conn)
     
     def load_analysis_prompt(self):
         """Load the analysis prompt from the pdrbot-prompt file, then append
@@ -506,7 +869,10 @@ class PDRBot:
         try:
             yield server
         finally:
-            server.quit()
+            try:
+                server.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
 
     def extract_pdr_score(self, analysis_text):
         """Extract PDR Score (1-10) from analysis text.
@@ -530,15 +896,21 @@ class PDRBot:
                     return score
         return None
 
-    def extract_text_from_pdf(self, file_path):
-        """Extract text content from a PDF file"""
+    def extract_text_from_pdf(self, file_path, max_chars=None, pool=None):
+        """Extract text content from a PDF file
+
+        Pages are extracted one at a time; when max_chars is given,
+        extraction stops once that much text has been collected and the
+        result is truncated to it.
+
+        Parsing is CPU-bound and holds the GIL, so callers running several
+        analyses at once can pass a ProcessPoolExecutor as pool to do the
+        extraction in a worker process.
+        """
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            if pool is not None:
+                return pool.submit(_extract_pdf_text, file_path, max_chars).result()
+            return _extract_pdf_text(file_path, max_chars)
         except Exception as e:
             logger.error(f"Failed to extract text from {file_path}: {e}")
             return None
@@ -570,7 +942,7 @@ class PDRBot:
             else:
                 logger.info(f"Triage {case_number}: unavailable — running full analysis")
 
-            full_prompt = f"{self.analysis_prompt}\n\n--- OPINION TEXT ---\n{text_content}"
+            full_prompt = self.analysis_prompt_prefix + text_content
             analysis_text = call_claude_with_retry(
                 prompt=full_prompt,
                 timeout=300,
@@ -588,58 +960,9 @@ class PDRBot:
     def _triage_with_haiku(self, text_content, case_number):
         """Fast Haiku pass. Returns first line of the response, or None on
         failure (caller falls through to full Opus pass)."""
-        triage_prompt = (
-            "You are the first pass of a two-stage triage for a Texas "
-            "criminal-defense appellate practice. Cases you mark INTERESTING "
-            "go to a more capable model (Opus) for full analysis; cases you "
-            "mark ROUTINE are not analyzed further. Your only job is to "
-            "filter out truly cookie-cutter dispositions — the deeper model "
-            "is the authoritative judge of what is PDR-worthy.\n\n"
-            "Reply with exactly one line.\n\n"
-            "Default to INTERESTING. Mark ROUTINE only when the opinion is "
-            "truly cookie-cutter — a boilerplate disposition that could have "
-            "been written from a template, with no contested legal question, "
-            "no debatable application of law to fact, no concurrence or "
-            "dissent, and no discussion beyond reciting settled doctrine and "
-            "applying it to overwhelming or uncontested facts.\n\n"
-            "Cookie-cutter patterns (non-exhaustive):\n"
-            "- Anders affirmance with no arguable grounds and no "
-            "fine/cost/restitution issue\n"
-            "- Jurisdictional dismissal for untimely notice of appeal, no "
-            "tolling argument\n"
-            "- Habeas dismissed for failure to comply with statutory "
-            "prerequisites, no merits discussion\n"
-            "- Mandamus denied solely on want of presentment or want of "
-            "clear right, no contested record\n"
-            "- Frivolous-appeal dismissal with no preserved issues briefed\n"
-            "- Plea-bargain waiver dismissal under Rule 25.2(a)(2) with no "
-            "certification dispute\n\n"
-            "Anything else is INTERESTING — including any concurrence or "
-            "dissent, any sufficiency or burden-of-proof challenge against "
-            "non-overwhelming facts, any case where the court engages with a "
-            "doctrinal question even briefly, any case where the court "
-            "relies on cited authority to defeat a non-frivolous argument, "
-            "and any case decided on a close or contested record.\n\n"
-            "Always escalate when you see explicit textual signals like:\n"
-            "- the opinion itself flags an unresolved or unsettled question "
-            "('has not determined,' 'has not addressed,' 'we have not "
-            "found,' 'no controlling authority,' 'unsettled,' 'open "
-            "question,' or a Pattern Jury Charges committee note flagging "
-            "a gap)\n"
-            "- the court relies on pre-2000 Court of Criminal Appeals "
-            "authority for a contested point\n"
-            "- the court acknowledges or describes a split among Texas "
-            "courts of appeals (even where it picks a side)\n"
-            "- a concurrence or dissent rejects the majority's framework\n\n"
-            "A false ROUTINE loses a PDR-worthy case; a false INTERESTING "
-            "costs only one extra Opus call. When in doubt, escalate.\n\n"
-            "Your entire reply must be a single line, exactly one of:\n"
-            "- 'INTERESTING.'  (no justification — Opus will analyze)\n"
-            "- 'ROUTINE: <one-sentence reason>'"
-        )
         try:
             result = call_claude_with_retry(
-                prompt=f"{triage_prompt}\n\n--- OPINION TEXT ---\n{text_content}",
+                prompt=HAIKU_TRIAGE_PREFIX + text_content,
                 timeout=60,
                 max_retries=2,
                 base_delay=3,
@@ -655,40 +978,9 @@ class PDRBot:
     
     def clean_analysis_text(self, analysis_text):
         """Clean analysis text by removing introductory commentary, meta-commentary, and first-person statements"""
-        import re
-
-        # Remove common intro phrases and first-person commentary
-        # These patterns capture various ways Claude might introduce the analysis
-        intro_patterns = [
-            # "I'll/I will/Let me analyze..." patterns
-            r"^I'll analyze this.*?(?:\n|\.)\s*\n*",
-            r"^Let me analyze this.*?(?:\n|\.)\s*\n*",
-            r"^I will analyze this.*?(?:\n|\.)\s*\n*",
-            r"^I must analyze this.*?(?:\n|\.)\s*\n*",
-            r"^Analyzing this.*?(?:\n|\.)\s*\n*",
-
-            # "Looking at this..." patterns (single and multi-line)
-            r"^Looking at this.*?(?:\n\n|\*\*)",
-
-            # "I need to/I must examine/check..." patterns
-            r"^I need to (?:examine|check|analyze).*?(?:\n|\.)\s*\n*",
-            r"^I must (?:examine|check|analyze).*?(?:\n|\.)\s*\n*",
-
-            # "I find..." patterns at the beginning
-            r"^I find (?:no interesting issues|that this).*?(?:\n|\.)\s*\n*",
-            r"^I do not find.*?(?:\n|\.)\s*\n*",
-
-            # Meta-commentary about language requirements/compliance
-            r"^CRITICAL LANGUAGE REQUIREMENT.*?(?=TERSE REPORT|Appellant Name|\Z)",
-            r"^I have reviewed the forbidden words.*?(?:\n|\.)\s*\n*",
-            r"^.*compliance checklist.*?(?:\n\n|\Z)",
-            r"^.*COMPLIANCE CHECKLIST.*?(?:\n\n|\Z)",
-            r"^Every sentence will use only approved.*?(?:\n|\.)\s*\n*",
-        ]
-
         cleaned = analysis_text
-        for pattern in intro_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
+        for pattern in _ANALYSIS_INTRO_RES:
+            cleaned = pattern.sub('', cleaned)
 
         # Remove leading whitespace/newlines
         cleaned = cleaned.lstrip()
@@ -742,13 +1034,29 @@ class PDRBot:
                 return match.group(1).strip()
         return None
 
-    def save_analysis_to_db(self, opinion_id, case_number, court, opinion_date, analysis_text):
+    ANALYSIS_INSERT_SQL = '''
+        INSERT OR REPLACE INTO analysis
+        (opinion_id, case_number, court, opinion_date, analysis_text,
+         has_interesting_issues, issue_count, claude_model, pdr_score,
+         disposition, state_is_appellant)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def save_analysis_to_db(self, opinion_id, case_number, court, opinion_date, analysis_text, defer=False,
+                            file_path=None):
         """Save analysis results to database
 
         For consolidated cases (multiple case numbers in same PDF), saves the
         analysis to all opinion records that share the same file_path.
+
+        With defer=True the rows are queued and written by the next
+        flush_analyses() call (made automatically every 32 queued rows), so
+        a batch commits in a few transactions instead of one per opinion.
+
+        Pass file_path when the caller already has it (e.g. from
+        get_unanalyzed_opinions) to skip looking it up by opinion_id.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -756,7 +1064,7 @@ class PDRBot:
             cleaned_text = self.clean_analysis_text(analysis_text)
 
             # Check for execution errors
-            if "execution error" in cleaned_text.lower():
+            if _EXECUTION_ERROR_RE.search(cleaned_text):
                 logger.warning(f"Analysis for {case_number} contains execution error - marking as failed")
                 has_interesting_issues = False
                 issue_count = 0
@@ -776,22 +1084,11 @@ class PDRBot:
                 if parsed_issues is not None:
                     issue_count = len(parsed_issues)
                     has_interesting_issues = issue_count > 0
-                elif "no interesting issues" in cleaned_text.lower():
+                elif _NO_INTERESTING_ISSUES_RE.search(cleaned_text):
                     has_interesting_issues = False
                     issue_count = 0
                 else:
-                    issue_patterns = [
-                        r'▪\s*Issue Description:',
-                        r'\*\*Issue Description:\*\*',
-                        r'\*\*Issue \d+:',
-                        r'Issue \d+:',
-                        r'▪\s*Headline:',
-                        r'\*\*Headline:\*\*',
-                    ]
-                    issue_count = 0
-                    for pattern in issue_patterns:
-                        count = len(re.findall(pattern, cleaned_text))
-                        issue_count = max(issue_count, count)
+                    issue_count = max(len(pattern.findall(cleaned_text)) for pattern in _ISSUE_MARKER_RES)
                     has_interesting_issues = issue_count > 0
 
             # Extract PDR score
@@ -809,41 +1106,66 @@ class PDRBot:
                 if isinstance(_parsed_meta.get("state_is_appellant"), bool):
                     state_is_appellant_val = 1 if _parsed_meta["state_is_appellant"] else 0
 
-            # Get the file_path for this opinion
-            cursor.execute('SELECT file_path FROM opinions WHERE id = ?', (opinion_id,))
-            result = cursor.fetchone()
-            if not result:
+            # Find all opinion_ids that share this opinion's file_path
+            # (consolidated cases), resolving the path in the same query
+            # when the caller did not supply it
+            if file_path is None:
+                cursor.execute('''
+                    SELECT id, case_number, court, opinion_date, file_path FROM opinions
+                    WHERE file_path = (SELECT file_path FROM opinions WHERE id = ?)
+                ''', (opinion_id,))
+            else:
+                cursor.execute('''
+                    SELECT id, case_number, court, opinion_date, file_path FROM opinions
+                    WHERE file_path = ?
+                ''', (file_path,))
+            all_opinions = cursor.fetchall()
+            if not all_opinions:
                 logger.error(f"Opinion ID {opinion_id} not found")
                 return False
-
-            file_path = result[0]
-
-            # Find all opinion_ids that share this file_path (consolidated cases)
-            cursor.execute('SELECT id, case_number, court, opinion_date FROM opinions WHERE file_path = ?', (file_path,))
-            all_opinions = cursor.fetchall()
+            file_path = all_opinions[0][4]
 
             # Save analysis for all opinions that share this file
-            for oid, cnum, crt, odate in all_opinions:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO analysis
-                    (opinion_id, case_number, court, opinion_date, analysis_text,
-                     has_interesting_issues, issue_count, claude_model, pdr_score,
-                     disposition, state_is_appellant)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (oid, cnum, crt, odate, cleaned_text,
-                      has_interesting_issues, issue_count, self.claude_model, pdr_score,
-                      disposition_val, state_is_appellant_val))
+            rows = [(oid, cnum, crt, odate, cleaned_text,
+                     has_interesting_issues, issue_count, self.claude_model, pdr_score,
+                     disposition_val, state_is_appellant_val)
+                    for oid, cnum, crt, odate, _ in all_opinions]
 
             if len(all_opinions) > 1:
                 logger.info(f"Saved analysis to {len(all_opinions)} consolidated cases sharing {file_path}")
 
-            conn.commit()
-            return True
+            if defer:
+                self._pending_analyses.extend(rows)
+            else:
+                cursor.executemany(self.ANALYSIS_INSERT_SQL, rows)
+                conn.commit()
         except Exception as e:
             logger.error(f"Error saving analysis to database: {e}")
             return False
         finally:
-            conn.close()
+            self._release(conn)
+
+        if defer and len(self._pending_analyses) >= 32:
+            return self.flush_analyses()
+        return True
+
+    def flush_analyses(self):
+        """Write analysis rows queued by save_analysis_to_db(defer=True) in
+        a single transaction"""
+        if not self._pending_analyses:
+            return True
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(self.ANALYSIS_INSERT_SQL, self._pending_analyses)
+            logger.info(f"Wrote {len(self._pending_analyses)} queued analysis rows")
+            self._pending_analyses.clear()
+            return True
+        except Exception as e:
+            logger.error(f"Error writing queued analyses to database: {e}")
+            return False
+        finally:
+            self._release(conn)
     
     def get_unanalyzed_opinions(self):
         """Get opinions that haven't been analyzed yet
@@ -851,7 +1173,7 @@ class PDRBot:
         Returns only one opinion per unique file_path to avoid analyzing
         the same PDF multiple times for consolidated cases.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -863,48 +1185,88 @@ class PDRBot:
                 GROUP BY o.file_path
                 ORDER BY o.opinion_date DESC, o.case_number
             ''')
-            return cursor.fetchall()
+            return [UnanalyzedOpinion._make(row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Error fetching unanalyzed opinions: {e}")
             return []
         finally:
-            conn.close()
+            self._release(conn)
     
-    def process_opinion_analysis(self, opinion_id, case_number, court, opinion_date, file_path):
-        """Process a single opinion for analysis"""
+    def count_unanalyzed_opinions(self):
+        """Number of opinions get_unanalyzed_opinions() would return, counted
+        in SQLite instead of fetching the rows"""
+        conn = self._connect()
+        try:
+            return conn.execute('''
+                SELECT COUNT(*) FROM (
+                    SELECT 1
+                    FROM opinions o
+                    LEFT JOIN analysis a ON o.id = a.opinion_id
+                    WHERE a.opinion_id IS NULL
+                    GROUP BY o.file_path
+                )
+            ''').fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error counting unanalyzed opinions: {e}")
+            return 0
+        finally:
+            self._release(conn)
+    
+    def _analyze_opinion_file(self, case_number, file_path, pdf_pool=None):
+        """Extract and analyze one opinion PDF, returning the raw analysis or
+        None. Touches no database state, so run_analysis_batch can run it on
+        worker threads."""
         logger.info(f"Analyzing opinion: {case_number}")
         
         # Extract text from PDF
-        text_content = self.extract_text_from_pdf(file_path)
+        text_content = self.extract_text_from_pdf(file_path, pool=pdf_pool)
         if not text_content:
             logger.error(f"Could not extract text from {file_path}")
-            return False
+            return None
         
         # Analyze with Claude
         analysis_result = self.analyze_opinion_with_claude(text_content, case_number)
         if not analysis_result:
             logger.error(f"Could not analyze {case_number}")
-            return False
+            return None
         
-        # Save analysis to database
-        success = self.save_analysis_to_db(opinion_id, case_number, court, opinion_date, analysis_result)
+        return analysis_result
+    
+    def _store_opinion_analysis(self, opinion_id, case_number, court, opinion_date, analysis_result, defer=False,
+                                file_path=None):
+        """Save a finished analysis and, for interesting cases, scrape the
+        case's representatives"""
+        success = self.save_analysis_to_db(opinion_id, case_number, court, opinion_date, analysis_result,
+                                           defer=defer, file_path=file_path)
         if success:
             logger.info(f"Saved analysis for {case_number}")
 
             # If case has interesting issues, scrape representative information
             # Use the cleaned/parsed result from DB to stay consistent
             cleaned = self.clean_analysis_text(analysis_result)
-            issue_count = 0
-            for pattern in [r'▪\s*Headline:', r'\*\*Headline:\*\*']:
-                issue_count = max(issue_count, len(re.findall(pattern, cleaned)))
-            if issue_count > 0 and "no interesting issues" not in cleaned.lower():
+            has_headline = any(pattern.search(cleaned) for pattern in _HEADLINE_MARKER_RES)
+            if has_headline and not _NO_INTERESTING_ISSUES_RE.search(cleaned):
                 case_url = self.generate_case_url(case_number, court)
+                # Callers store results one at a time (run_analysis_batch does
+                # it on its result-consuming thread), so these fetches are
+                # already serialized; the throttle only waits when the
+                # previous one started less than a second ago
+                self._throttle('case', 1)
                 self.scrape_case_representatives(case_url, case_number, court, opinion_date)
-                time.sleep(1)
         
         return success
     
-    def run_analysis_batch(self, limit=None):
+    def process_opinion_analysis(self, opinion_id, case_number, court, opinion_date, file_path):
+        """Process a single opinion for analysis"""
+        analysis_result = self._analyze_opinion_file(case_number, file_path)
+        if not analysis_result:
+            return False
+        
+        # Save analysis to database
+        return self._store_opinion_analysis(opinion_id, case_number, court, opinion_date, analysis_result,
+                                            file_path=file_path)
+    
+    def run_analysis_batch(self, limit=None, workers=None):
         """Process unanalyzed opinions in batches"""
         if not self.analysis_enabled:
             logger.info("Analysis is disabled")
@@ -918,23 +1280,47 @@ class PDRBot:
             logger.info("No unanalyzed opinions found")
             return
         
-        logger.info(f"Processing {len(unanalyzed)} unanalyzed opinions")
+        workers = max(1, workers or self.analysis_workers)
+        logger.info(f"Processing {len(unanalyzed)} unanalyzed opinions "
+                    f"({workers} at a time)")
         processed = 0
         failed = 0
         
-        for opinion_id, case_number, court, opinion_date, file_path in unanalyzed:
-            try:
-                if self.process_opinion_analysis(opinion_id, case_number, court, opinion_date, file_path):
-                    processed += 1
-                else:
-                    failed += 1
-                
-                # Rate limiting - be respectful to Claude API
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing {case_number}: {e}")
-                failed += 1
+        # Claude calls are remote and dominate wall time, so several run at
+        # once; the worker count is the rate limit. PDF parsing is CPU-bound,
+        # so the workers hand it to a process pool rather than contending for
+        # the GIL. Results are saved here on the calling thread so database
+        # writes stay serialized. The pool's children are spawned rather
+        # than forked: they start lazily, from the worker threads, and a
+        # fork would copy a process with live HTTPS, SQLite and logging
+        # threads (and any locks they hold) into each child.
+        pdf_workers = min(workers, os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=pdf_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pdf_pool, \
+                    ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._analyze_opinion_file, opinion.case_number, opinion.file_path,
+                                pdf_pool): opinion
+                    for opinion in unanalyzed
+                }
+                for future in as_completed(futures):
+                    opinion = futures[future]
+                    case_number = opinion.case_number
+                    try:
+                        analysis_result = future.result()
+                        if analysis_result and self._store_opinion_analysis(
+                                opinion.id, case_number, opinion.court, opinion.opinion_date, analysis_result,
+                                defer=True, file_path=opinion.file_path):
+                            processed += 1
+                        else:
+                            failed += 1
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {case_number}: {e}")
+                        failed += 1
+        finally:
+            self.flush_analyses()
         
         logger.info(f"Analysis batch complete: {processed} processed, {failed} failed")
         
@@ -963,38 +1349,46 @@ class PDRBot:
         processed = 0
         failed = 0
         
+        # Look up every file's opinion record and analysis status up front
+        # rather than querying per file
+        case_numbers = [case_number for case_number, _ in pdf_files]
+        analyzed = set()
+        existing = {}
+        conn = self._connect()
+        try:
+            for i in range(0, len(case_numbers), 500):
+                chunk = case_numbers[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                analyzed.update(row[0] for row in conn.execute(f'''
+                    SELECT DISTINCT o.case_number FROM opinions o
+                    JOIN analysis a ON o.id = a.opinion_id
+                    WHERE o.case_number IN ({placeholders})
+                ''', chunk))
+                for cnum, oid, crt, odate in conn.execute(f'''
+                    SELECT case_number, id, court, opinion_date FROM opinions
+                    WHERE case_number IN ({placeholders})
+                    ORDER BY id
+                ''', chunk):
+                    existing.setdefault(cnum, (oid, crt, odate))
+        finally:
+            self._release(conn)
+        
         for case_number, pdf_path in pdf_files:
             try:
-                # Check if this case is already analyzed
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT COUNT(*) FROM opinions o
-                    JOIN analysis a ON o.id = a.opinion_id
-                    WHERE o.case_number = ?
-                ''', (case_number,))
-                already_analyzed = cursor.fetchone()[0] > 0
-                conn.close()
-                
-                if already_analyzed:
+                if case_number in analyzed:
                     logger.info(f"Skipping {case_number} - already analyzed")
                     continue
                 
                 # Find or create opinion record
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('SELECT id FROM opinions WHERE case_number = ?', (case_number,))
-                result = cursor.fetchone()
-                
-                if result:
-                    opinion_id = result[0]
+                if case_number in existing:
+                    opinion_id, court, opinion_date = existing[case_number]
                 else:
                     # Create a basic opinion record for this PDF
                     # Extract court and date from case number (e.g., "01-23-00771-CR")
-                    parts = case_number.split('-')
-                    if len(parts) >= 3:
-                        court = f"COA{parts[0]}"
-                        year = f"20{parts[1]}"
+                    parts = _CASE_NUMBER_PARTS_RE.match(case_number)
+                    if parts:
+                        court = f"COA{parts.group(1)}"
+                        year = f"20{parts.group(2)}"
                         # Use a default date based on directory name
                         dir_name = os.path.basename(directory_path)
                         if len(dir_name) == 8 and dir_name.isdigit():
@@ -1002,20 +1396,22 @@ class PDRBot:
                         else:
                             opinion_date = f"{year}-01-01"  # Default date
                         
-                        cursor.execute('''
-                            INSERT INTO opinions 
-                            (case_number, court, opinion_date, opinion_type, filename, file_path, case_url)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (case_number, court, opinion_date, "combined", os.path.basename(pdf_path), pdf_path, ""))
-                        opinion_id = cursor.lastrowid
-                        conn.commit()
+                        conn = self._connect()
+                        try:
+                            cursor = conn.cursor()
+                            cursor.execute('''
+                                INSERT INTO opinions 
+                                (case_number, court, opinion_date, opinion_type, filename, file_path, case_url)
+                                VALUES (?, ?, ?, ?, ?, ?, ?)
+                            ''', (case_number, court, opinion_date, "combined", os.path.basename(pdf_path), pdf_path, ""))
+                            opinion_id = cursor.lastrowid
+                            conn.commit()
+                        finally:
+                            self._release(conn)
                     else:
                         logger.warning(f"Could not parse case number format: {case_number}")
-                        conn.close()
                         continue
                 
-                conn.close()
-                
                 # Process the analysis
                 if self.process_opinion_analysis(opinion_id, case_number, court, opinion_date, pdf_path):
                     processed += 1
@@ -1035,7 +1431,7 @@ class PDRBot:
     
     def backfill_pdf_urls(self):
         """Backfill PDF URLs for existing records that don't have them"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -1053,41 +1449,58 @@ class PDRBot:
             
             logger.info(f"Backfilling PDF URLs for {len(records)} records")
             
+            # Every record on the same court/date lives on the same docket
+            # page, so group them and fetch each docket once
+            dockets = {}
             for opinion_id, case_number, court, opinion_date in records:
-                # Try to reconstruct the PDF URLs by re-scraping the case
                 try:
                     coa_num = int(court.replace("COA", ""))
                     date_obj = datetime.strptime(str(opinion_date), '%Y-%m-%d').date()
+                except Exception as e:
+                    logger.warning(f"Could not backfill PDF URL for {case_number}: {e}")
+                    continue
+                url = self.get_docket_url(coa_num, date_obj)
+                dockets.setdefault(url, (coa_num, []))[1].append((opinion_id, case_number))
+            
+            # Docket fetches are network-bound; run a bounded number at once
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+                futures = {pool.submit(self.get_with_retry, url): url for url in dockets}
+                for future in as_completed(futures):
+                    coa_num, targets = dockets[futures[future]]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        for _, case_number in targets:
+                            logger.warning(f"Could not backfill PDF URL for {case_number}: {e}")
+                        continue
                     
-                    # Get the docket page for this case
-                    url = self.get_docket_url(coa_num, date_obj)
-                    response = self.get_with_retry(url)
-                    
-                    if response:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        criminal_cases = self.parse_criminal_causes(soup)
-                        
-                        # Find the matching case
-                        for case in criminal_cases:
-                            if case['case_number'] == case_number:
-                                pdf_urls = [link['url'] for link in case['pdf_links']]
-                                pdf_urls_string = ';'.join(pdf_urls) if pdf_urls else None
-                                
-                                # Update the record
-                                cursor.execute('''
-                                    UPDATE opinions 
-                                    SET pdf_url = ?
-                                    WHERE id = ?
-                                ''', (pdf_urls_string, opinion_id))
-                                
-                                logger.info(f"Updated PDF URLs for {case_number}")
-                                break
+                    if not response:
+                        continue
                     
-                    # Small delay to be respectful
-                    time.sleep(1)
+                    try:
+                        criminal_cases = {case['case_number']: case
+                                          for case in self.parse_criminal_causes(response.content, coa_num)}
+                    except Exception as e:
+                        for _, case_number in targets:
+                            logger.warning(f"Could not backfill PDF URL for {case_number}: {e}")
+                        continue
                     
-                except Exception as e:
-                    logger.warning(f"Could not backfill PDF URL for {case_number}: {e}")
+                    # Find the matching cases
+                    for opinion_id, case_number in targets:
+                        case = criminal_cases.get(case_number)
+                        if not case:
+                            continue
+                        pdf_urls = [link['url'] for link in case['pdf_links']]
+                        pdf_urls_string = ';'.join(pdf_urls) if pdf_urls else None
+                        
+                        # Update the record
+                        cursor.execute('''
+                            UPDATE opinions 
+                            SET pdf_url = ?
+                            WHERE id = ?
+                        ''', (pdf_urls_string, opinion_id))
+                        
+                        logger.info(f"Updated PDF URLs for {case_number}")
             
             conn.commit()
             logger.info("PDF URL backfill complete")
@@ -1095,7 +1508,7 @@ class PDRBot:
         except Exception as e:
             logger.error(f"Error during PDF URL backfill: {e}")
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_analysis_results(self, date_filter=None, interesting_only=True, date_range=None):
         """Get analysis results for report generation
@@ -1108,7 +1521,7 @@ class PDRBot:
             interesting_only: Only return cases with interesting issues
             date_range: Tuple of (start_date, end_date) for range queries
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -1145,7 +1558,6 @@ class PDRBot:
             query += " ORDER BY a.has_interesting_issues DESC, COALESCE(a.pdr_score, 0) DESC, a.opinion_date DESC, a.case_number"
 
             cursor.execute(query, params)
-            all_results = cursor.fetchall()
 
             # Deduplicate by PDF content hash AND by consolidated case numbers
             # But preserve different opinion types (lead vs concurring vs dissenting)
@@ -1153,7 +1565,10 @@ class PDRBot:
             seen_case_sets = {}  # Track (case_numbers, opinion_type) to allow different opinion types
             unique_results = []
 
-            for result in all_results:
+            # Iterating the cursor steps through matches one at a time, so
+            # duplicates (and their analysis text) are dropped without first
+            # materializing every row
+            for result in cursor:
                 file_path = result[7]  # file_path is at index 7
                 case_number = result[0]  # case_number is at index 0
                 opinion_type = result[10]  # opinion_type is at index 10
@@ -1185,7 +1600,7 @@ class PDRBot:
                             )
                             if text_result.returncode == 0:
                                 first_page = text_result.stdout
-                                case_nums = set(re.findall(r'\d{2}-\d{2}-\d{5}-CR', first_page))
+                                case_nums = set(_CR_CASE_NUMBER_RE.findall(first_page))
                                 if case_nums:
                                     # Create a key combining case numbers AND whether it's a side opinion
                                     # This allows lead + concurring + dissenting to all appear
@@ -1211,14 +1626,16 @@ class PDRBot:
             logger.error(f"Error fetching analysis results: {e}")
             return []
         finally:
-            conn.close()
+            self._release(conn)
     
-    def generate_case_url(self, case_number, court):
-        """Generate the online case URL"""
-        base_url = "https://search.txcourts.gov/Case.aspx?cn="
-        url = f"{base_url}{case_number}"
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def generate_case_url(case_number, court):
+        """Generate the online case URL (memoized: it is pure and the report
+        and email builders ask for the same cases repeatedly)"""
+        url = f"{_CASE_URL_BASE}?cn={quote(case_number, safe='-')}"
         if court:
-            m = re.search(r"(\d+)", str(court))
+            m = _COURT_NUMBER_RE.search(str(court))
             if m:
                 url += f"&coa=coa{int(m.group(1)):02d}"
         return url
@@ -1302,10 +1719,10 @@ class PDRBot:
         try:
             logger.info(f"Scraping representatives for case {case_number}")
             response = self.get_with_retry(case_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find the parties panel - search for panel-heading containing "Parties"
-            parties_panel = soup.find('div', class_=['panel-heading', 'panel-heading-content'], string=lambda text: text and 'Parties' in text)
+            parties_panel = soup.find('div', class_=['panel-heading', 'panel-heading-content'], string=_PARTIES_RE)
             if not parties_panel:
                 logger.warning(f"No parties panel found for case {case_number}")
                 return []
@@ -1336,17 +1753,16 @@ class PDRBot:
                         if "State of Texas" in party_name or "Criminal - State of Texas" in party_type:
                             continue
                         
-                        # Extract representative names (they may be separated by <br> tags)
-                        rep_names = []
+                        # Extract representative names (they may be separated by <br> tags).
+                        # Only <br> splits names: a separator in get_text() would also break
+                        # at inline tags inside a single name
                         for br in representative_cell.find_all('br'):
                             br.replace_with('\n')
                         rep_text = representative_cell.get_text()
                         
-                        # Clean and split representative names
-                        for name in rep_text.split('\n'):
-                            name = name.strip()
-                            if name and name not in rep_names:
-                                rep_names.append(name)
+                        # dict.fromkeys drops repeats while keeping page order
+                        rep_names = list(dict.fromkeys(
+                            name for name in (line.strip() for line in rep_text.split('\n')) if name))
                         
                         if rep_names:
                             representatives.append({
@@ -1369,30 +1785,37 @@ class PDRBot:
         if not representatives:
             return
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._connect()
         
         try:
-            for rep in representatives:
-                cursor.execute('''
+            rows = [(case_number, court, opinion_date, rep['party_name'],
+                     rep['party_type'], rep['representative_names'])
+                    for rep in representatives]
+            # One transaction for the whole case instead of a commit per party
+            with conn:
+                conn.executemany('''
                     INSERT OR REPLACE INTO representatives 
                     (case_number, court, opinion_date, party_name, party_type, representative_names)
                     VALUES (?, ?, ?, ?, ?, ?)
-                ''', (case_number, court, opinion_date, rep['party_name'], 
-                      rep['party_type'], rep['representative_names']))
+                ''', rows)
             
-            conn.commit()
             logger.info(f"Saved {len(representatives)} representative entries for case {case_number}")
             
         except Exception as e:
             logger.error(f"Error saving representatives to database: {e}")
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_case_representatives(self, case_number, court):
-        """Get representative information for a specific case"""
-        conn = sqlite3.connect(self.db_path)
+        """Get representative information for a specific case
+
+        Returns sqlite3.Row objects, read by column name like
+        rep['party_name'].
+        """
+        conn = self._connect()
         cursor = conn.cursor()
+        # Per-cursor so the rest of the bot keeps plain tuples
+        cursor.row_factory = sqlite3.Row
         
         try:
             cursor.execute('''
@@ -1402,25 +1825,62 @@ class PDRBot:
                 ORDER BY party_type
             ''', (case_number, court))
             
-            results = cursor.fetchall()
-            return [{'party_name': row[0], 'party_type': row[1], 'representative_names': row[2]} 
-                    for row in results]
+            return cursor.fetchall()
         except Exception as e:
             logger.error(f"Error getting representatives for case {case_number}: {e}")
             return []
         finally:
-            conn.close()
+            self._release(conn)
+
+    def get_representatives_for_cases(self, keys):
+        """Get representative information for many cases at once
+
+        keys is an iterable of (case_number, court) pairs. Returns a dict
+        mapping each pair that has representatives to the same list of rows
+        get_case_representatives() returns for it.
+        """
+        keys = set(keys)
+        case_numbers = list({case_number for case_number, _ in keys})
+        by_case = {}
+        if not case_numbers:
+            return by_case
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        
+        try:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(case_numbers), 500):
+                chunk = case_numbers[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT case_number, court, party_name, party_type, representative_names
+                    FROM representatives
+                    WHERE case_number IN ({placeholders})
+                    ORDER BY party_type
+                ''', chunk)
+                for row in cursor.fetchall():
+                    key = (row['case_number'], row['court'])
+                    if key in keys:
+                        by_case.setdefault(key, []).append(row)
+            return by_case
+        except Exception as e:
+            logger.error(f"Error getting representatives for {len(keys)} cases: {e}")
+            return {}
+        finally:
+            self._release(conn)
 
     def get_opinion_pdf_urls(self, case_number, court):
         """Get the original PDF URLs for a case by reconstructing from case page structure"""
         # This is a simplified approach - ideally we'd store these during download
         # For now, we'll link to the case page where users can access the PDFs
-        court_num = court.replace("COA", "").zfill(2)
+        court_num = _COURT_CODES.get(court) or court.replace("COA", "").zfill(2)
         case_encoded = quote(case_number)
         
         # The actual PDF URLs follow a pattern but are complex to reconstruct
         # So we'll provide the case page URL where PDFs can be accessed
-        return [f"https://search.txcourts.gov/Case.aspx?cn={case_encoded}&coa={court_num}"]
+        return [f"{_CASE_URL_BASE}?cn={case_encoded}&coa={court_num}"]
     
     def generate_pdf_path(self, file_path):
         """Generate a relative path to the PDF file for links"""
@@ -1428,7 +1888,13 @@ class PDRBot:
         return os.path.relpath(file_path, self.data_dir)
     
     def create_pdf_styles(self):
-        """Create custom styles for the PDF report"""
+        """Create custom styles for the PDF report
+
+        The stylesheet is built once per PDRBot and reused by later reports.
+        """
+        if self._pdf_styles is not None:
+            return self._pdf_styles
+        
         styles = getSampleStyleSheet()
         
         # Custom styles
@@ -1466,6 +1932,7 @@ class PDRBot:
             alignment=TA_JUSTIFY
         ))
         
+        self._pdf_styles = styles
         return styles
     
     def get_unique_filename(self, base_filename):
@@ -1474,12 +1941,13 @@ class PDRBot:
         if not os.path.exists(output_path):
             return base_filename
         
+        # One directory listing instead of a stat per candidate name
+        existing = set(os.listdir(self.data_dir))
         name, ext = os.path.splitext(base_filename)
         counter = 1
         while True:
             new_filename = f"{name}-{counter}{ext}"
-            new_path = os.path.join(self.data_dir, new_filename)
-            if not os.path.exists(new_path):
+            if new_filename not in existing:
                 return new_filename
             counter += 1
     
@@ -1501,8 +1969,17 @@ class PDRBot:
             logger.info("No analyzed cases found for report generation")
             return None
 
+        # Summary statistics and the per-date counts used for the title,
+        # gathered in one pass over the results
+        total_cases = 0
+        total_issues = 0
+        date_counter = Counter()
+        for row in results:
+            total_cases += 1
+            total_issues += row[5] or 0  # issue_count column
+            date_counter[row[2]] += 1  # opinion_date column
+        
         # Determine the opinion date for the report title
-        opinion_dates = [row[2] for row in results]  # opinion_date column
         if custom_title:
             report_title = custom_title
             report_date = "combined"
@@ -1517,10 +1994,8 @@ class PDRBot:
             else:
                 report_date = str(date_filter)
             report_title = f"{report_date} Handdowns"
-        elif opinion_dates:
+        elif date_counter:
             # Use the most common date or latest date
-            from collections import Counter  # rare path, keep inline
-            date_counter = Counter(opinion_dates)
             most_common_date = date_counter.most_common(1)[0][0]
             report_date = str(most_common_date)
             report_title = f"{report_date} Handdowns"
@@ -1536,8 +2011,10 @@ class PDRBot:
         output_path = os.path.join(self.data_dir, output_filename)
         
         # Create PDF document
+        # Built in memory and written in one call once the story is laid out
+        pdf_buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            output_path,
+            pdf_buffer,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -1561,9 +2038,6 @@ class PDRBot:
         story.append(Spacer(1, 20))
         
         # Summary statistics
-        total_cases = len(results)
-        total_issues = sum(row[5] for row in results)  # issue_count column
-
         summary_data = [
             ['Cases with Interesting Issues:', str(total_cases)],
             ['Total Issues Found:', str(total_issues)],
@@ -1582,6 +2056,9 @@ class PDRBot:
         story.append(Spacer(1, 30))
 
         # Process each case (all cases here are interesting since we filtered above)
+        representatives_by_case = self.get_representatives_for_cases(
+            (row[0], row[1]) for row in results if row[4])
+        last_index = len(results) - 1
         for i, (case_number, court, opinion_date, analysis_text, has_interesting,
                 issue_count, analysis_timestamp, file_path, case_url, pdf_url, opinion_type,
                 pdr_score) in enumerate(results):
@@ -1606,8 +2083,8 @@ class PDRBot:
                     case_info_parts.append(f"<b>Opinion PDF:</b> <link href='{pdf_urls[0]}' color='blue'>Direct PDF Link</link>")
                 else:
                     # Multiple PDFs - list them
-                    for i, url in enumerate(pdf_urls, 1):
-                        case_info_parts.append(f"<b>Opinion {i} PDF:</b> <link href='{url}' color='blue'>Direct PDF Link {i}</link>")
+                    for n, url in enumerate(pdf_urls, 1):
+                        case_info_parts.append(f"<b>Opinion {n} PDF:</b> <link href='{url}' color='blue'>Direct PDF Link {n}</link>")
             else:
                 # Fallback to case page
                 case_info_parts.append(f"<b>Online Opinions:</b> <link href='{case_url_link}' color='blue'>View on Court Website</link>")
@@ -1623,7 +2100,7 @@ class PDRBot:
             
             # Add representative information for interesting cases
             if has_interesting:
-                representatives = self.get_case_representatives(case_number, court)
+                representatives = representatives_by_case.get((case_number, court))
                 if representatives:
                     rep_info_parts = ["<b>Defense Representatives:</b>"]
                     for rep in representatives:
@@ -1639,22 +2116,22 @@ class PDRBot:
 
             # Convert markdown formatting to HTML for PDF
             # Remove markdown headers (# and ##)
-            analysis_clean = re.sub(r'^#+\s*', '', analysis_clean, flags=re.MULTILINE)
+            analysis_clean = _MD_HEADER_RE.sub('', analysis_clean)
             # Remove Priority Level sections completely
-            analysis_clean = re.sub(r'\*\*▪ Priority Level:\*\*[^\n]*\n?', '', analysis_clean)
-            analysis_clean = re.sub(r'\*\*Priority Level:\*\*[^\n]*\n?', '', analysis_clean)
+            analysis_clean = _PRIORITY_BULLET_RE.sub('', analysis_clean)
+            analysis_clean = _PRIORITY_RE.sub('', analysis_clean)
 
             # Strip any existing HTML tags that Claude may have included
-            analysis_clean = re.sub(r'<[^>]+>', '', analysis_clean)
+            analysis_clean = _HTML_TAG_RE.sub('', analysis_clean)
 
             # Escape special HTML characters
             analysis_clean = analysis_clean.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
 
             # Now safely convert markdown to HTML
             # Convert **bold** to <b>bold</b>
-            analysis_clean = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', analysis_clean)
+            analysis_clean = _MD_BOLD_RE.sub(r'<b>\1</b>', analysis_clean)
             # Convert *italic* to <i>italic</i> (but not when part of **)
-            analysis_clean = re.sub(r'(?<!\*)\*([^*]+?)\*(?!\*)', r'<i>\1</i>', analysis_clean)
+            analysis_clean = _MD_ITALIC_RE.sub(r'<i>\1</i>', analysis_clean)
             
             # Split analysis into paragraphs for better formatting
             analysis_paragraphs = analysis_clean.split('\n\n')
@@ -1677,13 +2154,13 @@ class PDRBot:
                         # If paragraph fails due to HTML parsing, try with plain text
                         logger.warning(f"Paragraph HTML parsing failed for {case_number}, using plain text: {str(e)[:100]}")
                         # Strip all markup and use plain text
-                        plain_content = re.sub(r'<[^>]+>', '', para_content)
+                        plain_content = _HTML_TAG_RE.sub('', para_content)
                         plain_content = plain_content.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
                         story.append(Paragraph(plain_content, styles['Analysis']))
                         story.append(Spacer(1, 6))
             
             # Add page break except for last case, and only if we added content
-            if i < len(results) - 1:
+            if i < last_index:
                 # Add some spacing before page break to avoid orphaned content
                 story.append(Spacer(1, 12))
                 story.append(PageBreak())
@@ -1691,12 +2168,20 @@ class PDRBot:
         # Build PDF
         try:
             doc.build(story)
+            self._write_pdf(output_path, pdf_buffer)
             logger.info(f"Analysis report generated: {output_path}")
             return output_path
         except Exception as e:
             logger.error(f"Error generating PDF report: {e}")
             return None
     
+    @staticmethod
+    def _write_pdf(output_path, pdf_buffer):
+        """Write a PDF built into a BytesIO out to output_path in one call.
+        A failed build never leaves a partial file behind."""
+        with open(output_path, 'wb') as f:
+            f.write(pdf_buffer.getbuffer())
+
     def generate_daily_report(self, target_date=None):
         """Generate a report for a specific date"""
         if target_date is None:
@@ -1723,12 +2208,12 @@ class PDRBot:
         # Check disposition ONLY if it contains concurring or dissenting
         if "concurring" in disposition_lower:
             # Look for justice name in description
-            justice_match = re.search(r'(?:concurring )?opinion by (?:chief )?justice (\w+)', description_lower)
+            justice_match = _CONCURRING_BY_JUSTICE_RE.search(description_lower)
             justice_name = justice_match.group(1) if justice_match else None
             return "con", justice_name
         elif "dissenting" in disposition_lower:
             # Look for justice name in description
-            justice_match = re.search(r'(?:dissenting )?opinion by (?:chief )?justice (\w+)', description_lower)
+            justice_match = _DISSENTING_BY_JUSTICE_RE.search(description_lower)
             justice_name = justice_match.group(1) if justice_match else None
             return "dis", justice_name
         
@@ -1736,11 +2221,11 @@ class PDRBot:
         if "memorandum" in description_lower:
             return "mem", None
         elif "dissenting" in description_lower:
-            justice_match = re.search(r'dissenting opinion by (?:chief )?justice (\w+)', description_lower)
+            justice_match = _DISSENT_OPINION_BY_JUSTICE_RE.search(description_lower)
             justice_name = justice_match.group(1) if justice_match else None
             return "dis", justice_name
         elif "concurring" in description_lower:
-            justice_match = re.search(r'concurring opinion by (?:chief )?justice (\w+)', description_lower)
+            justice_match = _CONCUR_OPINION_BY_JUSTICE_RE.search(description_lower)
             justice_name = justice_match.group(1) if justice_match else None
             return "con", justice_name
         elif "opinion" in description_lower:
@@ -1750,7 +2235,7 @@ class PDRBot:
     
     def extract_case_number(self, case_link_text):
         """Extract case number from link text"""
-        match = re.search(r'\d{2}-\d{2}-\d{5}-CR', case_link_text)
+        match = _CR_CASE_NUMBER_RE.search(case_link_text)
         return match.group(0) if match else None
     
     def download_pdf(self, pdf_url, filepath, max_retries=None):
@@ -1761,36 +2246,42 @@ class PDRBot:
         
         for attempt in range(max_retries):
             try:
-                response = self.session.get(pdf_url, timeout=self.request_timeout)
-                response.raise_for_status()
-                
-                # Validate response is actually a PDF
-                if response.headers.get('content-type', '').lower() != 'application/pdf':
-                    logger.warning(f"Response is not a PDF (attempt {attempt + 1}): {response.headers.get('content-type', 'unknown')}")
-                    if attempt == max_retries - 1:
-                        logger.error(f"Not a PDF after {max_retries} attempts: {os.path.basename(filepath)}")
-                        return False
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
-                
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                # Verify file was written and has content
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-                    # Basic PDF validation - check for PDF magic bytes
-                    with open(filepath, 'rb') as f:
-                        header = f.read(4)
-                        if not header.startswith(b'%PDF'):
-                            raise Exception("Downloaded file is not a valid PDF")
+                # Stream the body to disk in chunks rather than holding the
+                # whole PDF in memory
+                with self.session.get(pdf_url, timeout=self.request_timeout, stream=True) as response:
+                    response.raise_for_status()
                     
-                    logger.info(f"Downloaded: {os.path.basename(filepath)}")
-                    return True
-                else:
-                    raise Exception("File was not written or is empty")
+                    chunks = response.iter_content(chunk_size=65536)
+                    first = next(chunks, b'')
+                    if not first:
+                        raise Exception("File was not written or is empty")
+                    # Validate response is actually a PDF. The magic bytes are
+                    # authoritative; Content-Type varies (parameters,
+                    # application/octet-stream) between otherwise good responses.
+                    if not first.startswith(b'%PDF'):
+                        raise Exception(f"Response is not a PDF: {response.headers.get('content-type', 'unknown')}")
+                    
+                    # Ensure directory exists
+                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                    
+                    # Write beside the target and move into place when done,
+                    # so an interrupted download never looks like a finished file
+                    part_path = f"{filepath}.part"
+                    try:
+                        with open(part_path, 'wb', buffering=1 << 20) as f:
+                            f.write(first)
+                            for chunk in chunks:
+                                f.write(chunk)
+                        os.replace(part_path, filepath)
+                    except BaseException:
+                        try:
+                            os.remove(part_path)
+                        except OSError:
+                            pass
+                        raise
+                
+                logger.info(f"Downloaded: {os.path.basename(filepath)}")
+                return True
                     
             except (requests.exceptions.RequestException, requests.exceptions.Timeout, 
                     requests.exceptions.ConnectionError, Exception) as e:
@@ -1804,6 +2295,69 @@ class PDRBot:
         
         return False
     
+    def _throttle(self, kind, delay):
+        """Wait until this thread may start its next request of this kind
+
+        Starts of each kind ('docket', 'download' or 'case') are spaced delay
+        seconds apart across all threads, the same politeness the sequential
+        loops got from sleeping between requests.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            next_at = self._next_request_at[kind]
+            wait = next_at - now
+            self._next_request_at[kind] = max(now, next_at) + delay
+        if wait > 0:
+            time.sleep(wait)
+
+    def _needs_download(self, path, url):
+        """Return False when path already holds the file at url
+
+        A nonempty local copy is checked with a HEAD request and kept when its
+        size matches Content-Length and the server's Last-Modified, if sent,
+        is no later than the local file's mtime. Anything uncertain (missing
+        or malformed header, failed HEAD) means download again.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return True
+        if st.st_size == 0:
+            return True
+        try:
+            response = self.session.head(url, timeout=self.request_timeout, allow_redirects=True)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD failed for {url}: {e}")
+            return True
+        try:
+            if int(response.headers['content-length']) != st.st_size:
+                return True
+        except (KeyError, ValueError):
+            return True
+        last_modified = response.headers.get('last-modified')
+        if last_modified is None:
+            return False
+        try:
+            remote_mtime = parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return True
+        if remote_mtime.tzinfo is None:
+            # HTTP dates are GMT
+            remote_mtime = remote_mtime.replace(tzinfo=timezone.utc)
+        # Replaced on the server since we downloaded it
+        return remote_mtime.timestamp() > st.st_mtime
+
+    @staticmethod
+    def _retry_after(exc):
+        """Seconds a 429/503 response asked us to wait via Retry-After, capped
+        at a minute; None when there is no usable header"""
+        response = getattr(exc, 'response', None)
+        if response is None or response.status_code not in (429, 503):
+            return None
+        value = response.headers.get('Retry-After', '').strip()
+        return min(int(value), 60) if value.isdigit() else None
+
     def get_with_retry(self, url, max_retries=None):
         """Make HTTP request with retry logic"""
         if max_retries is None:
@@ -1820,84 +2374,78 @@ class PDRBot:
                     requests.exceptions.ConnectionError) as e:
                 last_exception = e
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
+                    # Honour the server's Retry-After when it is rate limiting us,
+                    # else exponential backoff: 1, 2, 4 seconds
+                    wait_time = self._retry_after(e) or 2 ** attempt
                     logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {url} - {e}. Retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Failed to fetch {url} after {max_retries} attempts: {e}")
                     raise last_exception
     
-    def parse_criminal_causes(self, soup):
-        """Parse the Criminal Causes Decided section"""
-        criminal_cases = []
+    def parse_criminal_causes(self, content, coa_num=1):
+        """Parse the Criminal Causes Decided section of a docket page's HTML
         
-        # Look for the "Criminal Causes Decided" heading
-        criminal_heading = None
-        h3_elements = soup.find_all('h3')
-        for h3 in h3_elements:
-            if 'Criminal Causes Decided' in h3.get_text():
-                criminal_heading = h3
-                break
-        
-        if not criminal_heading:
+        coa_num is the court whose docket this is; it fills the court in
+        PDF links the site leaves as a JavaScript template.
+        """
+        criminal_cases = []
+        if _CRIMINAL_CAUSES_HEADING not in content:
             return criminal_cases
         
-        # Find the table that follows the heading
-        table = criminal_heading.find_next('table', class_='rgMasterTable')
-        if not table:
+        # Look for the "Criminal Causes Decided" heading and the grid table
+        # that follows it
+        tree = lxml_html.fromstring(content)
+        tables = _CRIMINAL_CAUSES_TABLE_XPATH(tree)
+        if not tables:
             return criminal_cases
         
         # Find all rows in the table body
-        tbody = table.find('tbody')
-        if not tbody:
+        tbody = tables[0].find('.//tbody')
+        if tbody is None:
             return criminal_cases
         
-        rows = tbody.find_all('tr', class_=['rgRow', 'rgAltRow'])
-        
-        for row in rows:
-            case_data = self.parse_case_row(row)
+        for row in _CASE_ROWS_XPATH(tbody):
+            case_data = self.parse_case_row(row, coa_num)
             if case_data:
                 criminal_cases.append(case_data)
         
         return criminal_cases
     
-    def parse_case_row(self, row):
-        """Parse a single case row"""
+    def parse_case_row(self, row, coa_num=1):
+        """Parse a single case row (an lxml <tr> element)"""
         try:
             # Find the case number link
-            case_link = row.find('a', href=re.compile(r'Case\.aspx\?cn=.*-CR'))
-            if not case_link:
+            case_link = next((a for a in row.iter('a') if _CASE_LINK_HREF_RE.search(a.get('href', ''))), None)
+            if case_link is None:
                 return None
             
-            case_number = self.extract_case_number(case_link.text.strip())
+            case_number = self.extract_case_number(case_link.text_content().strip())
             if not case_number:
                 return None
             
             # Find the disposition column - look for td with class "caseDisp"
             disposition = ""
-            disposition_cell = row.find('td', class_='caseDisp')
-            if disposition_cell:
-                disposition = disposition_cell.text.strip()
-            else:
-                # Fallback: try 3rd column if caseDisp class not found
-                cells = row.find_all('td')
-                if len(cells) >= 3:
-                    disposition = cells[2].text.strip()
+            # (falling back to the 3rd column if caseDisp class not found)
+            disposition_cells = _CASE_DISP_XPATH(row) or _THIRD_TD_XPATH(row)
+            if disposition_cells:
+                disposition = disposition_cells[0].text_content().strip()
             
             # Find all PDF links in this row
             pdf_links = []
-            doc_tables = row.find_all('table', class_='docGrid')
-            
-            for doc_table in doc_tables:
-                pdf_link = doc_table.find('a', href=re.compile(r'SearchMedia\.aspx'))
-                if pdf_link:
+            for doc_table in _DOC_GRID_XPATH(row):
+                pdf_link = next((a for a in doc_table.iter('a')
+                                 if _SEARCH_MEDIA_HREF_RE.search(a.get('href', ''))), None)
+                if pdf_link is not None:
                     # Get the description (opinion type)
-                    desc_cell = pdf_link.find_parent('td').find_previous_sibling('td')
-                    description = desc_cell.text.strip() if desc_cell else ""
+                    link_cell = next(pdf_link.iterancestors('td'), None)
+                    desc_cell = next(link_cell.itersiblings('td', preceding=True), None) if link_cell is not None else None
+                    description = desc_cell.text_content().strip() if desc_cell is not None else ""
                     
                     # Clean up the PDF URL
-                    href = pdf_link['href']
-                    href = href.replace('" + this.CurrentWebState.CurrentCourt + @"', 'coa01')
+                    href = pdf_link.get('href')
+                    if _COURT_TEMPLATE_MARKER in href:
+                        href = href.replace(_COURT_TEMPLATE_MARKER, f'coa{coa_num:02d}')
                     pdf_url = urljoin(self.base_url, href)
                     pdf_links.append({
                         'url': pdf_url,
@@ -1928,23 +2476,49 @@ class PDRBot:
         return order_map.get(opinion_type, 4)  # Unknown types go last
     
     def concatenate_pdfs(self, pdf_paths, output_path):
-        """Concatenate multiple PDF files into one"""
+        """Concatenate multiple PDF files into one
+
+        PyMuPDF copies pages at the PDF object level; without it, PyPDF2's
+        PdfWriter.append merges each file in one call instead of rebuilding
+        it page by page.
+        """
+        if os.path.exists(output_path):
+            logger.info(f"Combined file already exists: {os.path.basename(output_path)}")
+            return
+        
+        if fitz is not None:
+            with fitz.open() as combined:
+                for pdf_path in pdf_paths:
+                    if os.path.exists(pdf_path):
+                        try:
+                            with fitz.open(pdf_path) as src:
+                                combined.insert_pdf(src)
+                        except Exception as e:
+                            logger.error(f"Error reading PDF {pdf_path}: {e}")
+                # PyMuPDF refuses to save an empty document
+                if combined.page_count:
+                    combined.save(output_path)
+                    return
+        
         writer = PdfWriter()
         
         for pdf_path in pdf_paths:
             if os.path.exists(pdf_path):
                 try:
-                    reader = PdfReader(pdf_path)
-                    for page in reader.pages:
-                        writer.add_page(page)
+                    writer.append(pdf_path)
                 except Exception as e:
                     logger.error(f"Error reading PDF {pdf_path}: {e}")
         
         with open(output_path, 'wb') as output_file:
             writer.write(output_file)
     
-    def process_case_opinions(self, case_number, case_info, court_name, date, date_folder):
-        """Download and concatenate all opinions for a single case"""
+    def process_case_opinions(self, case_number, case_info, court_name, date, date_folder, pending_rows=None):
+        """Download and concatenate all opinions for a single case
+
+        When pending_rows is a list, the case's opinions row is appended to
+        it (in OPINION_INSERT_SQL order) for the caller to write with
+        save_opinions_bulk() instead of being saved immediately.
+        """
         opinions = case_info['opinions']
         temp_files = []
         downloaded_count = 0
@@ -1961,45 +2535,55 @@ class PDRBot:
         # Sort opinions: main (mem/op) first, then concurring, then dissenting
         sorted_opinions = sorted(opinions, key=lambda x: (x['sort_order'], x['justice_name'] or ''))
         
-        # Download individual opinion PDFs to temp files
-        failed_opinions = []
-        for opinion in sorted_opinions:
-            temp_path = os.path.join(date_folder, opinion['temp_filename'])
-            
-            if self.download_pdf(opinion['url'], temp_path):
-                temp_files.append(temp_path)
-                downloaded_count += 1
-            else:
-                failed_opinions.append(opinion)
-            
-            time.sleep(self.download_delay)  # Delay between downloads
-        
-        # Log failed downloads for visibility
-        if failed_opinions:
-            failed_descriptions = [op['description'] for op in failed_opinions]
-            logger.warning(f"Failed to download {len(failed_opinions)} opinions for case {case_number}: {', '.join(failed_descriptions)}")
-        
-        # Concatenate PDFs if we have multiple opinions, otherwise just rename
-        if len(temp_files) > 1:
-            logger.info(f"Concatenating {len(temp_files)} opinions for case {case_number}")
-            self.concatenate_pdfs(temp_files, final_filepath)
-        elif len(temp_files) == 1:
-            src_path = temp_files[0]
-            if os.path.exists(final_filepath):
-                logger.info(f"Combined file already exists, dropping stale temp: {src_path}")
-                try:
-                    os.remove(src_path)
-                except OSError:
-                    pass
-                return 0
-            if not os.path.exists(src_path):
-                logger.error(f"Temp file vanished before rename: {src_path}")
+        if len(sorted_opinions) == 1:
+            # Common case: a lone opinion is downloaded straight to the final
+            # path (download_pdf only moves it there once it is complete)
+            self._throttle('download', self.download_delay)
+            if not self.download_pdf(sorted_opinions[0]['url'], final_filepath):
+                logger.warning(f"No PDFs downloaded for case {case_number}")
                 return 0
-            shutil.move(src_path, final_filepath)
-            temp_files = []  # Don't delete the file we just renamed
         else:
-            logger.warning(f"No PDFs downloaded for case {case_number}")
-            return 0
+            # Download individual opinion PDFs to temp files. The parts are
+            # independent requests, so they are fetched together (still spaced
+            # by the download throttle); results are read back in sort order
+            # so the concatenation order is unchanged.
+            failed_opinions = []
+            temp_paths = [os.path.join(date_folder, opinion['temp_filename']) for opinion in sorted_opinions]
+            with ThreadPoolExecutor(max_workers=len(sorted_opinions)) as pool:
+                fetched = list(pool.map(self._fetch_opinion_part, sorted_opinions, temp_paths))
+            for opinion, temp_path, ok in zip(sorted_opinions, temp_paths, fetched):
+                if ok:
+                    temp_files.append(temp_path)
+                    downloaded_count += 1
+                else:
+                    failed_opinions.append(opinion)
+        
+            # Log failed downloads for visibility
+            if failed_opinions:
+                failed_descriptions = [op['description'] for op in failed_opinions]
+                logger.warning(f"Failed to download {len(failed_opinions)} opinions for case {case_number}: {', '.join(failed_descriptions)}")
+        
+            # Concatenate PDFs if we have multiple opinions, otherwise just rename
+            if len(temp_files) > 1:
+                logger.info(f"Concatenating {len(temp_files)} opinions for case {case_number}")
+                self.concatenate_pdfs(temp_files, final_filepath)
+            elif len(temp_files) == 1:
+                src_path = temp_files[0]
+                if os.path.exists(final_filepath):
+                    logger.info(f"Combined file already exists, dropping stale temp: {src_path}")
+                    try:
+                        os.remove(src_path)
+                    except OSError:
+                        pass
+                    return 0
+                if not os.path.exists(src_path):
+                    logger.error(f"Temp file vanished before rename: {src_path}")
+                    return 0
+                shutil.move(src_path, final_filepath)
+                temp_files = []  # Don't delete the file we just renamed
+            else:
+                logger.warning(f"No PDFs downloaded for case {case_number}")
+                return 0
         
         # Clean up temp files
         for temp_file in temp_files:
@@ -2009,7 +2593,7 @@ class PDRBot:
                 logger.warning(f"Could not delete temp file {temp_file}: {e}")
         
         # Generate case URL and save to database
-        case_url = f"https://search.txcourts.gov/Case.aspx?cn={case_number}"
+        case_url = f"{_CASE_URL_BASE}?cn={quote(case_number, safe='-')}"
         
         # Create summary of opinion types for database
         opinion_types = []
@@ -2027,32 +2611,51 @@ class PDRBot:
         pdf_urls_string = ';'.join(pdf_urls) if pdf_urls else None
         
         # Save to database
-        self.save_opinion_to_db(
-            case_number=case_number,
-            court=court_name,
-            opinion_date=date,
-            opinion_type=opinion_type_summary,
-            justice_name=justice_summary,
-            filename=final_filename,
-            file_path=final_filepath,
-            case_url=case_url,
-            pdf_url=pdf_urls_string
-        )
+        if pending_rows is not None:
+            pending_rows.append((case_number, court_name, date, opinion_type_summary, justice_summary,
+                                 final_filename, final_filepath, case_url, pdf_urls_string))
+        else:
+            self.save_opinion_to_db(
+                case_number=case_number,
+                court=court_name,
+                opinion_date=date,
+                opinion_type=opinion_type_summary,
+                justice_name=justice_summary,
+                filename=final_filename,
+                file_path=final_filepath,
+                case_url=case_url,
+                pdf_url=pdf_urls_string
+            )
         
         logger.info(f"Created combined opinion file: {final_filename}")
         return 1  # Return 1 for the combined file
     
+    OPINION_INSERT_SQL = '''
+        INSERT OR IGNORE INTO opinions
+        (case_number, court, opinion_date, opinion_type, justice_name, filename, file_path, case_url, pdf_url)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def _fetch_opinion_part(self, opinion, temp_path):
+        """Download one opinion of a multi-opinion case to its temp path,
+        returning whether the file is now on disk"""
+        self._throttle('download', self.download_delay)
+        
+        # A previous interrupted run may have left this opinion on disk
+        if not self._needs_download(temp_path, opinion['url']):
+            logger.info(f"Already downloaded: {opinion['temp_filename']}")
+            return True
+        
+        return self.download_pdf(opinion['url'], temp_path)
+    
     def save_opinion_to_db(self, case_number, court, opinion_date, opinion_type, justice_name, filename, file_path, case_url, pdf_url=None):
         """Save opinion information to database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO opinions
-                (case_number, court, opinion_date, opinion_type, justice_name, filename, file_path, case_url, pdf_url)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (case_number, court, opinion_date, opinion_type, justice_name, filename, file_path, case_url, pdf_url))
+            cursor.execute(self.OPINION_INSERT_SQL,
+                           (case_number, court, opinion_date, opinion_type, justice_name, filename, file_path, case_url, pdf_url))
 
             conn.commit()
             inserted = cursor.rowcount > 0
@@ -2062,7 +2665,7 @@ class PDRBot:
             # non-fatal; the row is cached either way for later retry.
             try:
                 case_styles.ensure_table(conn)
-                case_styles.get_or_fetch_style(conn, case_number)
+                case_styles.get_or_fetch_style(conn, case_number, session=self.session)
             except Exception as e:
                 logger.warning(f"case_styles fetch failed for {case_number}: {e}")
             return inserted
@@ -2070,10 +2673,43 @@ class PDRBot:
             logger.error(f"Error saving to database: {e}")
             return False
         finally:
-            conn.close()
+            self._release(conn)
+    
+    def save_opinions_bulk(self, rows):
+        """Save many opinions in one transaction
+
+        rows are tuples in OPINION_INSERT_SQL column order. Rows already in
+        the table are ignored, as in save_opinion_to_db. Returns the number
+        of rows inserted.
+        """
+        if not rows:
+            return 0
+        
+        conn = self._connect()
+        
+        try:
+            with conn:
+                inserted = conn.executemany(self.OPINION_INSERT_SQL, rows).rowcount
+            # Same best-effort caption lookup save_opinion_to_db does per row
+            try:
+                case_styles.ensure_table(conn)
+                for case_number in dict.fromkeys(row[0] for row in rows):
+                    case_styles.get_or_fetch_style(conn, case_number, session=self.session)
+            except Exception as e:
+                logger.warning(f"case_styles fetch failed: {e}")
+            return inserted
+        except Exception as e:
+            logger.error(f"Error saving opinions to database: {e}")
+            return 0
+        finally:
+            self._release(conn)
     
-    def scrape_court_date(self, coa_num, date, date_folder):
-        """Scrape opinions for a specific court and date"""
+    def scrape_court_date(self, coa_num, date, date_folder, pending_rows=None):
+        """Scrape opinions for a specific court and date
+
+        With pending_rows, the docket's opinions rows are appended to that
+        list for the caller to save instead of being saved here.
+        """
         url = self.get_docket_url(coa_num, date)
         date_str = date.strftime("%Y-%m-%d")
         court_name = f"COA{coa_num:02d}"
@@ -2081,9 +2717,9 @@ class PDRBot:
         logger.info(f"Scraping {court_name} for {date_str}")
         
         try:
+            self._throttle('docket', self.court_delay)
             response = self.get_with_retry(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            criminal_cases = self.parse_criminal_causes(soup)
+            criminal_cases = self.parse_criminal_causes(response.content, coa_num)
             
             if not criminal_cases:
                 logger.debug(f"No criminal cases found for {court_name} on {date_str}")
@@ -2131,17 +2767,27 @@ class PDRBot:
                     })
                     total_opinions_attempted += 1
             
-            # Process each case: download individual PDFs and concatenate
-            for case_number, case_info in case_opinions.items():
-                try:
-                    downloaded_count += self.process_case_opinions(
-                        case_number, case_info, court_name, date, date_folder
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing case {case_number}: {e}")
-                
-                # Be respectful with delays
-                time.sleep(self.download_delay)
+            # Process each case: download individual PDFs and concatenate.
+            # Downloads are network-bound, so several cases run at once;
+            # _throttle keeps request starts download_delay apart.
+            # The opinions rows are written together once the docket is done
+            # (or fails), in one transaction rather than one per case.
+            opinion_rows = [] if pending_rows is None else pending_rows
+            try:
+                with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+                    futures = {
+                        pool.submit(self.process_case_opinions, case_number, case_info, court_name,
+                                    date, date_folder, opinion_rows): case_number
+                        for case_number, case_info in case_opinions.items()
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            downloaded_count += future.result()
+                        except Exception as e:
+                            logger.error(f"Error processing case {futures[future]}: {e}")
+            finally:
+                if pending_rows is None:
+                    self.save_opinions_bulk(opinion_rows)
             
             logger.info(f"Downloaded {downloaded_count} files from {court_name} on {date_str}")
             if total_opinions_attempted > downloaded_count:
@@ -2153,6 +2799,28 @@ class PDRBot:
             logger.error(f"Error scraping {court_name} on {date_str}: {e}")
             return 0, 0
     
+    def scrape_courts(self, coa_nums, date, date_folder):
+        """Scrape several courts' dockets for one date concurrently
+
+        Yields (coa_num, cases_found, files_downloaded) as each court
+        finishes. Up to COURT_WORKERS courts run at once with docket fetches
+        started court_delay seconds apart; each court's opinions rows are
+        saved here, on the calling thread.
+        """
+        with ThreadPoolExecutor(max_workers=self.court_workers) as pool:
+            futures = {}
+            for coa_num in coa_nums:
+                rows = []
+                future = pool.submit(self.scrape_court_date, coa_num, date, date_folder, rows)
+                futures[future] = (coa_num, rows)
+            for future in as_completed(futures):
+                coa_num, rows = futures[future]
+                try:
+                    cases_found, files_downloaded = future.result()
+                finally:
+                    self.save_opinions_bulk(rows)
+                yield coa_num, cases_found, files_downloaded
+    
     def run_daily_scrape(self):
         """Run daily scrape for today's opinions and rollover courts from yesterday
         
@@ -2171,7 +2839,7 @@ class PDRBot:
         os.makedirs(date_folder, exist_ok=True)
         
         # Initialize run record
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO daily_runs (run_date, target_date, status)
@@ -2179,7 +2847,7 @@ class PDRBot:
         ''', (run_date, today))
         run_id = cursor.lastrowid
         conn.commit()
-        conn.close()
+        self._release(conn)
         
         total_cases = 0
         total_downloaded = 0
@@ -2191,22 +2859,17 @@ class PDRBot:
             rollover_courts = self.get_rollover_courts(yesterday)
             if rollover_courts:
                 logger.info(f"Checking {len(rollover_courts)} rollover courts from yesterday: {rollover_courts}")
-                for coa_num in rollover_courts:
-                    cases_found, files_downloaded = self.scrape_court_date(coa_num, yesterday, date_folder)
+                for _, cases_found, files_downloaded in self.scrape_courts(rollover_courts, yesterday, date_folder):
                     total_cases += cases_found
                     total_downloaded += files_downloaded
                     courts_checked += 1
-                    
-                    # Small delay between courts
-                    time.sleep(int(os.getenv('COURT_DELAY', '2')))
                 
                 # Clear processed rollover courts
                 self.clear_rollover_courts(yesterday)
             
             # Now scrape all 14 courts for today
             logger.info(f"Checking all courts for today's opinions ({today.strftime('%Y-%m-%d')})")
-            for coa_num in range(1, 15):
-                cases_found, files_downloaded = self.scrape_court_date(coa_num, today, date_folder)
+            for coa_num, cases_found, files_downloaded in self.scrape_courts(range(1, 15), today, date_folder):
                 total_cases += cases_found
                 total_downloaded += files_downloaded
                 courts_checked += 1
@@ -2214,18 +2877,15 @@ class PDRBot:
                 # Track courts with no opinions for rollover
                 if cases_found == 0:
                     courts_with_no_opinions.append(coa_num)
-                
-                # Small delay between courts
-                time.sleep(int(os.getenv('COURT_DELAY', '2')))
+            courts_with_no_opinions.sort()
             
             # Add courts with no opinions to rollover for tomorrow
             if courts_with_no_opinions:
                 logger.info(f"Adding {len(courts_with_no_opinions)} courts to rollover for tomorrow: {courts_with_no_opinions}")
-                for coa_num in courts_with_no_opinions:
-                    self.add_court_to_rollover(coa_num, today)
+                self.add_courts_to_rollover(courts_with_no_opinions, today)
             
             # Update run record as completed
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             cursor.execute('''
                 UPDATE daily_runs 
@@ -2234,7 +2894,7 @@ class PDRBot:
                 WHERE id = ?
             ''', (courts_checked, total_cases, total_downloaded, run_id))
             conn.commit()
-            conn.close()
+            self._release(conn)
             
             logger.info(f"Daily scrape completed!")
             logger.info(f"Courts checked: {courts_checked}")
@@ -2249,7 +2909,7 @@ class PDRBot:
             
         except Exception as e:
             # Update run record with error
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             cursor.execute('''
                 UPDATE daily_runs 
@@ -2258,7 +2918,7 @@ class PDRBot:
                 WHERE id = ?
             ''', (courts_checked, total_cases, total_downloaded, str(e), run_id))
             conn.commit()
-            conn.close()
+            self._release(conn)
             
             logger.error(f"Daily scrape failed: {e}")
             raise
@@ -2274,7 +2934,8 @@ class PDRBot:
         
         try:
             # Create PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=letter,
+            pdf_buffer = io.BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=letter,
                                   rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
             
             # Create custom styles
@@ -2335,6 +2996,7 @@ class PDRBot:
             
             # Build PDF
             doc.build(story)
+            self._write_pdf(output_path, pdf_buffer)
             logger.info(f"Prompt PDF generated: {output_path}")
             return output_path
             
@@ -2353,7 +3015,7 @@ class PDRBot:
         wins = wins or []
         counsel_by_case = counsel_by_case or {}
         # Build case cards
-        case_cards_html = ""
+        case_cards = []
         if interesting_count > 0:
             for result in results:
                 case_number = result[0]
@@ -2406,7 +3068,7 @@ class PDRBot:
                     first_pdf = pdf_url.split(';')[0]
                     link_html += f' &middot; <a href="{first_pdf}" style="color:#2874a6;text-decoration:none;">Opinion PDF</a>'
 
-                case_cards_html += f"""
+                case_cards.append(f"""
                 <tr><td style="padding:10px 16px;border-bottom:1px solid #eee;">
                     <div style="font-size:15px;font-weight:bold;color:#1a1a1a;">
                         {case_label} <span style="font-weight:normal;color:#666;">({court})</span>{score_badge}
@@ -2414,12 +3076,13 @@ class PDRBot:
                     {headlines_html}
                     {counsel_html}
                     <div style="margin-top:4px;font-size:12px;">{link_html}</div>
-                </td></tr>"""
+                </td></tr>""")
+        case_cards_html = "".join(case_cards)
 
         # Defense-wins section (top of the email).
         wins_html = ""
         if wins:
-            win_cards = ""
+            win_cards = []
             for w in wins:
                 links = (
                     f'<a href="{w["case_url"]}" style="color:#1e8449;text-decoration:none;">Case page</a>'
@@ -2431,7 +3094,7 @@ class PDRBot:
                     )
                 counsel_html = self._counsel_html(
                     w.get("counsel", []), color="#1e8449")
-                win_cards += f'''
+                win_cards.append(f'''
                 <tr><td style="padding:10px 16px;border-bottom:1px solid #d5e8d4;background:#f4faf4;">
                     <div style="font-size:15px;font-weight:bold;color:#145a32;">{w['style']}</div>
                     <div style="margin-top:2px;font-size:13px;color:#333;">{w['case_number']}
@@ -2440,14 +3103,14 @@ class PDRBot:
                     </div>
                     {counsel_html}
                     <div style="margin-top:4px;font-size:12px;">{links}</div>
-                </td></tr>'''
+                </td></tr>''')
             wins_html = f'''
     <tr><td style="padding:12px 24px;background:#eaf7ea;border-bottom:1px solid #d5e8d4;">
         <div style="font-size:16px;font-weight:bold;color:#145a32;">&#127942; Defense Wins</div>
     </td></tr>
     <tr><td style="padding:0;">
         <table width="100%" cellpadding="0" cellspacing="0">
-            {win_cards}
+            {''.join(win_cards)}
         </table>
     </td></tr>'''
 
@@ -2492,19 +3155,20 @@ class PDRBot:
         wins = wins or []
         counsel_by_case = counsel_by_case or {}
         if wins:
-            wins_section = "DEFENSE WINS\n\n"
+            parts = ["DEFENSE WINS\n\n"]
             for w in wins:
-                wins_section += (
+                parts.append(
                     f"  {w['style']}\n"
                     f"    {w['case_number']} ({w['court']}, {w['date']}) -- {w['disposition']}\n"
                 )
-                wins_section += self._counsel_plain_lines(
-                    w.get("counsel", []), label="Defense counsel")
-                wins_section += f"    {w['case_url']}\n\n"
+                parts.append(self._counsel_plain_lines(
+                    w.get("counsel", []), label="Defense counsel"))
+                parts.append(f"    {w['case_url']}\n\n")
+            wins_section = "".join(parts)
         else:
             wins_section = "No new defense wins on the COA dockets.\n\n"
         if interesting_count > 0:
-            cases_section = f"{interesting_count} case(s) with interesting issues:\n\n"
+            parts = [f"{interesting_count} case(s) with interesting issues:\n\n"]
             for result in results:
                 case_number = result[0]
                 court = result[1]
@@ -2520,16 +3184,16 @@ class PDRBot:
                 score_str = f" [PDR {pdr_score}/10]" if pdr_score else ""
                 headlines = self.extract_headlines_from_analysis(analysis_text)
                 if headlines:
-                    cases_section += f"  {case_label}{score_str}\n"
-                    for hl in headlines:
-                        cases_section += f"    - {hl}\n"
+                    parts.append(f"  {case_label}{score_str}\n")
+                    parts.extend(f"    - {hl}\n" for hl in headlines)
                 else:
                     issue_word = "issue" if issue_count == 1 else "issues"
-                    cases_section += f"  {case_label}{score_str} -- {issue_count} {issue_word}\n"
-                cases_section += self._counsel_plain_lines(
+                    parts.append(f"  {case_label}{score_str} -- {issue_count} {issue_word}\n")
+                parts.append(self._counsel_plain_lines(
                     counsel_by_case.get(case_number, []),
-                    label="Defense counsel")
-                cases_section += "\n"
+                    label="Defense counsel"))
+                parts.append("\n")
+            cases_section = "".join(parts)
         else:
             cases_section = "No interesting issues were identified."
 
@@ -2656,52 +3320,46 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             report_filename = os.path.basename(report_path)
 
         try:
-            successful_sends = 0
-            with self.smtp_connection() as server:
-                for recipient in all_recipients:
-                    try:
-                        msg = MIMEMultipart('alternative')
-                        msg['From'] = self.email_from
-                        msg['To'] = recipient
-                        msg['Subject'] = subject
-
-                        # RFC 8058 one-click unsubscribe — required for Gmail/Yahoo deliverability.
-                        unsub_address = os.getenv('UNSUBSCRIBE_EMAIL', self.subscription_email or self.email_from)
-                        msg['List-Unsubscribe'] = f'<mailto:{unsub_address}?subject=unsubscribe>'
-                        msg['List-Unsubscribe-Post'] = 'List-Unsubscribe=One-Click'
-
-                        # Plain-text first, HTML second (clients prefer last)
-                        msg.attach(MIMEText(plain_body, 'plain'))
-                        msg.attach(MIMEText(html_body, 'html'))
-
-                        if report_data is not None:
-                            # Attach report PDF.
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(report_data)
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename="{report_filename}"'
-                            )
-                            outer = MIMEMultipart('mixed')
-                            outer['From'] = msg['From']
-                            outer['To'] = msg['To']
-                            outer['Subject'] = msg['Subject']
-                            outer['List-Unsubscribe'] = msg['List-Unsubscribe']
-                            outer['List-Unsubscribe-Post'] = msg['List-Unsubscribe-Post']
-                            outer.attach(msg)
-                            outer.attach(part)
-                            envelope = outer
-                        else:
-                            envelope = msg
+            # The message is identical for every recipient apart from To, so
+            # build and flatten it - PDF base64 included - once
+            msg = MIMEMultipart('alternative')
+            msg['From'] = self.email_from
+            msg['To'] = _RECIPIENT_PLACEHOLDER
+            msg['Subject'] = subject
 
-                        server.sendmail(self.email_from, [recipient], envelope.as_string())
-                        logger.info(f"Email sent to {recipient}")
-                        successful_sends += 1
+            # RFC 8058 one-click unsubscribe — required for Gmail/Yahoo deliverability.
+            unsub_address = os.getenv('UNSUBSCRIBE_EMAIL', self.subscription_email or self.email_from)
+            msg['List-Unsubscribe'] = f'<mailto:{unsub_address}?subject=unsubscribe>'
+            msg['List-Unsubscribe-Post'] = 'List-Unsubscribe=One-Click'
 
-                    except Exception as e:
-                        logger.error(f"Failed to send email to {recipient}: {e}")
-                        continue
+            # Plain-text first, HTML second (clients prefer last)
+            msg.attach(MIMEText(plain_body, 'plain'))
+            msg.attach(MIMEText(html_body, 'html'))
+
+            if report_data is not None:
+                # Attach report PDF.
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(report_data)
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename="{report_filename}"'
+                )
+                outer = MIMEMultipart('mixed')
+                outer['From'] = msg['From']
+                outer['To'] = msg['To']
+                outer['Subject'] = msg['Subject']
+                outer['List-Unsubscribe'] = msg['List-Unsubscribe']
+                outer['List-Unsubscribe-Post'] = msg['List-Unsubscribe-Post']
+                outer.attach(msg)
+                outer.attach(part)
+                envelope = outer
+            else:
+                envelope = msg
+            wire = envelope.as_bytes(policy=_SMTP_WIRE_POLICY)
+            placeholder = _RECIPIENT_PLACEHOLDER.encode('ascii')
+
+            successful_sends = self._send_report_bulk(all_recipients, wire, placeholder)
 
             if successful_sends > 0:
                 logger.info(f"Sent emails to {successful_sends}/{len(all_recipients)} recipients")
@@ -2719,6 +3377,73 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             logger.error(f"Failed to send emails: {e}")
             return False
 
+    def _send_report_bulk(self, recipients, wire, placeholder):
+        """Send the flattened report to every recipient, returning how many
+        were sent
+
+        Up to email_workers SMTP connections are opened first and shared by
+        a thread pool, each send borrowing an idle one. A dropped connection
+        (or 421) is replaced and other transient 4xx replies are retried
+        with backoff; failures are logged per recipient. Failing to open
+        even one connection raises, as a single connection did before.
+        """
+        with ExitStack() as stack:
+            stack_lock = threading.Lock()
+            idle = queue.Queue()
+            wanted = min(self.email_workers, len(recipients))
+            for i in range(wanted):
+                try:
+                    idle.put(stack.enter_context(self.smtp_connection()))
+                except Exception as e:
+                    if i == 0:
+                        raise
+                    logger.warning(f"Opened only {i} of {wanted} SMTP connections: {e}")
+                    break
+            
+            def reconnect(server):
+                server.close()
+                with stack_lock:
+                    return stack.enter_context(self.smtp_connection())
+            
+            def send(recipient):
+                data = wire.replace(placeholder, recipient.encode('ascii'))
+                attempts = max(1, self.max_retries)
+                server = idle.get()
+                try:
+                    for attempt in range(attempts):
+                        try:
+                            server.sendmail(self.email_from, [recipient], data)
+                            return
+                        except smtplib.SMTPServerDisconnected:
+                            # Providers cap messages or idle time per connection
+                            if attempt == attempts - 1:
+                                raise
+                            logger.warning(f"SMTP connection dropped before {recipient}; reconnecting")
+                            server = reconnect(server)
+                        except smtplib.SMTPResponseException as e:
+                            if not 400 <= e.smtp_code < 500 or attempt == attempts - 1:
+                                raise
+                            logger.warning(f"SMTP {e.smtp_code} for {recipient}; retrying in {2 ** attempt}s")
+                            time.sleep(2 ** attempt)
+                            if e.smtp_code == 421:
+                                server = reconnect(server)
+                finally:
+                    idle.put(server)
+            
+            sent = 0
+            with ThreadPoolExecutor(max_workers=idle.qsize()) as pool:
+                futures = {pool.submit(send, recipient): recipient for recipient in recipients}
+                for future in as_completed(futures):
+                    recipient = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to send email to {recipient}: {e}")
+                        continue
+                    logger.info(f"Email sent to {recipient}")
+                    sent += 1
+            return sent
+
     def send_test_email(self, recipient_email):
         """Send a test email to a specific recipient"""
         if not self.email_enabled:
@@ -2764,7 +3489,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
 
     def check_execution_errors(self, date_str):
         """Check for execution errors on a given date and return count"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -2774,12 +3499,12 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         ''', (date_str,))
 
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
         return count
 
     def retry_execution_errors(self, date_str):
         """Retry all cases with execution errors for a given date"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -2790,7 +3515,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         ''', (date_str,))
 
         error_cases = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         if not error_cases:
             return 0
@@ -2810,7 +3535,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             # Analyze
             analysis_result = self.analyze_opinion_with_claude(text_content, case_number)
 
-            if not analysis_result or "execution error" in analysis_result.lower():
+            if not analysis_result or _EXECUTION_ERROR_RE.search(analysis_result):
                 logger.warning(f"Still getting execution error for {case_number}")
                 continue
 
@@ -2830,7 +3555,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         """Return per-court list of (court, days_since_last_interesting). Any
         court past threshold_days is flagged stale — usually a scraper regression.
         Returns a list of dicts; empty if all courts are current or have no history."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("""
             SELECT o.court,
@@ -2842,7 +3567,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             GROUP BY o.court
         """)
         rows = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         stale = []
         for court, last, days in rows:
             if days is None:
@@ -2858,7 +3583,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         rate. A disagreement is when Opus identifies any interesting issue on
         a case Haiku classified ROUTINE — i.e., a false negative.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("""
             SELECT a.id, a.case_number, a.analysis_text, o.file_path, o.court
@@ -2869,7 +3594,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             LIMIT ?
         """, (sample_size,))
         samples = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         if not samples:
             print("No Haiku-ROUTINE analyses on record yet.")
@@ -2888,7 +3613,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                 errors += 1
                 print(f"  [SKIP] {case_num}: PDF extraction failed")
                 continue
-            full_prompt = f"{self.analysis_prompt}\n\n--- OPINION TEXT ---\n{text}"
+            full_prompt = self.analysis_prompt_prefix + text
             try:
                 opus_text = call_claude_with_retry(
                     prompt=full_prompt,
@@ -2941,7 +3666,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         logger.info(f"Starting new daily automation for {date_str}")
         
         # Create run record
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO daily_runs (run_date, target_date, status)
@@ -2949,7 +3674,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         ''', (datetime.now().date(), target_date, 'running'))
         run_id = cursor.lastrowid
         conn.commit()
-        conn.close()
+        self._release(conn)
         
         try:
             # Step 1: Scrape opinions
@@ -2962,7 +3687,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             # business days share today's run, so a date-filtered count
             # would skip them whenever today's courts have not yet posted.
             if self.analysis_enabled:
-                unanalyzed_count = len(self.get_unanalyzed_opinions())
+                unanalyzed_count = self.count_unanalyzed_opinions()
                 if unanalyzed_count > 0:
                     logger.info(f"Step 2: Running analysis on {unanalyzed_count} cases...")
                     self.update_run_state(run_id, status='analyzing')
@@ -3088,7 +3813,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
 
     def get_run_state(self, run_id):
         """Get the current state of a run"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -3099,7 +3824,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         ''', (run_id,))
         
         result = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         
         if result:
             return {
@@ -3115,42 +3840,21 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
     def update_run_state(self, run_id, status=None, courts_checked=None, 
                         cases_found=None, files_downloaded=None, error_message=None):
         """Update the state of a run"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        updates = []
-        params = []
-        
-        if status is not None:
-            updates.append("status = ?")
-            params.append(status)
-        if courts_checked is not None:
-            updates.append("total_courts_checked = ?")
-            params.append(courts_checked)
-        if cases_found is not None:
-            updates.append("total_cases_found = ?")
-            params.append(cases_found)
-        if files_downloaded is not None:
-            updates.append("total_files_downloaded = ?")
-            params.append(files_downloaded)
-        if error_message is not None:
-            updates.append("error_message = ?")
-            params.append(error_message)
-        
-        if updates:
-            params.append(run_id)
-            cursor.execute(f'''
-                UPDATE daily_runs 
-                SET {", ".join(updates)}
-                WHERE id = ?
-            ''', params)
-            conn.commit()
+        values = (status, courts_checked, cases_found, files_downloaded, error_message)
+        columns = tuple(col for col, value in zip(_RUN_STATE_COLUMNS, values) if value is not None)
+        if not columns:
+            return
+        params = [value for value in values if value is not None]
+        params.append(run_id)
         
-        conn.close()
+        conn = self._connect()
+        conn.execute(_run_state_update_sql(columns), params)
+        conn.commit()
+        self._release(conn)
     
     def _get_last_completed_date(self):
         """Return the target_date of the most recent completed daily run, or None."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT target_date FROM daily_runs
@@ -3159,33 +3863,33 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             LIMIT 1
         ''')
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         return str(row[0]) if row else None
 
     def find_incomplete_runs(self, target_date=None):
         """Find runs that were interrupted and can be resumed"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         if target_date:
-            cursor.execute('''
+            cursor.execute(f'''
                 SELECT id, run_date, target_date, status, total_courts_checked,
                        total_cases_found, total_files_downloaded
                 FROM daily_runs 
-                WHERE target_date = ? AND status IN ('running', 'scraping', 'analyzing', 'reporting')
+                WHERE target_date = ? AND {_INCOMPLETE_RUN_FILTER}
                 ORDER BY run_timestamp DESC
             ''', (target_date,))
         else:
-            cursor.execute('''
+            cursor.execute(f'''
                 SELECT id, run_date, target_date, status, total_courts_checked,
                        total_cases_found, total_files_downloaded
                 FROM daily_runs 
-                WHERE status IN ('running', 'scraping', 'analyzing', 'reporting')
+                WHERE {_INCOMPLETE_RUN_FILTER}
                 ORDER BY run_timestamp DESC
             ''')
         
         results = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         
         return results
     
@@ -3213,7 +3917,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                 self.resume_daily_scrape(run_id, target_date)
             
             # Check if analysis is needed
-            unanalyzed_count = len(self.get_unanalyzed_opinions())
+            unanalyzed_count = self.count_unanalyzed_opinions()
             if unanalyzed_count > 0 and self.analysis_enabled:
                 logger.info(f"Resuming analysis phase... {unanalyzed_count} cases to analyze")
                 self.update_run_state(run_id, status='analyzing')
@@ -3256,7 +3960,7 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         Returns only one opinion per unique file_path to avoid analyzing
         the same PDF multiple times for consolidated cases.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -3268,8 +3972,8 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             ORDER BY o.case_number
         ''', (target_date,))
 
-        results = cursor.fetchall()
-        conn.close()
+        results = [UnanalyzedOpinion._make(row) for row in cursor.fetchall()]
+        self._release(conn)
         return results
     
     def resume_daily_scrape(self, run_id, target_date):
@@ -3294,25 +3998,18 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                 rollover_courts = self.get_rollover_courts(yesterday)
                 if rollover_courts:
                     logger.info(f"Resuming: checking {len(rollover_courts)} rollover courts from yesterday")
-                    for coa_num in rollover_courts:
-                        cases_found, files_downloaded = self.scrape_court_date(coa_num, yesterday, date_folder)
+                    for _, cases_found, files_downloaded in self.scrape_courts(rollover_courts, yesterday,
+                                                                                date_folder):
                         total_cases += cases_found
                         total_downloaded += files_downloaded
                         courts_checked += 1
-                        time.sleep(int(os.getenv('COURT_DELAY', '2')))
                     self.clear_rollover_courts(yesterday)
             
-            for coa_num in range(1, 15):  # Courts 1-14
+            # Courts 1-14
+            for coa_num, cases_found, files_downloaded in self.scrape_courts(range(1, 15), target_date,
+                                                                            date_folder):
                 try:
                     courts_checked += 1
-                    logger.info(f"Scraping COA{coa_num:02d} for {target_date.strftime('%Y-%m-%d')}")
-                    
-                    # Update progress
-                    self.update_run_state(run_id, courts_checked=courts_checked)
-                    
-                    # Scrape this court
-                    cases_found, files_downloaded = self.scrape_court_date(coa_num, target_date, date_folder)
-                    
                     total_cases += cases_found
                     total_downloaded += files_downloaded
                     
@@ -3320,8 +4017,9 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                     if target_date == today and cases_found == 0:
                         courts_with_no_opinions.append(coa_num)
                     
-                    # Update progress
-                    self.update_run_state(run_id, cases_found=total_cases, 
+                    # Update progress - one UPDATE and commit per court
+                    self.update_run_state(run_id, courts_checked=courts_checked,
+                                        cases_found=total_cases,
                                         files_downloaded=total_downloaded)
                     
                     if files_downloaded > 0:
@@ -3329,18 +4027,15 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                     elif cases_found > 0:
                         logger.warning(f"Failed to download {cases_found} out of {cases_found} opinions for COA{coa_num:02d} on {target_date.strftime('%Y-%m-%d')}")
                     
-                    # Small delay between courts
-                    time.sleep(self.download_delay)
-                    
                 except Exception as e:
                     logger.error(f"Error scraping COA{coa_num:02d}: {e}")
                     continue
+            courts_with_no_opinions.sort()
             
             # Add courts with no opinions to rollover for tomorrow (only for today's date)
             if target_date == today and courts_with_no_opinions:
                 logger.info(f"Adding {len(courts_with_no_opinions)} courts to rollover for tomorrow: {courts_with_no_opinions}")
-                for coa_num in courts_with_no_opinions:
-                    self.add_court_to_rollover(coa_num, target_date)
+                self.add_courts_to_rollover(courts_with_no_opinions, target_date)
             
             # Final update
             self.update_run_state(run_id, status='scrape_completed', 
@@ -3359,13 +4054,24 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             raise
 
     def load_members(self):
-        """Load members from the members file"""
+        """Load members from the members file
+
+        The parsed list is cached against the file's mtime and size, so
+        repeated calls only re-read it once it has changed on disk.
+        """
         try:
-            if os.path.exists(self.members_file):
-                with open(self.members_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('members', [])
-            return []
+            try:
+                st = os.stat(self.members_file)
+            except FileNotFoundError:
+                return []
+            cache = self._members_cache
+            if cache is not None and cache[:2] == (st.st_mtime_ns, st.st_size):
+                return list(cache[2])
+            with open(self.members_file, 'r') as f:
+                data = json.load(f)
+            members = data.get('members', [])
+            self._members_cache = (st.st_mtime_ns, st.st_size, tuple(members))
+            return members
         except Exception as e:
             logger.error(f"Error loading members file: {e}")
             return []
@@ -3382,8 +4088,14 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                 'total_members': len(members)
             }
             
-            with open(self.members_file, 'w') as f:
+            # Write a temp file and swap it in so a crash mid-write can never
+            # leave a truncated members file behind
+            tmp_path = f"{self.members_file}.tmp"
+            with open(tmp_path, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.members_file)
+            st = os.stat(self.members_file)
+            self._members_cache = (st.st_mtime_ns, st.st_size, tuple(members))
             
             logger.info(f"Saved {len(members)} members to {self.members_file}")
             return True
@@ -3391,14 +4103,43 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             logger.error(f"Error saving members file: {e}")
             return False
     
+    def _members_for_update(self):
+        """Members as an insertion-ordered dict for O(1) lookup and removal;
+        the shared batch dict inside batched_member_updates()"""
+        if self._members_batch is not None:
+            return self._members_batch
+        return dict.fromkeys(self.load_members())
+    
+    def _commit_members(self, members):
+        """Persist members from _members_for_update(), or mark the batch
+        dirty so it is written once when the batch ends"""
+        if members is self._members_batch:
+            self._members_batch_dirty = True
+            return True
+        return self.save_members(list(members))
+    
+    @contextmanager
+    def batched_member_updates(self):
+        """Defer add_member/remove_member writes to a single save on exit"""
+        self._members_batch = dict.fromkeys(self.load_members())
+        self._members_batch_dirty = False
+        try:
+            yield
+        finally:
+            members, dirty = self._members_batch, self._members_batch_dirty
+            self._members_batch = None
+            self._members_batch_dirty = False
+            if dirty:
+                self.save_members(list(members))
+    
     def add_member(self, email_address):
         """Add a new member to the subscription list"""
-        members = self.load_members()
+        members = self._members_for_update()
         email_address = email_address.lower().strip()
         
         if email_address not in members:
-            members.append(email_address)
-            if self.save_members(members):
+            members[email_address] = None
+            if self._commit_members(members):
                 logger.info(f"Added new member: {email_address}")
                 return True
         else:
@@ -3409,12 +4150,12 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
     
     def remove_member(self, email_address):
         """Remove a member from the subscription list"""
-        members = self.load_members()
+        members = self._members_for_update()
         email_address = email_address.lower().strip()
         
         if email_address in members:
-            members.remove(email_address)
-            if self.save_members(members):
+            del members[email_address]
+            if self._commit_members(members):
                 logger.info(f"Removed member: {email_address}")
                 return True
         else:
@@ -3431,8 +4172,8 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
         # Add dynamic members
         members = self.load_members()
         
-        # Combine and deduplicate
-        all_recipients = list(set(static_recipients + members))
+        # Combine and deduplicate, keeping static recipients first
+        all_recipients = list(dict.fromkeys(static_recipients + members))
         
         return all_recipients
     
@@ -3466,60 +4207,90 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             logger.error(f"Error saving last check time: {e}")
             return False
     
-    def check_subscription_emails(self):
-        """Check the subscription mailbox for subscribe/unsubscribe requests"""
+    def _subscription_config_complete(self):
         if not all([self.subscription_email, self.subscription_auth_user, self.subscription_password]):
             logger.warning("Subscription email configuration incomplete")
             return False
+        return True
+    
+    def _open_subscription_mailbox(self):
+        """Log in to the subscription mailbox and select its folder"""
+        mail = imaplib.IMAP4_SSL(self.subscription_imap_host, self.subscription_imap_port)
+        mail.login(self.subscription_auth_user, self.subscription_password)
         
+        # Try PDRbot folder first, then fallback to main INBOX
         try:
-            # Connect to IMAP server
-            mail = imaplib.IMAP4_SSL(self.subscription_imap_host, self.subscription_imap_port)
-            mail.login(self.subscription_auth_user, self.subscription_password)
-            
-            # Try PDRbot folder first, then fallback to main INBOX
-            try:
-                status, data = mail.select('INBOX/PDRbot')
-                if status != 'OK':
-                    mail.select('INBOX')
-                    logger.info("Using main INBOX folder for subscription emails")
-                else:
-                    logger.info("Using INBOX/PDRbot folder for subscription emails")
-            except:
+            status, data = mail.select('INBOX/PDRbot')
+            if status != 'OK':
                 mail.select('INBOX')
-                logger.info("Fallback to main INBOX folder for subscription emails")
-            
-            # UID-based incremental search: idempotent, not spoofable via Date header.
-            mailbox_key = 'subscription'
-            last_uid = self._get_last_imap_uid(mailbox_key)
-            search_criteria = f'{last_uid + 1}:*' if last_uid else 'ALL'
-            status, message_ids = mail.uid('search', None, search_criteria)
+                logger.info("Using main INBOX folder for subscription emails")
+            else:
+                logger.info("Using INBOX/PDRbot folder for subscription emails")
+        except:
+            mail.select('INBOX')
+            logger.info("Fallback to main INBOX folder for subscription emails")
+        return mail
+    
+    def _process_subscription_mailbox(self, mail):
+        """Handle subscribe/unsubscribe requests that arrived since the last pass
 
-            if status != 'OK':
-                logger.error("Failed to search for emails by UID")
-                return False
+        `mail` is a logged-in connection from _open_subscription_mailbox();
+        it is left open with its folder selected.
+        """
+        # UID-based incremental search: idempotent, not spoofable via Date header.
+        mailbox_key = 'subscription'
+        last_uid = self._get_last_imap_uid(mailbox_key)
+        search_criteria = f'{last_uid + 1}:*' if last_uid else 'ALL'
+        status, message_ids = mail.uid('search', None, search_criteria)
+
+        if status != 'OK':
+            logger.error("Failed to search for emails by UID")
+            return False
 
-            message_ids = message_ids[0].split()
-            # UID SEARCH 'N:*' returns the last message even when there are none newer.
-            if last_uid:
-                message_ids = [mid for mid in message_ids if int(mid) > last_uid]
-            logger.info(f"Found {len(message_ids)} new emails since UID {last_uid}")
-            max_uid_seen = last_uid
-            processed_count = 0
-            
+        message_ids = message_ids[0].split()
+        # UID SEARCH 'N:*' returns the last message even when there are none newer.
+        if last_uid:
+            message_ids = [mid for mid in message_ids if int(mid) > last_uid]
+        logger.info(f"Found {len(message_ids)} new emails since UID {last_uid}")
+        max_uid_seen = last_uid
+        processed_count = 0
+        
+        # Confirmations share one SMTP login, opened for the first one
+        smtp = ExitStack()
+        smtp_server = None
+        
+        def confirm(recipient, action):
+            nonlocal smtp_server
+            if smtp_server is None:
+                try:
+                    smtp_server = smtp.enter_context(self.smtp_connection())
+                except Exception as e:
+                    logger.error(f"Error sending confirmation email to {recipient}: {e}")
+                    return
+            if not self.send_confirmation_email(recipient, action, server=smtp_server):
+                # The connection may have dropped; log in afresh next time
+                smtp.close()
+                smtp_server = None
+        
+        # Member changes from this pass are written to disk once
+        with smtp, self.batched_member_updates():
             for msg_id in message_ids:
                 try:
                     uid_int = int(msg_id)
                     if uid_int > max_uid_seen:
                         max_uid_seen = uid_int
-                    # Fetch email by UID
-                    status, msg_data = mail.uid('fetch', msg_id, '(RFC822)')
-                    if status != 'OK':
+                    # Fetch just the headers by UID. BODY.PEEK leaves \Seen
+                    # alone until the explicit STORE below.
+                    status, msg_data = mail.uid('fetch', msg_id, '(BODY.PEEK[HEADER.FIELDS '
+                                                '(FROM SUBJECT DATE MIME-VERSION CONTENT-TYPE '
+                                                'CONTENT-TRANSFER-ENCODING)])')
+                    if status != 'OK' or not isinstance(msg_data[0], tuple):
                         continue
-                    
+                    raw_headers = msg_data[0][1]
+                
                     # Parse email
-                    email_message = email.message_from_bytes(msg_data[0][1])
-                    
+                    email_message = email.message_from_bytes(raw_headers)
+                
                     # Check if email date is actually after last check
                     email_date_str = email_message.get('Date')
                     if email_date_str:
@@ -3530,63 +4301,189 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
                                 continue
                         except Exception:
                             pass  # If we can't parse the date, process the email anyway
-                    
+                
                     sender = email_message.get('From')
                     subject = email_message.get('Subject', '')
-                    
+                
                     # Extract sender email address
                     if '<' in sender and '>' in sender:
                         sender_email = sender.split('<')[1].split('>')[0]
                     else:
                         sender_email = sender
-                    
+                
                     # Get email body and subject
-                    body = self.get_email_body(email_message)
                     subject = email_message.get('Subject', '').lower().strip()
-                    
+                    if subject == 'subscribe':
+                        # Subscribes regardless of the body; skip fetching it
+                        body = None
+                    else:
+                        # Keywords only count at the start of the body, so
+                        # the first 16KB is plenty even for HTML newsletters
+                        status, body_data = mail.uid('fetch', msg_id, '(BODY.PEEK[TEXT]<0.16384>)')
+                        if status == 'OK' and isinstance(body_data[0], tuple):
+                            email_message = email.message_from_bytes(raw_headers + body_data[0][1])
+                        body = self.get_email_body(email_message)
+                
                     # Check both body and subject for subscription keywords
-                    body_lower = body.lower().strip() if body else ""
-                    is_subscribe = body_lower.startswith('subscribe') or subject == 'subscribe'
-                    is_unsubscribe = body_lower.startswith('unsubscribe') or subject == 'unsubscribe'
-                    
+                    keyword = _SUBSCRIPTION_KEYWORD_RE.match(body) if body else None
+                    is_subscribe = (keyword is not None and not keyword.group(1)) or subject == 'subscribe'
+                    is_unsubscribe = (keyword is not None and bool(keyword.group(1))) or subject == 'unsubscribe'
+                
                     if is_subscribe:
                         if self.add_member(sender_email):
-                            self.send_confirmation_email(sender_email, 'subscribed')
+                            confirm(sender_email, 'subscribed')
                             source = 'subject' if subject == 'subscribe' else 'body'
                             logger.info(f"Processed subscription request from {sender_email} (via {source})")
                             processed_count += 1
-                    
+                
                     elif is_unsubscribe:
                         if self.remove_member(sender_email):
-                            self.send_confirmation_email(sender_email, 'unsubscribed')
+                            confirm(sender_email, 'unsubscribed')
                             source = 'subject' if subject == 'unsubscribe' else 'body'
                             logger.info(f"Processed unsubscription request from {sender_email} (via {source})")
                             processed_count += 1
-                    
-                    # Mark as read to avoid reprocessing
-                    mail.store(msg_id, '+FLAGS', '\\Seen')
-                    
+                
+                    # Mark as read to avoid reprocessing (msg_id is a UID)
+                    mail.uid('store', msg_id, '+FLAGS', '\\Seen')
+                
                 except Exception as e:
                     logger.error(f"Error processing email {msg_id}: {e}")
                     continue
-            
+        
+        # Save the current time as the last check time
+        if max_uid_seen > last_uid:
+            self._set_last_imap_uid(mailbox_key, max_uid_seen)
+        self.save_last_subscription_check(datetime.now())
+        
+        if processed_count > 0:
+            logger.info(f"Processed {processed_count} subscription requests")
+        
+        return True
+    
+    def check_subscription_emails(self):
+        """Check the subscription mailbox for subscribe/unsubscribe requests"""
+        if not self._subscription_config_complete():
+            return False
+        
+        try:
+            mail = self._open_subscription_mailbox()
+            success = self._process_subscription_mailbox(mail)
             mail.close()
             mail.logout()
-            
-            # Save the current time as the last check time
-            if max_uid_seen > last_uid:
-                self._set_last_imap_uid(mailbox_key, max_uid_seen)
-            self.save_last_subscription_check(datetime.now())
-            
-            if processed_count > 0:
-                logger.info(f"Processed {processed_count} subscription requests")
-            
-            return True
+            return success
             
         except Exception as e:
             logger.error(f"Error checking subscription emails: {e}")
             return False
     
+    @staticmethod
+    def _imap_data_ready(mail):
+        """Whether mail.readline() can return without waiting on the network
+
+        imaplib reads through a BufferedReader, which may already hold the
+        next response (an EXISTS that arrived in the same TLS record as the
+        line just read); neither select() nor SSLSocket.pending() sees those
+        bytes. Peeking with the socket briefly non-blocking covers the
+        reader's buffer as well as SSL's and the kernel's.
+        """
+        sock = mail.socket()
+        timeout = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            return bool(mail.file.peek(1))
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            sock.settimeout(timeout)
+    
+    def _idle_for_new_mail(self, mail, timeout):
+        """Wait in IMAP IDLE (RFC 2177) until the server announces new mail
+
+        Returns True on an EXISTS notice, False once `timeout` seconds pass
+        without one. imaplib has no IDLE support, so the command is spoken
+        directly on its connection.
+        """
+        tag = mail._new_tag()
+        mail.send(tag + b' IDLE\r\n')
+        new_mail = False
+        # Untagged updates (e.g. mail that arrived since the last search)
+        # may come ahead of the continuation
+        while True:
+            line = mail.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("Connection closed starting IDLE")
+            if line.startswith(b'+'):
+                break
+            if not line.startswith(b'* '):
+                mail.tagged_commands.pop(tag, None)
+                raise imaplib.IMAP4.error(f"Server refused IDLE: {line.strip()!r}")
+            new_mail = new_mail or bool(_IMAP_EXISTS_RE.match(line.rstrip(b'\n')))
+        
+        sock = mail.socket()
+        deadline = time.monotonic() + timeout
+        try:
+            while not new_mail:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not self._imap_data_ready(mail) and not select.select([sock], [], [], remaining)[0]:
+                    break
+                line = mail.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("Connection closed during IDLE")
+                new_mail = bool(_IMAP_EXISTS_RE.match(line.rstrip(b'\n')))
+        finally:
+            mail.send(b'DONE\r\n')
+            # Read through to IDLE's tagged completion so imaplib's next
+            # command starts on a clean response
+            while True:
+                line = mail.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("Connection closed ending IDLE")
+                if line.startswith(tag + b' '):
+                    break
+            mail.tagged_commands.pop(tag, None)
+        return new_mail
+    
+    def watch_subscription_emails(self, poll_interval=300):
+        """Process subscription requests as they arrive, until interrupted
+
+        Holds one IMAP login instead of logging in per check. When the
+        server supports IDLE, new mail is pushed and handled within seconds;
+        otherwise the mailbox is polled every poll_interval seconds. Requests
+        are handled on the calling thread, as in check_subscription_emails.
+        """
+        if not self._subscription_config_complete():
+            return False
+        
+        while True:
+            mail = None
+            try:
+                mail = self._open_subscription_mailbox()
+                # Ask again now that we're authenticated; some servers only
+                # advertise IDLE after login
+                status, caps = mail.capability()
+                can_idle = status == 'OK' and b'IDLE' in caps[0].upper().split()
+                if can_idle:
+                    logger.info("Watching subscription mailbox with IMAP IDLE")
+                else:
+                    logger.info(f"IMAP IDLE unsupported; polling subscription mailbox every {poll_interval}s")
+                while True:
+                    self._process_subscription_mailbox(mail)
+                    if can_idle:
+                        self._idle_for_new_mail(mail, _IMAP_IDLE_TIMEOUT)
+                    else:
+                        time.sleep(poll_interval)
+            except Exception as e:
+                logger.error(f"Subscription mailbox watch interrupted, reconnecting: {e}")
+                time.sleep(_IMAP_RECONNECT_DELAY)
+            finally:
+                if mail is not None:
+                    try:
+                        mail.logout()
+                    except Exception:
+                        pass
+    
     def get_email_body(self, email_message):
         """Extract text body from email message"""
         try:
@@ -3600,31 +4497,51 @@ To unsubscribe, reply with 'unsubscribe' in the subject or body.
             logger.error(f"Error extracting email body: {e}")
             return None
     
-    def send_confirmation_email(self, recipient, action):
-        """Send confirmation email for subscription changes"""
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_from
-            msg['To'] = recipient
-            msg['Subject'] = f"PDRBot Subscription {action.title()}"
+    def _render_confirmation(self, action):
+        """Flatten the confirmation email for `action` once
 
-            if action == 'subscribed':
-                body = f"""You are now subscribed to PDRBot daily reports.
+        Only the To: header differs between recipients, so the message is
+        rendered with a placeholder address that send_confirmation_email
+        swaps out, as send_email_report does for the daily report.
+        """
+        msg = MIMEMultipart()
+        msg['From'] = self.email_from
+        msg['To'] = _RECIPIENT_PLACEHOLDER
+        msg['Subject'] = f"PDRBot Subscription {action.title()}"
+
+        if action == 'subscribed':
+            body = f"""You are now subscribed to PDRBot daily reports.
 
 You will receive daily criminal law opinion analysis reports from the Texas Courts of Appeals.
 
 To unsubscribe at any time, send an email to {self.subscription_email} with "unsubscribe" in the subject or body.
 """
-            else:
-                body = f"""You have been unsubscribed from PDRBot daily reports.
+        else:
+            body = f"""You have been unsubscribed from PDRBot daily reports.
 
 To resubscribe at any time, send an email to {self.subscription_email} with "subscribe" in the subject or body.
 """
 
-            msg.attach(MIMEText(body, 'plain'))
+        msg.attach(MIMEText(body, 'plain'))
+        return msg.as_bytes(policy=_SMTP_WIRE_POLICY)
 
-            with self.smtp_connection() as server:
-                server.sendmail(self.email_from, [recipient], msg.as_string())
+    def send_confirmation_email(self, recipient, action, server=None):
+        """Send confirmation email for subscription changes
+
+        Pass an open smtp_connection() as `server` to reuse its login across
+        several confirmations; otherwise a connection is opened for this one.
+        """
+        try:
+            wire = self._confirmation_wire.get(action)
+            if wire is None:
+                wire = self._confirmation_wire[action] = self._render_confirmation(action)
+            wire = wire.replace(_RECIPIENT_PLACEHOLDER.encode('ascii'), recipient.encode('ascii'))
+
+            if server is None:
+                with self.smtp_connection() as server:
+                    server.sendmail(self.email_from, [recipient], wire)
+            else:
+                server.sendmail(self.email_from, [recipient], wire)
 
             logger.info(f"Sent {action} confirmation to {recipient}")
             return True
@@ -3633,204 +4550,251 @@ To resubscribe at any time, send an email to {self.subscription_email} with "sub
             logger.error(f"Error sending confirmation email to {recipient}: {e}")
             return False
 
+def _date_arg(value):
+    """Parse a YYYY-MM-DD command-line argument, exiting with a message if invalid"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        print(f"Error: Invalid date format '{value}'. Use YYYY-MM-DD format.")
+        sys.exit(1)
+
+def _cmd_analyze(bot, args):
+    # Run analysis on unanalyzed opinions
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    limit = int(args[0]) if args else None
+    bot.run_analysis_batch(limit=limit, workers=workers)
+
+def _cmd_scrape(bot, args):
+    # Run daily scrape only
+    bot.run_daily_scrape()
+
+def _cmd_both(bot, args):
+    # Run scrape then analysis
+    bot.run_daily_scrape()
+    if bot.analysis_enabled:
+        bot.run_analysis_batch()
+
+def _cmd_report(bot, args):
+    # Generate PDF report from existing analyses
+    if args:
+        report_path = bot.generate_daily_report(_date_arg(args[0]).date())
+    else:
+        report_path = bot.generate_analysis_report()
+    
+    if report_path:
+        print(f"Report generated: {report_path}")
+    else:
+        print("No report generated (no interesting cases found)")
+
+def _cmd_daily_report(bot, args):
+    # Generate report for today's analyses or specified date
+    target_date = _date_arg(args[0]) if args else None
+    
+    report_path = bot.generate_daily_report(target_date)
+    if report_path:
+        print(f"Daily report generated: {report_path}")
+    else:
+        print("No daily report generated (no interesting cases found)")
+
+def _cmd_backfill_urls(bot, args):
+    # Backfill PDF URLs for existing records
+    bot.backfill_pdf_urls()
+
+def _cmd_analyze_dir(bot, args):
+    # Analyze all PDFs in a specific directory
+    if args:
+        bot.analyze_directory_pdfs(args[0])
+    else:
+        print("Usage: python pdrbot.py analyze-dir <directory_path>")
+        sys.exit(1)
+
+def _cmd_auto(bot, args):
+    # Run full daily automation: scrape, analyze, report, and email
+    success = bot.run_daily_automation()
+    if success:
+        print("Daily automation completed successfully")
+    else:
+        print("Daily automation failed")
+        sys.exit(1)
+
+def _cmd_resume(bot, args):
+    # Resume an incomplete run
+    if args:
+        try:
+            run_id = int(args[0])
+        except ValueError:
+            print("Invalid run ID. Must be a number.")
+            sys.exit(1)
+        success = bot.resume_incomplete_run(run_id)
+        if success:
+            print(f"Run {run_id} resumed and completed successfully")
+        else:
+            print(f"Failed to resume run {run_id}")
+            sys.exit(1)
+    else:
+        # Show incomplete runs
+        incomplete = bot.find_incomplete_runs()
+        if incomplete:
+            print("Incomplete runs found:")
+            for run_id, run_date, target_date, status, courts, cases, files in incomplete:
+                print(f"  Run {run_id}: {target_date} (status: {status}, courts: {courts}, cases: {cases}, files: {files})")
+            print("\nUse 'python pdrbot.py resume <run_id>' to resume a specific run")
+        else:
+            print("No incomplete runs found")
+
+def _cmd_status(bot, args):
+    # Show recent run status
+    incomplete = bot.find_incomplete_runs()
+    if incomplete:
+        print("Incomplete runs:")
+        for run_id, run_date, target_date, status, courts, cases, files in incomplete:
+            print(f"  Run {run_id}: {target_date} (status: {status})")
+    else:
+        print("No incomplete runs")
+    
+    # Show recent completed runs
+    conn = bot._connect()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT id, target_date, status, total_files_downloaded, run_timestamp
+        FROM daily_runs 
+        WHERE status IN ('completed', 'failed', 'email_failed')
+        ORDER BY run_timestamp DESC 
+        LIMIT 5
+    ''')
+    recent = cursor.fetchall()
+    bot._release(conn)
+    
+    if recent:
+        print("\nRecent completed runs:")
+        for run_id, target_date, status, files, timestamp in recent:
+            print(f"  Run {run_id}: {target_date} ({status}, {files} files) - {timestamp}")
+    else:
+        print("No recent completed runs")
+
+def _cmd_members(bot, args):
+    # Show subscription members
+    members = bot.load_members()
+    static_recipients = bot.email_to if bot.email_to else []
+    
+    print(f"Static recipients ({len(static_recipients)}):")
+    for email in static_recipients:
+        print(f"  - {email}")
+    
+    print(f"\nDynamic members ({len(members)}):")
+    for email in members:
+        print(f"  - {email}")
+    
+    all_recipients = bot.get_all_recipients()
+    print(f"\nTotal unique recipients: {len(all_recipients)}")
+
+def _cmd_check_subscriptions(bot, args):
+    # Manually check subscription emails
+    print("Checking subscription emails...")
+    success = bot.check_subscription_emails()
+    if success:
+        print("✅ Subscription check completed")
+    else:
+        print("❌ Subscription check failed")
+
+def _cmd_watch_subscriptions(bot, args):
+    # Keep handling subscription emails as they arrive
+    poll_interval = int(args[0]) if args else 300
+    print("Watching for subscription emails (Ctrl-C to stop)...")
+    try:
+        if bot.watch_subscription_emails(poll_interval=poll_interval) is False:
+            sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+def _cmd_triage_audit(bot, args):
+    n = int(args[0]) if args else 10
+    bot.run_triage_audit(sample_size=n)
+
+def _cmd_court_staleness(bot, args):
+    threshold = int(args[0]) if args else 21
+    stale = bot.check_court_staleness(threshold_days=threshold)
+    if not stale:
+        print(f"All courts current (threshold: {threshold} days).")
+    else:
+        print(f"Stale courts (no interesting issues in >{threshold} days):")
+        for entry in stale:
+            print(f"  {entry['court']}: last {entry['last_interesting']} "
+                  f"({entry['days_ago']} days ago)")
+
+def _cmd_test_email(bot, args):
+    # Send test email to specified recipient
+    if args:
+        recipient = args[0]
+        print(f"Sending test email to {recipient}...")
+        success = bot.send_test_email(recipient)
+        if success:
+            print("✅ Test email sent successfully")
+        else:
+            print("❌ Test email failed")
+    else:
+        print("Usage: python pdrbot.py test-email <email@address.com>")
+        sys.exit(1)
+
+COMMANDS = {
+    "analyze": _cmd_analyze,
+    "scrape": _cmd_scrape,
+    "both": _cmd_both,
+    "report": _cmd_report,
+    "daily-report": _cmd_daily_report,
+    "backfill-urls": _cmd_backfill_urls,
+    "analyze-dir": _cmd_analyze_dir,
+    "auto": _cmd_auto,
+    "automation": _cmd_auto,
+    "resume": _cmd_resume,
+    "status": _cmd_status,
+    "members": _cmd_members,
+    "check-subscriptions": _cmd_check_subscriptions,
+    "watch-subscriptions": _cmd_watch_subscriptions,
+    "triage-audit": _cmd_triage_audit,
+    "court-staleness": _cmd_court_staleness,
+    "test-email": _cmd_test_email,
+}
+
+def _print_usage():
+    print("Usage: python pdrbot.py [scrape|analyze|both|report|daily-report|auto|resume|status|members|check-subscriptions|test-email|backfill-urls|analyze-dir] [options]")
+    print("  scrape       - Download new opinions only")
+    print("  analyze      - Analyze unanalyzed opinions only")
+    print("  both         - Download and analyze (default)")
+    print("  report       - Generate PDF report from all analyses")
+    print("  report YYYY-MM-DD - Generate report for specific date")
+    print("  daily-report [YYYY-MM-DD] - Generate report for specified date or today's analyses")
+    print("  auto         - Full automation: scrape, analyze, report, and email")
+    print("  resume [run_id] - Resume incomplete run or list incomplete runs")
+    print("  status       - Show status of recent and incomplete runs")
+    print("  members      - Show subscription members and recipients")
+    print("  check-subscriptions - Manually check for subscription emails")
+    print("  watch-subscriptions [secs] - Handle subscription emails as they arrive (IDLE, else poll every secs)")
+    print("  test-email <email> - Send test email to specified recipient")
+    print("  triage-audit [N]   - Re-run Opus on N recent Haiku-ROUTINE cases; report disagreement rate")
+    print("  court-staleness [days] - List courts with no interesting issue in the last N days (default 21)")
+    print("  backfill-urls - Update existing records with direct PDF URLs")
+    print("  analyze-dir <path> - Analyze all PDFs in specific directory")
+    print("")
+    print("Options:")
+    print("  limit        - Maximum number of opinions to analyze (analyze mode only)")
+    print("  --workers N  - Opinions analyzed at once, overriding ANALYSIS_WORKERS (analyze mode only)")
+
 def main():
     """Main entry point for PDRBot"""
-    bot = PDRBot()
-    
     if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        
-        if command == "analyze":
-            # Run analysis on unanalyzed opinions
-            limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
-            bot.run_analysis_batch(limit=limit)
-        elif command == "scrape":
-            # Run daily scrape only
-            bot.run_daily_scrape()
-        elif command == "both":
-            # Run scrape then analysis
-            bot.run_daily_scrape()
-            if bot.analysis_enabled:
-                bot.run_analysis_batch()
-        elif command == "report":
-            # Generate PDF report from existing analyses
-            if len(sys.argv) > 2:
-                try:
-                    date_str = sys.argv[2]
-                    target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    report_path = bot.generate_daily_report(target_date)
-                except ValueError:
-                    print("Invalid date format. Use YYYY-MM-DD")
-                    sys.exit(1)
-            else:
-                report_path = bot.generate_analysis_report()
-            
-            if report_path:
-                print(f"Report generated: {report_path}")
-            else:
-                print("No report generated (no interesting cases found)")
-        elif command == "daily-report":
-            # Generate report for today's analyses or specified date
-            target_date = None
-            if len(sys.argv) > 2:
-                date_str = sys.argv[2]
-                try:
-                    target_date = datetime.strptime(date_str, "%Y-%m-%d")
-                except ValueError:
-                    print(f"Error: Invalid date format '{date_str}'. Use YYYY-MM-DD format.")
-                    sys.exit(1)
-            
-            report_path = bot.generate_daily_report(target_date)
-            if report_path:
-                print(f"Daily report generated: {report_path}")
-            else:
-                print("No daily report generated (no interesting cases found)")
-        elif command == "backfill-urls":
-            # Backfill PDF URLs for existing records
-            bot.backfill_pdf_urls()
-        elif command == "analyze-dir":
-            # Analyze all PDFs in a specific directory
-            if len(sys.argv) > 2:
-                directory_path = sys.argv[2]
-                bot.analyze_directory_pdfs(directory_path)
-            else:
-                print("Usage: python pdrbot.py analyze-dir <directory_path>")
-                sys.exit(1)
-        elif command == "auto" or command == "automation":
-            # Run full daily automation: scrape, analyze, report, and email
-            success = bot.run_daily_automation()
-            if success:
-                print("Daily automation completed successfully")
-            else:
-                print("Daily automation failed")
-                sys.exit(1)
-        elif command == "resume":
-            # Resume an incomplete run
-            if len(sys.argv) > 2:
-                try:
-                    run_id = int(sys.argv[2])
-                    success = bot.resume_incomplete_run(run_id)
-                    if success:
-                        print(f"Run {run_id} resumed and completed successfully")
-                    else:
-                        print(f"Failed to resume run {run_id}")
-                        sys.exit(1)
-                except ValueError:
-                    print("Invalid run ID. Must be a number.")
-                    sys.exit(1)
-            else:
-                # Show incomplete runs
-                incomplete = bot.find_incomplete_runs()
-                if incomplete:
-                    print("Incomplete runs found:")
-                    for run_id, run_date, target_date, status, courts, cases, files in incomplete:
-                        print(f"  Run {run_id}: {target_date} (status: {status}, courts: {courts}, cases: {cases}, files: {files})")
-                    print("\nUse 'python pdrbot.py resume <run_id>' to resume a specific run")
-                else:
-                    print("No incomplete runs found")
-        elif command == "status":
-            # Show recent run status
-            incomplete = bot.find_incomplete_runs()
-            if incomplete:
-                print("Incomplete runs:")
-                for run_id, run_date, target_date, status, courts, cases, files in incomplete:
-                    print(f"  Run {run_id}: {target_date} (status: {status})")
-            else:
-                print("No incomplete runs")
-            
-            # Show recent completed runs
-            conn = sqlite3.connect(bot.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, target_date, status, total_files_downloaded, run_timestamp
-                FROM daily_runs 
-                WHERE status IN ('completed', 'failed', 'email_failed')
-                ORDER BY run_timestamp DESC 
-                LIMIT 5
-            ''')
-            recent = cursor.fetchall()
-            conn.close()
-            
-            if recent:
-                print("\nRecent completed runs:")
-                for run_id, target_date, status, files, timestamp in recent:
-                    print(f"  Run {run_id}: {target_date} ({status}, {files} files) - {timestamp}")
-            else:
-                print("No recent completed runs")
-        elif command == "members":
-            # Show subscription members
-            members = bot.load_members()
-            static_recipients = bot.email_to if bot.email_to else []
-            
-            print(f"Static recipients ({len(static_recipients)}):")
-            for email in static_recipients:
-                print(f"  - {email}")
-            
-            print(f"\nDynamic members ({len(members)}):")
-            for email in members:
-                print(f"  - {email}")
-            
-            all_recipients = bot.get_all_recipients()
-            print(f"\nTotal unique recipients: {len(all_recipients)}")
-        elif command == "check-subscriptions":
-            # Manually check subscription emails
-            print("Checking subscription emails...")
-            success = bot.check_subscription_emails()
-            if success:
-                print("✅ Subscription check completed")
-            else:
-                print("❌ Subscription check failed")
-        elif command == "triage-audit":
-            n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
-            bot.run_triage_audit(sample_size=n)
-        elif command == "court-staleness":
-            threshold = int(sys.argv[2]) if len(sys.argv) > 2 else 21
-            stale = bot.check_court_staleness(threshold_days=threshold)
-            if not stale:
-                print(f"All courts current (threshold: {threshold} days).")
-            else:
-                print(f"Stale courts (no interesting issues in >{threshold} days):")
-                for entry in stale:
-                    print(f"  {entry['court']}: last {entry['last_interesting']} "
-                          f"({entry['days_ago']} days ago)")
-        elif command == "test-email":
-            # Send test email to specified recipient
-            if len(sys.argv) > 2:
-                recipient = sys.argv[2]
-                print(f"Sending test email to {recipient}...")
-                success = bot.send_test_email(recipient)
-                if success:
-                    print("✅ Test email sent successfully")
-                else:
-                    print("❌ Test email failed")
-            else:
-                print("Usage: python pdrbot.py test-email <email@address.com>")
-                sys.exit(1)
-        else:
-            print("Usage: python pdrbot.py [scrape|analyze|both|report|daily-report|auto|resume|status|members|check-subscriptions|test-email|backfill-urls|analyze-dir] [options]")
-            print("  scrape       - Download new opinions only")
-            print("  analyze      - Analyze unanalyzed opinions only")
-            print("  both         - Download and analyze (default)")
-            print("  report       - Generate PDF report from all analyses")
-            print("  report YYYY-MM-DD - Generate report for specific date")
-            print("  daily-report [YYYY-MM-DD] - Generate report for specified date or today's analyses")
-            print("  auto         - Full automation: scrape, analyze, report, and email")
-            print("  resume [run_id] - Resume incomplete run or list incomplete runs")
-            print("  status       - Show status of recent and incomplete runs")
-            print("  members      - Show subscription members and recipients")
-            print("  check-subscriptions - Manually check for subscription emails")
-            print("  test-email <email> - Send test email to specified recipient")
-            print("  triage-audit [N]   - Re-run Opus on N recent Haiku-ROUTINE cases; report disagreement rate")
-            print("  court-staleness [days] - List courts with no interesting issue in the last N days (default 21)")
-            print("  backfill-urls - Update existing records with direct PDF URLs")
-            print("  analyze-dir <path> - Analyze all PDFs in specific directory")
-            print("")
-            print("Options:")
-            print("  limit        - Maximum number of opinions to analyze (analyze mode only)")
+        handler = COMMANDS.get(sys.argv[1].lower())
+        if handler is None:
+            _print_usage()
             sys.exit(1)
+        handler(PDRBot(), sys.argv[2:])
     else:
         # Default: run daily scrape with analysis
-        bot.run_daily_scrape()
+        PDRBot().run_daily_scrape()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
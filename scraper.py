@@ -7,7 +7,7 @@ for dates from 01/01/2025 to present.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import os
 import re
 from datetime import datetime, timedelta
@@ -16,30 +16,177 @@ import time
 import logging
 import csv
 import json
+import threading
+import functools
+import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # orjson encodes the status file several times faster than the stdlib,
+    # which falls back to its pure-Python encoder whenever indent is set
+    import orjson
+    
+    def _dump_status(status):
+        return orjson.dumps(status, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_status(status):
+        return json.dumps(status, indent=2).encode('utf-8')
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Compiled once instead of per description/row
+# Opinion type from a document description in one match. Each alternative
+# is a lookahead from the start of the string, so the first keyword in this
+# order wins wherever it appears in the description.
+_OPINION_TYPE_RE = re.compile(
+    r'(?=.*?(?P<mem>memorandum))'
+    r'|(?=.*?dissenting opinion by (?:chief )?justice (?P<dis_justice>\w+)|.*?(?P<dis>dissenting))'
+    r'|(?=.*?concurring opinion by (?:chief )?justice (?P<con_justice>\w+)|.*?(?P<con>concurring))'
+    r'|(?=.*?(?P<op>opinion))',
+    re.IGNORECASE | re.DOTALL,
+)
+_OPINION_TYPE_ABBREVS = {'mem': 'mem', 'dis': 'dis', 'dis_justice': 'dis',
+                         'con': 'con', 'con_justice': 'con', 'op': 'op'}
+_CASE_NUMBER_RE = re.compile(r'\d{2}-\d{2}-\d{5}-CR')
+_CASE_HREF_RE = re.compile(r'Case\.aspx\?cn=.*-CR')
+_PDF_HREF_RE = re.compile(r'SearchMedia\.aspx')
+
+class TokenBucket:
+    """Thread-safe rate limiter allowing `rate` acquisitions per second
+    on average, with bursts of up to `burst` when it has been idle
+    
+    The rate adapts to the server AIMD-style through record(): it halves
+    whenever a response says the server is overloaded and creeps back up
+    by `step` per healthy response, never exceeding the configured rate.
+    """
+    
+    # Statuses that mean "slow down" rather than a problem with the request
+    OVERLOAD_STATUSES = frozenset((429, 503))
+    
+    def __init__(self, rate, burst, min_rate=0.25, step=0.05):
+        # acquire() divides by the rate; NaN fails these comparisons too
+        if not 0 < rate < float('inf'):
+            raise ValueError(f"rate must be a positive number, got {rate!r}")
+        if not burst >= 1:
+            raise ValueError(f"burst must be at least 1, got {burst!r}")
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.step = step
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._backoff_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so waiting threads are
+            # released in arrival order without re-polling
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+    
+    def record(self, status_code):
+        """Adjust the rate after a response with the given HTTP status"""
+        with self._lock:
+            if status_code in self.OVERLOAD_STATUSES:
+                now = time.monotonic()
+                # Requests already in flight will report the same overload;
+                # halve once per burst's worth of requests, not once each
+                if now < self._backoff_until:
+                    return
+                rate = max(self.min_rate, self.rate / 2)
+                if rate < self.rate:
+                    logger.warning(f"Server returned {status_code}; slowing to {rate:.2f} req/s")
+                self.rate = rate
+                self._backoff_until = now + self.burst / rate
+            elif status_code < 500:
+                self.rate = min(self.max_rate, self.rate + self.step)
+
+@functools.lru_cache(maxsize=512)
+def _docket_date(date):
+    """FullDate query value for a docket date; each date recurs once per court"""
+    return date.strftime("%m/%d/%Y")
+
+def _class_test(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Docket-page lookups, evaluated directly on the lxml tree
+_CRIMINAL_CAUSES_TABLE_XPATH = etree.XPath(
+    f"(//h3[contains(., 'Criminal Causes Decided')])[1]"
+    f"/following::table[{_class_test('rgMasterTable')}][1]"
+)
+_CASE_ROWS_XPATH = etree.XPath(f".//tr[{_class_test('rgRow')} or {_class_test('rgAltRow')}]")
+_DOC_GRID_XPATH = etree.XPath(f".//table[{_class_test('docGrid')}]")
+# Most court-days have no criminal section; finding that out from the raw
+# bytes is a single memchr-style scan instead of a full parse
+_CRIMINAL_CAUSES_HEADING = b'Criminal Causes Decided'
+# Unrendered server-side template some PDF links carry in place of the court
+_COURT_TEMPLATE_MARKER = '" + this.CurrentWebState.CurrentCourt + @"'
+
+
 class COAOpinionScraper:
-    def __init__(self, output_dir="opinions", status_file="scraper_status.json", log_file="scrape_log.csv"):
+    # Completions between status file writes; close() writes the rest
+    STATUS_SAVE_EVERY = 10
+    
+    def __init__(self, output_dir="opinions", status_file="scraper_status.json", log_file="scrape_log.csv",
+                 court_workers=4, download_workers=4, request_rate=4, request_burst=8):
         self.base_url = "https://search.txcourts.gov/"
         self.output_dir = output_dir
         self.status_file = status_file
         self.log_file = log_file
+        
+        # Up to court_workers (court, date) dockets are scraped at once, each
+        # downloading its PDFs on download_workers threads; every request,
+        # docket or PDF, takes a token from one shared bucket first
+        self.court_workers = court_workers
+        self.download_workers = download_workers
+        self.limiter = TokenBucket(request_rate, request_burst)
+        # Guards self.status, the CSV log and self._existing across workers
+        self._lock = threading.RLock()
+        
+        # Filenames already in output_dir or claimed by a download in
+        # flight, listed once on first use
+        self._existing = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Every request goes to search.txcourts.gov: keep one host pool with
+        # room for every docket worker and its download workers, so none of
+        # them opens (and then discards) a fresh TLS connection. Retries stay
+        # in get_with_retry/download_pdf.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                pool_maxsize=max(court_workers * (download_workers + 1), 10),
+                                                max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Initialize CSV log file
+        # Initialize CSV log file, then keep it open for appending; rows are
+        # buffered and flushed together with the status file
         self.init_csv_log()
+        self._log_fh = open(self.log_file, 'a', newline='', buffering=1 << 16)
+        self._log_writer = csv.writer(self._log_fh)
         
         # Load or initialize status
         self.status = self.load_status()
+        # Membership index over the status file's completed_combinations list
+        self._completed = set(self.status.get('completed_combinations', []))
+        self._unsaved_completions = 0
+        atexit.register(self.close)
     
     def init_csv_log(self):
         """Initialize CSV log file with headers if it doesn't exist"""
@@ -54,7 +201,7 @@ class COAOpinionScraper:
             try:
                 with open(self.status_file, 'r') as f:
                     return json.load(f)
-            except Exception as e:
+            except json.JSONDecodeError as e:
                 logger.warning(f"Could not load status file: {e}")
         
         return {
@@ -63,23 +210,52 @@ class COAOpinionScraper:
             'total_files_downloaded': 0,
             'total_requests': 0,
             'start_time': None,
-            'completed_combinations': []  # List of "YYYY-MM-DD_COA##" strings
+            'completed_combinations': [],  # List of "YYYY-MM-DD_COA##" strings
+            'completed_combinations_count': 0
         }
     
     def save_status(self):
-        """Save current status to file"""
+        """Save current status to file
+        
+        Written to a sibling temp file and renamed over the old one, so a
+        crash mid-write never leaves a truncated status file behind.
+        """
+        tmp_file = self.status_file + '.tmp'
         try:
-            with open(self.status_file, 'w') as f:
-                json.dump(self.status, f, indent=2)
+            with self._lock:
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dump_status(self.status))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.status_file)
         except Exception as e:
             logger.error(f"Could not save status: {e}")
     
+    def flush(self):
+        """Write buffered CSV rows and the current status to disk"""
+        with self._lock:
+            if self._log_fh.closed:
+                return
+            try:
+                self._log_fh.flush()
+            except Exception as e:
+                logger.error(f"Could not flush CSV log: {e}")
+            self.save_status()
+            self._unsaved_completions = 0
+    
+    def close(self):
+        """Flush everything and close the CSV log; safe to call twice"""
+        with self._lock:
+            if self._log_fh.closed:
+                return
+            self.flush()
+            self._log_fh.close()
+    
     def log_scrape_result(self, court, date, criminal_cases_found, files_downloaded, case_numbers, status):
         """Log scrape result to CSV"""
         try:
-            with open(self.log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
+            with self._lock:
+                self._log_writer.writerow([
                     datetime.now().isoformat(),
                     f"COA{court:02d}",
                     date.strftime('%Y-%m-%d'),
@@ -94,16 +270,66 @@ class COAOpinionScraper:
     def is_combination_completed(self, court, date):
         """Check if court/date combination has already been completed"""
         combo_str = f"{date.strftime('%Y-%m-%d')}_COA{court:02d}"
-        return combo_str in self.status.get('completed_combinations', [])
+        return combo_str in self._completed
     
     def mark_combination_completed(self, court, date):
-        """Mark court/date combination as completed"""
+        """Mark court/date combination as completed
+        
+        The resume point (last_completed_date/court) is advanced separately,
+        by advance_resume_point, because concurrent workers can finish out
+        of order.
+        """
         combo_str = f"{date.strftime('%Y-%m-%d')}_COA{court:02d}"
-        if combo_str not in self.status.get('completed_combinations', []):
-            self.status['completed_combinations'].append(combo_str)
-            self.status['last_completed_date'] = date.strftime('%Y-%m-%d')
-            self.status['last_completed_court'] = court
-            self.save_status()
+        with self._lock:
+            if combo_str not in self._completed:
+                self._completed.add(combo_str)
+                self.status.setdefault('completed_combinations', []).append(combo_str)
+                self.status['completed_combinations_count'] = len(self.status['completed_combinations'])
+                # A crash loses at most STATUS_SAVE_EVERY completions, which
+                # are redone (their files are already on disk) on resume
+                self._unsaved_completions += 1
+                if self._unsaved_completions >= self.STATUS_SAVE_EVERY:
+                    self.flush()
+    
+    def advance_resume_point(self, court, date):
+        """Record court/date as the resume point if it completed
+        
+        Called in (date, court) order, so everything before the resume
+        point has been attempted even though workers finish out of order.
+        """
+        with self._lock:
+            if self.is_combination_completed(court, date):
+                self.status['last_completed_date'] = date.strftime('%Y-%m-%d')
+                self.status['last_completed_court'] = court
+    
+    def scrape_combinations(self, combinations):
+        """Scrape (coa_num, date) combinations as a pipeline
+        
+        Docket workers fetch and parse dockets and queue their PDFs on
+        one download pool shared by every docket, so a docket worker
+        moves on to the next docket while the previous one's PDFs are
+        still downloading. At most a couple of dockets per court worker
+        are read ahead of the oldest unfinished one. Yields
+        (coa_num, date, files_downloaded) in the order given, advancing
+        the resume point as each one is reached.
+        """
+        lookahead = 2 * self.court_workers
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.court_workers * self.download_workers) as download_pool, \
+                ThreadPoolExecutor(max_workers=self.court_workers) as docket_pool:
+            
+            def finish_oldest():
+                (coa_num, date), started = in_flight.popleft()
+                count = self._finish_court_date(started.result())
+                self.advance_resume_point(coa_num, date)
+                return coa_num, date, count
+            
+            for combo in combinations:
+                in_flight.append((combo, docket_pool.submit(self._start_court_date, *combo, download_pool)))
+                if len(in_flight) > lookahead:
+                    yield finish_oldest()
+            while in_flight:
+                yield finish_oldest()
 
     def generate_date_range(self, start_date, end_date, skip_weekends=True):
         """Generate all dates between start_date and end_date, optionally skipping weekends"""
@@ -115,36 +341,38 @@ class COAOpinionScraper:
             yield current
             current += timedelta(days=1)
     
+    def count_weekdays(self, start_date, end_date):
+        """Number of dates generate_date_range yields with skip_weekends, without iterating"""
+        total_days = (end_date - start_date).days + 1
+        if total_days <= 0:
+            return 0
+        full_weeks, extra = divmod(total_days, 7)
+        # The leftover days start on start_date's weekday
+        first = start_date.weekday()
+        return full_weeks * 5 + sum(1 for i in range(extra) if (first + i) % 7 < 5)
+    
     def get_docket_url(self, coa_num, date):
         """Generate the docket URL for a specific court and date"""
-        date_str = date.strftime("%m/%d/%Y")
-        return f"{self.base_url}Docket.aspx?coa=coa{coa_num:02d}&FullDate={date_str}"
-    
-    def get_abbreviation_and_justice(self, description):
-        """Get abbreviation for opinion type and justice name based on description"""
-        description_lower = description.lower()
-        
-        if "memorandum" in description_lower:
-            return "mem", None
-        elif "dissenting" in description_lower:
-            # Extract justice name from "Dissenting Opinion by Justice [Name]"
-            justice_match = re.search(r'dissenting opinion by (?:chief )?justice (\w+)', description_lower)
-            justice_name = justice_match.group(1) if justice_match else None
-            return "dis", justice_name
-        elif "concurring" in description_lower:
-            # Extract justice name from "Concurring Opinion by Justice [Name]"
-            justice_match = re.search(r'concurring opinion by (?:chief )?justice (\w+)', description_lower)
-            justice_name = justice_match.group(1) if justice_match else None
-            return "con", justice_name
-        elif "opinion" in description_lower:
-            return "op", None
-        
-        return "", None
+        return f"{self.base_url}Docket.aspx?coa=coa{coa_num:02d}&FullDate={_docket_date(date)}"
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_abbreviation_and_justice(description):
+        """Get abbreviation for opinion type and justice name based on description
+        (memoized: the same handful of descriptions repeat on every docket)"""
+        match = _OPINION_TYPE_RE.match(description)
+        if match is None:
+            return "", None
+        
+        kind = match.lastgroup
+        # Justice names are lowercased for use in filenames
+        justice_name = match.group(kind).lower() if kind.endswith('_justice') else None
+        return _OPINION_TYPE_ABBREVS[kind], justice_name
     
     def extract_case_number(self, case_link_text):
         """Extract case number from link text"""
         # Should match pattern like 01-23-00751-CR (5 digits, not 4)
-        match = re.search(r'\d{2}-\d{2}-\d{5}-CR', case_link_text)
+        match = _CASE_NUMBER_RE.search(case_link_text)
         return match.group(0) if match else None
     
     def download_pdf(self, pdf_url, filename, max_retries=3):
@@ -154,33 +382,48 @@ class COAOpinionScraper:
         
         for attempt in range(max_retries):
             try:
-                response = self.session.get(pdf_url, timeout=30)
-                response.raise_for_status()
-                
-                # Validate response is actually a PDF
-                if not response.headers.get('content-type', '').lower().startswith('application/pdf'):
-                    logger.warning(f"Response is not a PDF (attempt {attempt + 1}): {response.headers.get('content-type', 'unknown')}")
-                    if attempt == max_retries - 1:
-                        logger.error(f"Not a PDF after {max_retries} attempts: {filename}")
-                        return False
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                # Verify file was written and has content
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+                self.limiter.acquire()
+                with self.session.get(pdf_url, timeout=30, stream=True) as response:
+                    self.limiter.record(response.status_code)
+                    response.raise_for_status()
+                    
+                    # Validate response is actually a PDF
+                    if not response.headers.get('content-type', '').lower().startswith('application/pdf'):
+                        logger.warning(f"Response is not a PDF (attempt {attempt + 1}): {response.headers.get('content-type', 'unknown')}")
+                        if attempt == max_retries - 1:
+                            logger.error(f"Not a PDF after {max_retries} attempts: {filename}")
+                            return False
+                        time.sleep(2 ** attempt)  # Exponential backoff
+                        continue
+                    
+                    # Stream the body to disk, validating the first chunk
+                    # before anything is written
+                    chunks = response.iter_content(chunk_size=65536)
+                    first = next(chunks, b'')
+                    if not first:
+                        raise Exception("File was not written or is empty")
                     # Basic PDF validation - check for PDF magic bytes
-                    with open(filepath, 'rb') as f:
-                        header = f.read(4)
-                        if not header.startswith(b'%PDF'):
-                            raise Exception("Downloaded file is not a valid PDF")
+                    if not first.startswith(b'%PDF'):
+                        raise Exception("Downloaded file is not a valid PDF")
                     
-                    logger.info(f"Downloaded: {filename}")
-                    return True
-                else:
-                    raise Exception("File was not written or is empty")
+                    # Write under a .part name and rename at the end, so an
+                    # interrupted download never passes the exists check
+                    part_path = filepath + '.part'
+                    try:
+                        with open(part_path, 'wb') as f:
+                            f.write(first)
+                            for chunk in chunks:
+                                f.write(chunk)
+                        os.replace(part_path, filepath)
+                    except BaseException:
+                        try:
+                            os.remove(part_path)
+                        except OSError:
+                            pass
+                        raise
+                
+                logger.info(f"Downloaded: {filename}")
+                return True
                     
             except (requests.exceptions.RequestException, requests.exceptions.Timeout, 
                     requests.exceptions.ConnectionError, Exception) as e:
@@ -194,13 +437,20 @@ class COAOpinionScraper:
         
         return False
     
+    def _download_job(self, job):
+        """Download one (pdf_url, filename) job from a worker thread"""
+        pdf_url, filename = job
+        return self.download_pdf(pdf_url, filename)
+    
     def get_with_retry(self, url, max_retries=3):
         """Make HTTP request with retry logic"""
         last_exception = None
         
         for attempt in range(max_retries):
             try:
+                self.limiter.acquire()
                 response = self.session.get(url, timeout=30)
+                self.limiter.record(response.status_code)
                 response.raise_for_status()
                 return response
                 
@@ -215,69 +465,65 @@ class COAOpinionScraper:
                     logger.error(f"Failed to fetch {url} after {max_retries} attempts: {e}")
                     raise last_exception
     
-    def parse_criminal_causes(self, soup):
-        """Parse the Criminal Causes Decided section"""
-        criminal_cases = []
-        
-        # Look for the "Criminal Causes Decided" heading - use text contains approach
-        criminal_heading = None
-        h3_elements = soup.find_all('h3')
-        for h3 in h3_elements:
-            if 'Criminal Causes Decided' in h3.get_text():
-                criminal_heading = h3
-                break
+    def parse_criminal_causes(self, content, coa_num=1):
+        """Parse the Criminal Causes Decided section of a docket page's HTML
         
-        if not criminal_heading:
-            logger.debug("No Criminal Causes Decided section found")
+        coa_num is the court whose docket this is; it fills the court in
+        PDF links the site leaves as a JavaScript template.
+        """
+        criminal_cases = []
+        if _CRIMINAL_CAUSES_HEADING not in content:
+            logger.debug("No Criminal Causes Decided heading found")
             return criminal_cases
         
-        # Find the table that follows the heading
-        table = criminal_heading.find_next('table', class_='rgMasterTable')
-        if not table:
-            logger.debug("No table found after Criminal Causes Decided heading")
+        # Look for the "Criminal Causes Decided" heading and the grid table
+        # that follows it
+        tree = lxml_html.fromstring(content)
+        tables = _CRIMINAL_CAUSES_TABLE_XPATH(tree)
+        if not tables:
+            logger.debug("No Criminal Causes Decided table found")
             return criminal_cases
         
         # Find all rows in the table body
-        tbody = table.find('tbody')
-        if not tbody:
+        tbody = tables[0].find('.//tbody')
+        if tbody is None:
             logger.debug("No tbody found in criminal causes table")
             return criminal_cases
         
-        rows = tbody.find_all('tr', class_=['rgRow', 'rgAltRow'])
-        
-        for row in rows:
-            case_data = self.parse_case_row(row)
+        for row in _CASE_ROWS_XPATH(tbody):
+            case_data = self.parse_case_row(row, coa_num)
             if case_data:
                 criminal_cases.append(case_data)
         
         return criminal_cases
     
-    def parse_case_row(self, row):
-        """Parse a single case row"""
+    def parse_case_row(self, row, coa_num=1):
+        """Parse a single case row (an lxml <tr> element)"""
         try:
             # Find the case number link
-            case_link = row.find('a', href=re.compile(r'Case\.aspx\?cn=.*-CR'))
-            if not case_link:
+            case_link = next((a for a in row.iter('a') if _CASE_HREF_RE.search(a.get('href', ''))), None)
+            if case_link is None:
                 return None
             
-            case_number = self.extract_case_number(case_link.text.strip())
+            case_number = self.extract_case_number(case_link.text_content().strip())
             if not case_number:
                 return None
             
             # Find all PDF links in this row
             pdf_links = []
-            doc_tables = row.find_all('table', class_='docGrid')
-            
-            for doc_table in doc_tables:
-                pdf_link = doc_table.find('a', href=re.compile(r'SearchMedia\.aspx'))
-                if pdf_link:
+            for doc_table in _DOC_GRID_XPATH(row):
+                pdf_link = next((a for a in doc_table.iter('a')
+                                 if _PDF_HREF_RE.search(a.get('href', ''))), None)
+                if pdf_link is not None:
                     # Get the description (opinion type)
-                    desc_cell = pdf_link.find_parent('td').find_previous_sibling('td')
-                    description = desc_cell.text.strip() if desc_cell else ""
+                    link_cell = next(pdf_link.iterancestors('td'), None)
+                    desc_cell = next(link_cell.itersiblings('td', preceding=True), None) if link_cell is not None else None
+                    description = desc_cell.text_content().strip() if desc_cell is not None else ""
                     
                     # Clean up the PDF URL (remove JavaScript template syntax)
-                    href = pdf_link['href']
-                    href = href.replace('" + this.CurrentWebState.CurrentCourt + @"', 'coa01')
+                    href = pdf_link.get('href')
+                    if _COURT_TEMPLATE_MARKER in href:
+                        href = href.replace(_COURT_TEMPLATE_MARKER, f'coa{coa_num:02d}')
                     pdf_url = urljoin(self.base_url, href)
                     pdf_links.append({
                         'url': pdf_url,
@@ -297,10 +543,20 @@ class COAOpinionScraper:
     
     def scrape_court_date(self, coa_num, date):
         """Scrape opinions for a specific court and date"""
+        with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            return self._finish_court_date(self._start_court_date(coa_num, date, pool))
+    
+    def _start_court_date(self, coa_num, date, download_pool):
+        """Fetch and parse one docket and queue its PDFs on download_pool
+        
+        Returns the pending downloads for _finish_court_date, or None if
+        the docket needed no downloads (already completed, no criminal
+        cases, or an error - all of which are recorded here).
+        """
         # Check if already completed
         if self.is_combination_completed(coa_num, date):
             logger.debug(f"Skipping COA{coa_num:02d} for {date.strftime('%Y-%m-%d')} - already completed")
-            return 0
+            return None
         
         url = self.get_docket_url(coa_num, date)
         date_str = date.strftime("%Y-%m-%d")
@@ -309,8 +565,7 @@ class COAOpinionScraper:
         
         try:
             response = self.get_with_retry(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            criminal_cases = self.parse_criminal_causes(soup)
+            criminal_cases = self.parse_criminal_causes(response.content, coa_num)
             
             case_numbers = [case['case_number'] for case in criminal_cases]
             
@@ -318,10 +573,13 @@ class COAOpinionScraper:
                 logger.debug(f"No criminal cases found for COA{coa_num:02d} on {date_str}")
                 self.log_scrape_result(coa_num, date, 0, 0, [], "no_cases")
                 self.mark_combination_completed(coa_num, date)
-                return 0
+                return None
             
-            downloaded_count = 0
+            with self._lock:
+                if self._existing is None:
+                    self._existing = set(os.listdir(self.output_dir))
             
+            jobs = []
             for case in criminal_cases:
                 case_number = case['case_number']
                 
@@ -342,30 +600,56 @@ class COAOpinionScraper:
                         suffix = f"_{i+1}" if len(case['pdf_links']) > 1 else ""
                         filename = f"{case_number}{suffix}.pdf"
                     
-                    # Check if file already exists
-                    filepath = os.path.join(self.output_dir, filename)
-                    if os.path.exists(filepath):
-                        logger.info(f"File already exists: {filename}")
-                        continue
-                    
-                    if self.download_pdf(pdf_url, filename):
-                        downloaded_count += 1
-                        self.status['total_files_downloaded'] += 1
-                    
-                    # Be respectful with delays
-                    time.sleep(1)
+                    # Check if file already exists, or is already claimed by
+                    # this or another worker's download; claim it if not
+                    with self._lock:
+                        if filename in self._existing:
+                            logger.info(f"File already exists: {filename}")
+                            continue
+                        self._existing.add(filename)
+                    jobs.append((pdf_url, filename))
             
-            logger.info(f"Downloaded {downloaded_count} files for COA{coa_num:02d} on {date_str}")
-            self.log_scrape_result(coa_num, date, len(criminal_cases), downloaded_count, case_numbers, "completed")
-            self.mark_combination_completed(coa_num, date)
-            self.status['total_requests'] += 1
-            
-            return downloaded_count
+            # Queue the downloads; the shared token bucket keeps the
+            # overall request rate polite
+            downloads = [(filename, download_pool.submit(self._download_job, (pdf_url, filename)))
+                         for pdf_url, filename in jobs]
+            return coa_num, date, criminal_cases, case_numbers, downloads
             
         except Exception as e:
             logger.error(f"Error scraping COA{coa_num:02d} on {date_str}: {e}")
             self.log_scrape_result(coa_num, date, 0, 0, [], f"error: {str(e)}")
+            return None
+    
+    def _finish_court_date(self, started):
+        """Wait for a docket's queued downloads and record the docket as completed"""
+        if started is None:
             return 0
+        coa_num, date, criminal_cases, case_numbers, downloads = started
+        date_str = date.strftime("%Y-%m-%d")
+        
+        downloaded_count = 0
+        for filename, future in downloads:
+            try:
+                ok = future.result()
+            except Exception as e:
+                logger.error(f"Error downloading {filename}: {e}")
+                ok = False
+            if ok:
+                downloaded_count += 1
+            else:
+                # Release the claim so a later pass retries it
+                with self._lock:
+                    self._existing.discard(filename)
+        with self._lock:
+            self.status['total_files_downloaded'] += downloaded_count
+        
+        logger.info(f"Downloaded {downloaded_count} files for COA{coa_num:02d} on {date_str}")
+        self.log_scrape_result(coa_num, date, len(criminal_cases), downloaded_count, case_numbers, "completed")
+        self.mark_combination_completed(coa_num, date)
+        with self._lock:
+            self.status['total_requests'] += 1
+        
+        return downloaded_count
     
     def run_development_test(self):
         """Run development test for COA01-02 for January 2025"""
@@ -375,13 +659,12 @@ class COAOpinionScraper:
         
         total_downloaded = 0
         
-        for date in self.generate_date_range(start_date, end_date):
-            for coa_num in courts:
-                count = self.scrape_court_date(coa_num, date)
-                total_downloaded += count
-                
-                # Small delay between requests
-                time.sleep(2)
+        combinations = ((coa_num, date)
+                        for date in self.generate_date_range(start_date, end_date)
+                        for coa_num in courts)
+        for coa_num, date, count in self.scrape_combinations(combinations):
+            total_downloaded += count
+        self.flush()
         
         logger.info(f"Development test completed. Total files downloaded: {total_downloaded}")
         return total_downloaded
@@ -399,7 +682,7 @@ class COAOpinionScraper:
         
         # Calculate date statistics
         total_days = (end_date - start_date).days + 1
-        weekdays_only = sum(1 for _ in self.generate_date_range(start_date, end_date, skip_weekends=True))
+        weekdays_only = self.count_weekdays(start_date, end_date)
         weekend_days = total_days - weekdays_only
         time_saved_pct = (weekend_days / total_days) * 100
         
@@ -433,35 +716,49 @@ class COAOpinionScraper:
         total_downloaded = self.status.get('total_files_downloaded', 0)
         total_requests = self.status.get('total_requests', 0)
         
-        # Start from resume point
-        started_processing = False
+        # Start from resume point: the resume date's remaining courts, then
+        # every court for each later date
+        combinations = [(coa_num, date)
+                        for date in self.generate_date_range(resume_date, end_date)
+                        for coa_num in courts
+                        if date > resume_date or coa_num >= resume_court]
         
-        for date in self.generate_date_range(start_date, end_date):
-            for coa_num in courts:
-                # Skip until we reach resume point
-                if not started_processing:
-                    if date < resume_date or (date == resume_date and coa_num < resume_court):
-                        continue
-                    started_processing = True
-                count = self.scrape_court_date(coa_num, date)
-                total_downloaded += count
-                total_requests += 1
-                
-                # Small delay between requests
-                time.sleep(2)
-                
-                # Progress logging every 50 requests
-                if total_requests % 50 == 0:
-                    logger.info(f"Progress: {total_requests} requests completed, {total_downloaded} files downloaded so far")
-                    logger.info(f"Currently processing: {date.strftime('%Y-%m-%d')} COA{coa_num:02d}")
+        for coa_num, date, count in self.scrape_combinations(combinations):
+            total_downloaded += count
+            total_requests += 1
+            
+            # Progress logging every 50 requests
+            if total_requests % 50 == 0:
+                logger.info(f"Progress: {total_requests} requests completed, {total_downloaded} files downloaded so far")
+                logger.info(f"Currently processing: {date.strftime('%Y-%m-%d')} COA{coa_num:02d}")
+        self.flush()
         
         logger.info(f"Full production run completed!")
         logger.info(f"Total requests: {total_requests}")
         logger.info(f"Total files downloaded: {total_downloaded}")
         return total_downloaded
 
+def _positive_rate(value):
+    """argparse type for --rps: a finite number of requests per second above zero"""
+    import argparse
+    
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {value!r}")
+    if not 0 < rate < float('inf'):
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return rate
+
 def main():
-    scraper = COAOpinionScraper()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Scrape Texas Courts of Appeals criminal opinions")
+    parser.add_argument("--rps", type=_positive_rate, default=4,
+                        help="Maximum requests per second across all workers (default 4)")
+    args = parser.parse_args()
+    
+    scraper = COAOpinionScraper(request_rate=args.rps, request_burst=max(1, int(args.rps * 2)))
     
     # Run full production instead of development test
     scraper.run_full_production()